@@ -0,0 +1,296 @@
+# Asyncio fetch backend for SwimCloudScraper
+#
+# The blocking backend fetches the team page, every meet page and every event
+# page one after another with a fixed sleep before each. This backend fetches
+# them concurrently through one pooled aiohttp session, capped by a per-host
+# concurrency limit and a per-host request rate, and hands the HTML to the
+# scraper's own _parse_* methods so results have exactly the same shapes.
+#
+# With the scraper's adaptive rate control, request starts are paced by its
+# RateController (and 429/5xx answers fed back to it) instead of the fixed
+# requests_per_second cap; the per-host concurrency limit applies either way.
+#
+# Stage timings go to the scraper's metrics. Requests overlap here, so they are
+# recorded with observe() (fetch: request start to body read, sleep: time held back
+# by the rate cap) and per-stage seconds can add up to more than the wall time.
+
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from rate_control import RETRY_STATUSES
+
+
+class HostLimiter:
+    """Caps concurrent requests and request starts per second for a single host."""
+
+    def __init__(self, max_concurrency, requests_per_second):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.min_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait_turn(self):
+        """Sleep until this host's rate cap allows another request to start."""
+        async with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.min_interval
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+
+class AsyncSwimCloudFetcher:
+    def __init__(self, scraper, max_per_host=4, requests_per_second=None, timeout=30):
+        """
+        Initialize the async backend for a scraper.
+
+        Args:
+            scraper: The SwimCloudScraper whose headers and _parse_* methods are used
+            max_per_host: Maximum requests in flight to one host at a time
+            requests_per_second: Maximum request starts per second per host (default 1 / scraper.delay;
+                unused when the scraper has adaptive rate control)
+            timeout: Total seconds allowed for one request
+        """
+        self.scraper = scraper
+        self.max_per_host = max_per_host
+        if requests_per_second is None:
+            requests_per_second = 1.0 / scraper.delay if scraper.delay else None
+        self.requests_per_second = requests_per_second
+        self.timeout = timeout
+        self._limiters = {}
+        self._http = None
+
+    def _limiter(self, url):
+        host = urlsplit(url).netloc
+        if host not in self._limiters:
+            self._limiters[host] = HostLimiter(self.max_per_host, self.requests_per_second)
+        return self._limiters[host]
+
+    async def _get(self, url):
+        """
+        GET a page, served from (or recorded into) the scraper's record/replay archive if it has one.
+
+        Returns:
+            Response body as bytes
+        """
+        archive = self.scraper.archive
+        if archive and archive.replaying:
+            with self.scraper.metrics.stage('fetch', url):
+                return archive.read(url, 'http')
+
+        for attempt in range(self.scraper.MAX_RETRIES + 1):
+            try:
+                body = await self._get_live(url)
+                break
+            except aiohttp.ClientResponseError as e:
+                if (not self.scraper.rate_controller or e.status not in RETRY_STATUSES
+                        or attempt == self.scraper.MAX_RETRIES):
+                    raise
+                print(f"  HTTP {e.status} for {url}, retrying ({attempt + 1}/{self.scraper.MAX_RETRIES})")
+        if archive:
+            archive.write(url, body, 'http')
+        return body
+
+    async def _get_live(self, url):
+        """GET a page under the host's concurrency and rate caps, through the scraper's page cache if it has one."""
+        page_cache = self.scraper.page_cache
+        cached = page_cache.get(url, 'http', allow_stale=True) if page_cache else None
+        if cached and cached.fresh:
+            return cached.body
+
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        metrics = self.scraper.metrics
+        rate_controller = self.scraper.rate_controller
+        host = urlsplit(url).netloc
+        limiter = self._limiter(url)
+        async with limiter.semaphore:
+            waited_from = time.perf_counter()
+            if rate_controller:
+                await rate_controller.wait_async(url)
+            else:
+                await limiter.wait_turn()
+            started = time.perf_counter()
+            metrics.observe('sleep', host, started - waited_from)
+            try:
+                async with self._http.get(url, headers=headers) as response:
+                    if rate_controller:
+                        rate_controller.feedback(url, response.status, time.perf_counter() - started,
+                                                 response.headers)
+                    if cached and response.status == 304:
+                        page_cache.touch(url, 'http')
+                        metrics.observe('fetch', host, time.perf_counter() - started)
+                        return cached.body
+                    response.raise_for_status()
+                    body = await response.read()
+            except Exception:
+                metrics.observe('fetch', host, time.perf_counter() - started, error=True)
+                raise
+            metrics.observe('fetch', host, time.perf_counter() - started)
+
+        if page_cache:
+            page_cache.put(url, body, 'http',
+                           etag=response.headers.get('ETag'),
+                           last_modified=response.headers.get('Last-Modified'))
+        return body
+
+    async def fetch_team(self, team_id, max_meets=None):
+        """
+        Fetch the team results page once and read both the team name and meet list from it.
+
+        Returns:
+            Tuple of (team_name, list of meet URLs)
+        """
+        url = self.scraper._team_results_url(team_id)
+        print(f"Fetching team results from: {url}")
+        try:
+            html = await self._get(url)
+        except Exception as e:
+            print(f"Error fetching team results: {e}")
+            return f"Team_{team_id}", []
+
+        with self.scraper.metrics.stage('parse', url):
+            team_name = self.scraper._parse_team_name(html, team_id)
+            meet_urls = self.scraper._parse_team_meets(html, team_id, max_meets)
+        return team_name, meet_urls
+
+    async def _team_page_meets(self, team_id, season, page):
+        """Meet URLs on one page of a team's results for a season (None if the page can't be read)."""
+        url = self.scraper._team_results_url(team_id, page, season)
+        try:
+            html = await self._get(url)
+        except Exception as e:
+            print(f"Error fetching team results page {url}: {e}")
+            return None
+        with self.scraper.metrics.stage('parse', url):
+            meet_urls = self.scraper._page_meet_links(html)
+        self.scraper._note_meet_seasons(meet_urls, season)
+        return meet_urls
+
+    async def fetch_team_pages(self, team_id, seasons, max_meets=None, max_pages=50):
+        """
+        Walk every results page of a team for each season (backfill), max_per_host pages at a time.
+
+        A season ends at its first page with no meets not already seen (past the last page SwimCloud
+        serves an empty list); the walk ends as soon as max_meets meets are found. A page that can't
+        be read is tried once more, then reported and skipped; it does not end the season (unless
+        every page of a window fails, which abandons the rest of that season and reports it).
+
+        Args:
+            team_id: The team ID
+            seasons: SwimCloud season ids, walked in the order given
+            max_meets: Stop after this many meets (None for all)
+            max_pages: Most pages read per season
+
+        Returns:
+            Deduplicated list of meet URLs, in season then page order
+        """
+        meet_urls = []
+        seen = set()
+        unread_pages = []
+        for season in seasons:
+            print(f"Fetching team results for season {season}")
+            page = 1
+            season_done = False
+            while not season_done and page <= max_pages:
+                window = range(page, min(page + self.max_per_host, max_pages + 1))
+                pages = await asyncio.gather(*[self._team_page_meets(team_id, season, p) for p in window])
+                if all(page_meets is None for page_meets in pages):
+                    print(f"  ⚠️  Season {season} pages {window.start}-{window.stop - 1} could not be read, "
+                          f"skipping the rest of the season")
+                    unread_pages.extend((season, p) for p in window)
+                    break
+                for p, page_meets in zip(window, pages):
+                    if page_meets is None:
+                        page_meets = await self._team_page_meets(team_id, season, p)
+                    if page_meets is None:
+                        print(f"  ⚠️  Season {season} page {p} could not be read, skipping it")
+                        unread_pages.append((season, p))
+                        continue
+                    new_meets = [meet_url for meet_url in page_meets if meet_url not in seen]
+                    if not new_meets:
+                        season_done = True
+                        break
+                    seen.update(new_meets)
+                    meet_urls.extend(new_meets)
+                    if max_meets and len(meet_urls) >= max_meets:
+                        return meet_urls[:max_meets]
+                page += len(window)
+        if unread_pages:
+            print(f"⚠️  {len(unread_pages)} team results page(s) could not be read; their meets are missing: "
+                  + ', '.join(f'season {season} page {p}' for season, p in unread_pages))
+        return meet_urls
+
+    async def fetch_event(self, event_url, event_name):
+        """Async version of SwimCloudScraper.get_event_results (same dictionary shape)."""
+        print(f"  Fetching results for: {event_name}")
+        try:
+            html = await self._get(event_url)
+            with self.scraper.metrics.stage('parse', event_url):
+                return self.scraper._parse_event_results(html, event_name)
+        except Exception as e:
+            print(f"  Error fetching event results: {e}")
+            return {'event_name': event_name, 'is_relay': False, 'results': [], 'error': str(e)}
+
+    async def fetch_meet(self, meet_url):
+        """
+        Fetch a meet page, then all of its event pages concurrently.
+
+        Returns:
+            Tuple of (meet_name, event_links, dict of event_url -> event results dictionary)
+        """
+        print(f"\nFetching events from meet: {meet_url}")
+        try:
+            html = await self._get(meet_url)
+        except Exception as e:
+            print(f"Error fetching meet events: {e}")
+            return "Unknown Meet", [], {}
+
+        with self.scraper.metrics.stage('parse', meet_url):
+            meet_name, event_links = self.scraper._parse_meet_events(html, meet_url)
+        event_data = await asyncio.gather(*[
+            self.fetch_event(event_url, event_name)
+            for event_url, event_number, event_name in event_links
+        ])
+        event_results = {event_url: data for (event_url, _, _), data in zip(event_links, event_data)}
+        return meet_name, event_links, event_results
+
+    async def fetch_meets(self, meet_urls):
+        """
+        Fetch every meet (and every event in each meet) concurrently.
+
+        Returns:
+            Dictionary of meet_url -> (meet_name, event_links, event_results)
+        """
+        meets = await asyncio.gather(*[self.fetch_meet(meet_url) for meet_url in meet_urls])
+        return dict(zip(meet_urls, meets))
+
+    async def _run(self, coroutine_factory):
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_per_host)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.scraper.session.headers)) as http:
+            self._http = http
+            self._limiters = {}  # asyncio primitives are tied to this run's event loop
+            try:
+                return await coroutine_factory()
+            finally:
+                self._http = None
+
+    def run(self, coroutine_factory):
+        """
+        Run one of the fetch_* coroutines to completion from blocking code.
+
+        Args:
+            coroutine_factory: Zero-argument callable returning the coroutine,
+                e.g. lambda: fetcher.fetch_meets(meet_urls)
+        """
+        return asyncio.run(self._run(coroutine_factory))
@@ -0,0 +1,58 @@
+# Benchmark: stock headless Chrome vs the lean ChromeProfile
+#
+# Usage:
+#   python benchmarks/bench_chrome_profile.py https://www.swimcloud.com/times/148087775/ [more URLs...]
+#
+# Loads every URL in a stock headless Chrome and in a lean one (fresh profile, then the
+# same profile again to show the warm disk cache), each waiting for the same readiness
+# condition, and reports per page: bytes transferred (Resource Timing), load-to-ready
+# latency, and the browser's memory (RSS of chromedriver + Chrome processes, needs psutil).
+# Needs Chrome and network access.
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from browser_pool import BrowserWorker, ChromeProfile, default_chrome_options, page_bytes
+from page_ready import load_page, or_settled, css_present
+
+
+def run(label, worker, urls):
+    latencies, sizes = [], []
+    for url in urls:
+        start = time.perf_counter()
+        load_page(worker.driver, url, or_settled(css_present('table.c-table-clean, pre'), 1.0), timeout=20)
+        latencies.append(time.perf_counter() - start)
+        sizes.append(page_bytes(worker.driver))
+    rss = worker.rss_mb()
+    print(f"{label:12} {statistics.median(sizes) / 1024:9.0f} KB/page  {statistics.median(latencies):6.2f}s median  "
+          f"{max(latencies):6.2f}s max  {f'{rss:.0f} MB' if rss else 'n/a':>8} RSS")
+
+
+if __name__ == "__main__":
+    urls = sys.argv[1:]
+    if not urls:
+        sys.exit("Pass one or more page URLs to load")
+
+    stock = BrowserWorker(0, default_chrome_options)
+    try:
+        run('stock', stock, urls)
+    finally:
+        stock.quit()
+
+    profile_root = tempfile.mkdtemp(prefix='swim_chrome_')
+    try:
+        profile = ChromeProfile(user_data_dir=profile_root)
+        for label in ('lean (cold)', 'lean (warm)'):
+            lean = BrowserWorker(0, None, profile)
+            try:
+                run(label, lean, urls)
+            finally:
+                lean.quit()
+    finally:
+        shutil.rmtree(profile_root, ignore_errors=True)
@@ -0,0 +1,87 @@
+# Benchmark: URL dedup with a list (the old `url not in urls`) vs CrawlFrontier's hash set and Bloom filter
+#
+# Usage:
+#   python benchmarks/bench_frontier.py
+#   python benchmarks/bench_frontier.py --urls 2000000 --list-urls 20000
+#
+# Claims --urls synthetic /times/ URLs (each one twice, so half are duplicates) and reports
+# claims/s and the Python memory held per URL (tracemalloc). The list is only run up to
+# --list-urls since it is quadratic. Then saves the hash-set frontier to a temporary file,
+# restores it, and checks that no URL is handed out again.
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawl_frontier import CrawlFrontier
+
+
+def urls(count):
+    for n in range(count):
+        url = f"https://www.swimcloud.com/times/{148000000 + n}/"
+        yield url
+        yield url
+
+
+def run(label, make_claim, count, finish=None):
+    tracemalloc.start()
+    claim = make_claim()
+    start = time.perf_counter()
+    claimed = sum(1 for url in urls(count) if claim(url))
+    elapsed = time.perf_counter() - start
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if finish:
+        finish()
+    print(f"{label:22} {count:9d} URLs  {claimed:9d} claimed  {2 * count / elapsed:10.0f} claims/s  "
+          f"{held / count:6.1f} bytes/URL")
+
+
+def list_claim():
+    seen = []
+
+    def claim(url):
+        if url in seen:
+            return False
+        seen.append(url)
+        return True
+    return claim
+
+
+def frontier_claim(frontier):
+    def claim(url):
+        if not frontier.claim(url, 'time'):
+            return False
+        frontier.done(url)
+        return True
+    return claim
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='List vs hash-set vs Bloom filter URL dedup')
+    parser.add_argument('--urls', type=int, default=500000)
+    parser.add_argument('--list-urls', type=int, default=10000, help='URLs for the quadratic list run')
+    args = parser.parse_args()
+
+    run('list (old)', list_claim, args.list_urls)
+    run('frontier, hash set', lambda: frontier_claim(CrawlFrontier()), args.urls)
+    run('frontier, Bloom 0.1%', lambda: frontier_claim(CrawlFrontier(bloom_capacity=args.urls)), args.urls)
+
+    directory = tempfile.mkdtemp(prefix='swim_frontier_')
+    try:
+        path = os.path.join(directory, 'frontier.sqlite')
+        frontier = CrawlFrontier(path)
+        run('frontier, saved', lambda: frontier_claim(frontier), args.urls, frontier.close)
+        start = time.perf_counter()
+        restored = CrawlFrontier(path)
+        print(f"restored in {time.perf_counter() - start:.2f}s ({os.path.getsize(path) / 1024 / 1024:.1f} MB file): "
+              f"{sum(1 for url in urls(args.urls) if restored.claim(url, 'time'))} URLs handed out again")
+        restored.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
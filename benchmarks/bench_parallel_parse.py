@@ -0,0 +1,63 @@
+# Benchmark: HY-TEK event parsing, serial vs ParallelParser process pool
+#
+# Usage:
+#   python benchmarks/bench_parallel_parse.py                          # 200 synthetic 1650 free pages
+#   python benchmarks/bench_parallel_parse.py --archive ncaa_2025.swimarchive
+#
+# Reports pages/s of the parse stage, serial and with 1..cpu_count worker processes, checks the
+# pooled output matches the serial output, and compares the pickled size of a columnar
+# batch with the same rows as a list of dicts.
+
+import contextlib
+import io
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from bench_split_tokenizer import synthetic_1650_page
+from parallel_parse import ParallelParser, from_columns, parse_chunk, texts_from_archive, to_columns
+from swim_meet_data import SwimMeetScraper
+
+
+def load_items(args):
+    if args and args[0] == '--archive':
+        return list(texts_from_archive(args[1]))
+    page = synthetic_1650_page()
+    return [(f'https://example.invalid/meet/{n:03d}F011.htm', page, 'Benchmark Meet', None) for n in range(200)]
+
+
+def serial(items):
+    scraper = SwimMeetScraper()
+    with contextlib.redirect_stdout(io.StringIO()):
+        chunk = parse_chunk(items, scraper)
+    return from_columns(chunk.batches['individual']), chunk
+
+
+if __name__ == "__main__":
+    items = load_items(sys.argv[1:])
+    print(f"{len(items)} event pages, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    expected, chunk = serial(items)
+    serial_time = time.perf_counter() - start
+    print(f"serial:      {len(items) / serial_time:8.1f} pages/s")
+
+    rows = from_columns(chunk.batches['individual']).to_dict('records')
+    print(f"IPC size:    list of dicts {len(pickle.dumps(rows)) / 1e6:.2f} MB, "
+          f"columnar {len(pickle.dumps(to_columns(rows))) / 1e6:.2f} MB")
+
+    # Parse stage only (chunks back in the parent); the <col>_cs conversion is the same either way
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        parser = ParallelParser(workers=workers)
+        start = time.perf_counter()
+        chunks = list(parser.parse(items))
+        elapsed = time.perf_counter() - start
+        pooled = pd.concat([from_columns(c.batches['individual']) for c in chunks], ignore_index=True)
+        same = pooled.equals(expected)
+        print(f"{workers:2d} workers: {len(items) / elapsed:8.1f} pages/s  "
+              f"(x{serial_time / elapsed:.2f} vs serial, output {'matches' if same else 'DIFFERS'})")
@@ -0,0 +1,202 @@
+# Benchmark: every results parser over the saved fixture pages in benchmarks/fixtures
+#
+# Usage:
+#   python benchmarks/bench_parsers.py                 # run, compare with the saved baselines
+#   python benchmarks/bench_parsers.py --save          # run and save the results as the new baselines
+#   python benchmarks/bench_parsers.py --check         # exit 1 if any parser regressed
+#   python benchmarks/bench_parsers.py --repeat 50 --tolerance 0.2
+#
+# For each parser it reports records/s (from the fastest of --repeat parses, the figure
+# least disturbed by other load on the machine), per-event latency (median and p95 of one
+# parse of the page) and peak Python memory (tracemalloc) during one parse. Baselines live in
+# benchmarks/baselines/parsers.json; a parser counts as regressed when its records/s
+# drops, or its peak memory grows, by more than --tolerance (default 25%).
+#
+# SwimCloud team/meet/event pages run once per parser backend: BeautifulSoup (the plain
+# case name) and lxml (the same name + ' (lxml)'). The two must return the same records,
+# or the run fails; the lxml speedup per page is printed at the end.
+#
+# The fixtures are rebuilt by benchmarks/fixtures/make_fixtures.py.
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from swim_data_v11 import SwimCloudScraper
+from swim_meet_data import SwimMeetScraper
+
+FIXTURES = os.path.join(HERE, 'fixtures')
+BASELINES = os.path.join(HERE, 'baselines', 'parsers.json')
+NCAA_URL = 'https://swimmeetresults.tech/NCAA-Division-I-Men-2025/'
+MEET_NAME = 'NCAA Division I Championship Meet'
+# Suffix of the lxml-backend case of each SwimCloud page
+LXML = ' (lxml)'
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def parser_cases():
+    """
+    (name, parse) pairs; parse() parses one fixture page and returns its records.
+
+    Page text is pulled out of the HY-TEK <pre> once, up front, so the HY-TEK cases time
+    the parsers only.
+    """
+    meet = SwimMeetScraper()
+    swimcloud = SwimCloudScraper(parser='bs4')
+    swimcloud_lxml = SwimCloudScraper(parser='lxml')
+    cases = []
+
+    def swimcloud_page(name, parse):
+        cases.append((name, lambda: parse(swimcloud)))
+        cases.append((name + LXML, lambda: parse(swimcloud_lxml)))
+
+    def hytek(name, page, parse, event_number, event_name, **kwargs):
+        page_text = meet._pre_text(fixture(page))
+        meet_url = NCAA_URL + page.split('_')[1] + '.htm'
+        cases.append((name, lambda: parse(page_text, MEET_NAME, meet_url, event_number, event_name, **kwargs)))
+
+    hytek('hytek 200 medley relay', 'hytek_250326F001_relay.htm', meet._parse_relay_results,
+          1, 'Men 200 Yard Medley Relay')
+    hytek('hytek 400 free relay', 'hytek_250326F021_relay.htm', meet._parse_relay_results,
+          21, 'Men 400 Yard Freestyle Relay')
+    hytek('hytek 1650 free', 'hytek_250326F015_1650_free.htm', meet._parse_individual_results,
+          15, 'Men 1650 Yard Freestyle')
+    hytek('hytek 1650 free (long splits)', 'hytek_250326F015_1650_free.htm', meet._parse_individual_results,
+          15, 'Men 1650 Yard Freestyle', split_rows=[])
+    hytek('hytek 1m diving', 'hytek_250326P006_diving.htm', meet._parse_diving_results,
+          6, 'Men 1 mtr Diving')
+
+    event_text = meet._pre_text(fixture('hytek_250326F015_1650_free.htm'))
+    cases.append(('hytek event header', lambda: [meet._extract_event_info(event_text)]))
+
+    meet_html = fixture('swimcloud_meet_307921.htm')
+    swimcloud_page('swimcloud meet page',
+                   lambda s: s._parse_meet_events(meet_html, 'https://www.swimcloud.com/results/307921/')[1])
+    relay_html = fixture('swimcloud_meet_307921_event_1.htm')
+    swimcloud_page('swimcloud relay event page',
+                   lambda s: s._parse_event_results(relay_html, '200 Medley Relay Men')['results'])
+    individual_html = fixture('swimcloud_meet_307921_event_2.htm')
+    swimcloud_page('swimcloud event page',
+                   lambda s: s._parse_event_results(individual_html, '200 Free Men')['results'])
+    large_html = fixture('swimcloud_event_large.htm')
+    swimcloud_page('swimcloud invitational event page',
+                   lambda s: s._parse_event_results(large_html, 'Federation Individual Men')['results'])
+    for page in ('swimcloud_time_148087775.htm', 'swimcloud_time_148087850.htm'):
+        html = fixture(page)
+        cases.append((f'swimcloud times page {page[15:-4]}', lambda html=html: swimcloud._parse_split_times(html)))
+    return cases
+
+
+def measure(parse, repeat):
+    """
+    Returns:
+        dict with records, records_per_s, median_ms, p95_ms, peak_kb
+    """
+    latencies = []
+    records = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        parse()  # warm-up: regex compilation, lazy imports
+        for _ in range(repeat):
+            start = time.perf_counter()
+            records = len(parse())
+            latencies.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        parse()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'records': records,
+        'records_per_s': round(records / latencies[0], 1),
+        'median_ms': round(statistics.median(latencies) * 1000, 3),
+        'p95_ms': round(latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] * 1000, 3),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def backend_mismatches(cases):
+    """SwimCloud pages whose lxml records differ from the BeautifulSoup ones."""
+    parses = dict(cases)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [name for name in parses if name + LXML in parses and parses[name]() != parses[name + LXML]()]
+
+
+def regressions(result, baseline, tolerance):
+    """What got worse than the baseline by more than tolerance."""
+    found = []
+    if result['records'] != baseline['records']:
+        found.append(f"records {baseline['records']} -> {result['records']}")
+    if result['records_per_s'] < baseline['records_per_s'] * (1 - tolerance):
+        found.append(f"records/s {baseline['records_per_s']:.0f} -> {result['records_per_s']:.0f}")
+    if result['peak_kb'] > baseline['peak_kb'] * (1 + tolerance):
+        found.append(f"peak {baseline['peak_kb']:.0f} KB -> {result['peak_kb']:.0f} KB")
+    return found
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark the results parsers over the saved fixture pages')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed parses per fixture (default 20)')
+    parser.add_argument('--save', action='store_true', help='Save this run as the new baselines')
+    parser.add_argument('--check', action='store_true', help='Exit 1 if any parser regressed')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown/growth (default 0.25)')
+    args = parser.parse_args()
+
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES, encoding='utf-8') as f:
+            baselines = json.load(f).get('parsers', {})
+
+    cases = parser_cases()
+    results = {}
+    failed = []
+    print(f"{'parser':42} {'records':>7} {'records/s':>10} {'median ms':>10} {'p95 ms':>8} {'peak KB':>8}")
+    for name, parse in cases:
+        result = results[name] = measure(parse, args.repeat)
+        line = (f"{name:42} {result['records']:7d} {result['records_per_s']:10.0f} "
+                f"{result['median_ms']:10.3f} {result['p95_ms']:8.3f} {result['peak_kb']:8.1f}")
+        if name in baselines and not args.save:
+            worse = regressions(result, baselines[name], args.tolerance)
+            if worse:
+                failed.append(name)
+                line += '  REGRESSED: ' + ', '.join(worse)
+            else:
+                line += f"  (x{result['records_per_s'] / baselines[name]['records_per_s']:.2f} vs baseline)"
+        print(line)
+
+    speedups = [(name, results[name + LXML]['records_per_s'] / results[name]['records_per_s'])
+                for name in results if name + LXML in results]
+    if speedups:
+        print('lxml backend: ' + ', '.join(f"{name} x{speedup:.1f}" for name, speedup in speedups))
+    mismatched = backend_mismatches(cases)
+    if mismatched:
+        print(f"lxml and BeautifulSoup records differ on: {', '.join(mismatched)}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(BASELINES), exist_ok=True)
+        with open(BASELINES, 'w', encoding='utf-8') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                       'repeat': args.repeat, 'parsers': results}, f, indent=2)
+            f.write('\n')
+        print(f"Saved baselines to {os.path.relpath(BASELINES)}")
+    elif failed:
+        print(f"{len(failed)} parser(s) regressed beyond {args.tolerance:.0%}")
+        if args.check:
+            sys.exit(1)
+    if mismatched:
+        sys.exit(1)
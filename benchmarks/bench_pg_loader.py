@@ -0,0 +1,96 @@
+# Benchmark: loading "AllResults" row by row (DatabaseTest.py style) vs COPY + upsert (pg_loader.py)
+#
+# Usage (against a local/scratch Postgres; settings from DATABASE_URL or PGHOST/PGUSER/...):
+#   DATABASE_URL=postgresql://localhost/swim python benchmarks/bench_pg_loader.py [rows]
+#
+# Rows use a scratch meet_url and are deleted afterwards.
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import psycopg2
+
+from hytek_splits import format_centiseconds
+from pg_loader import ResultsLoader, connection_dsn, stage_frame
+
+BENCH_MEET_URL = 'https://example.invalid/bench_pg_loader/index.htm'
+
+
+def synthetic_relay_frame(rows):
+    """Relay rows shaped like SwimMeetScraper's 'Relay Results' sheet, 4 legs per team."""
+    data = []
+    for i in range(rows):
+        team, order = divmod(i, 4)
+        leg_centis = 2000 + (team * 7 + order * 13) % 300
+        data.append({
+            'meet_name': 'Loader Benchmark',
+            'meet_url': BENCH_MEET_URL,
+            'event_number': str(1 + team // 16),
+            'event_name': 'Men 200 Yard Medley Relay',
+            'is_relay': True,
+            'Team Name': f'Team {team}',
+            'Name': f'Swimmer{order}, Team {team}',
+            'Order': order + 1,
+            'Split': format_centiseconds(leg_centis // 2),
+            'Leg': format_centiseconds(leg_centis),
+            'Cumulative': format_centiseconds(leg_centis * (order + 1)),
+        })
+    return pd.DataFrame(data)
+
+
+def row_by_row(conn, stage):
+    """One INSERT per row, as DatabaseTest.py does."""
+    with conn.cursor() as cursor:
+        for row in stage.itertuples(index=False):
+            cursor.execute(
+                'INSERT INTO "AllResults" (meet_name, meet_url, event_number, event_name, is_relay, '
+                '"Team Name", "Name", "Order", "Split", "Leg", "Cumulative") '
+                'VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s / 100.0, %s / 100.0, make_interval(secs => %s / 100.0)) '
+                'RETURNING id',
+                (row.meet_name, row.meet_url, int(row.event_number), row.event_name, row.is_relay,
+                 row.team_name, row.name, int(row.order), int(row.split_cs), int(row.leg_cs), int(row.cumulative_cs)))
+            cursor.fetchone()
+            conn.commit()
+
+
+def delete_bench_rows(conn):
+    with conn.cursor() as cursor:
+        cursor.execute('DELETE FROM "AllResults" WHERE meet_url = %s', (BENCH_MEET_URL,))
+    conn.commit()
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    df = synthetic_relay_frame(rows)
+    stage = stage_frame(df, 'relay')
+
+    conn = psycopg2.connect(connection_dsn())
+    with ResultsLoader() as loader:
+        try:
+            delete_bench_rows(conn)
+
+            sample = stage.head(min(rows, 1000))
+            start = time.perf_counter()
+            row_by_row(conn, sample)
+            single = time.perf_counter() - start
+            delete_bench_rows(conn)
+
+            start = time.perf_counter()
+            loader.load_stage(stage)
+            bulk = time.perf_counter() - start
+
+            # Second load of the same rows exercises the ON CONFLICT update path
+            start = time.perf_counter()
+            loader.load_stage(stage)
+            upsert = time.perf_counter() - start
+
+            print(f"row-by-row INSERT:  {len(sample) / single:10.0f} rows/s  ({len(sample)} rows)")
+            print(f"COPY + upsert:      {rows / bulk:10.0f} rows/s  ({rows} rows, new)")
+            print(f"COPY + upsert:      {rows / upsert:10.0f} rows/s  ({rows} rows, all conflicts)")
+        finally:
+            delete_bench_rows(conn)
+            conn.close()
@@ -0,0 +1,126 @@
+# Benchmark: fixed politeness sleeps vs the adaptive RateController, against a local fake server
+#
+# Usage:
+#   python benchmarks/bench_rate_control.py
+#   python benchmarks/bench_rate_control.py --pages 40 --server-rate 4 --max-rate 8 --parse 0.1
+#
+# The fake server answers /page/<n> in --latency seconds but only allows --server-rate
+# requests per second: past that it sends 429 with Retry-After: 1. Its robots.txt
+# disallows /private/. Both runs fetch the same pages through SwimMeetScraper._get_html
+# and spend --parse seconds "parsing" each one.
+#
+# Reports wall time, 429s seen and pages/s for each run, checks the adaptive run
+# fetched every page and that a Disallow'd URL raises RobotsDisallowed.
+
+import argparse
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rate_control import RobotsDisallowed
+from swim_meet_data import SwimMeetScraper
+
+
+class FakeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, rate, latency):
+        super().__init__(('127.0.0.1', 0), FakeHandler)
+        self.min_interval = 1.0 / rate
+        self.latency = latency
+        self.last_served = 0.0
+        self.served = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        if self.path == '/robots.txt':
+            return self._send(200, b"User-agent: *\nDisallow: /private/\n", 'text/plain')
+
+        with server.lock:
+            now = time.monotonic()
+            too_soon = now - server.last_served < server.min_interval
+            if too_soon:
+                server.throttled += 1
+            else:
+                server.last_served = now
+                server.served += 1
+        if too_soon:
+            return self._send(429, b"Too Many Requests", 'text/plain', {'Retry-After': '1'})
+
+        time.sleep(server.latency)
+        self._send(200, f"<html><body><pre>{self.path}</pre></body></html>".encode(), 'text/html')
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def crawl(server, scraper, pages, parse_seconds):
+    """Fetch every page once, 'parsing' each; returns (seconds, pages fetched)."""
+    fetched = 0
+    start = time.perf_counter()
+    for n in range(pages):
+        try:
+            scraper._get_html(f"{server.url}/page/{n}")
+            fetched += 1
+        except Exception as e:
+            print(f"  page {n} failed: {e}")
+        time.sleep(parse_seconds)
+    return time.perf_counter() - start, fetched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Fixed sleeps vs adaptive rate control on a local fake server')
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--server-rate', type=float, default=4.0, help='Requests/s the server allows')
+    parser.add_argument('--latency', type=float, default=0.02, help='Server response time (s)')
+    parser.add_argument('--parse', type=float, default=0.1, help='Simulated parse time per page (s)')
+    parser.add_argument('--delay', type=float, default=1.0, help='Fixed-mode delay before each request (s)')
+    parser.add_argument('--max-rate', type=float, default=8.0, help='Adaptive ceiling (requests/s)')
+    args = parser.parse_args()
+
+    server = FakeServer(args.server_rate, args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Fake server at {server.url}: {args.server_rate:g} requests/s allowed, "
+          f"{args.latency * 1000:.0f} ms latency; {args.pages} pages, {args.parse * 1000:.0f} ms parse each")
+
+    results = {}
+    for mode in ('fixed', 'adaptive'):
+        server.throttled = server.served = 0
+        server.last_served = 0.0
+        scraper = SwimMeetScraper(delay=args.delay, rate_control=mode, max_rate=args.max_rate)
+        elapsed, fetched = crawl(server, scraper, args.pages, args.parse)
+        results[mode] = elapsed
+        print(f"{mode:9} {elapsed:7.2f}s  {fetched}/{args.pages} pages  {server.throttled} x 429  "
+              f"{fetched / elapsed:5.2f} pages/s")
+        if scraper.rate_controller:
+            state = scraper.rate_controller.summary()[server.url.split('//')[1]]
+            print(f"          settled at {state['rate']:.2f} requests/s after {state['throttled']} backoffs")
+            try:
+                scraper._get_html(f"{server.url}/private/page")
+                print("          robots.txt Disallow was NOT honoured")
+            except RobotsDisallowed:
+                print("          robots.txt Disallow honoured")
+
+    print(f"adaptive is x{results['fixed'] / results['adaptive']:.1f} faster")
+    server.shutdown()
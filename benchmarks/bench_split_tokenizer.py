@@ -0,0 +1,129 @@
+# Benchmark: HY-TEK individual split parsing, legacy re-search loop vs single-pass tokenizer
+#
+# Usage:
+#   python benchmarks/bench_split_tokenizer.py                      # synthetic 1650 free page
+#   python benchmarks/bench_split_tokenizer.py page1.txt page2.txt  # saved <pre> text of event pages
+#   python benchmarks/bench_split_tokenizer.py --archive ncaa_2025.swimarchive
+#
+# The archive option reads every recorded <pre> text from a record/replay archive
+# (see response_archive.py), e.g. a recorded run of the NCAA 2025 meet.
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hytek_splits import format_centiseconds, tokenize_split_lines, individual_splits
+
+
+def legacy_splits(splits_lines):
+    """The split loop _parse_individual_results used before the tokenizer (kept for comparison)."""
+    splits = []
+    all_splits_text = ' '.join(splits_lines)
+    all_times = re.findall(r'(\d+:\d+\.\d+|\d+\.\d+)', all_splits_text)
+
+    split_num = 1
+    times_idx = 0
+    if times_idx < len(all_times) and float(all_times[times_idx]) < 1.0:
+        times_idx += 1
+
+    while times_idx < len(all_times) and split_num <= 33:
+        current_time = all_times[times_idx]
+        distance = split_num * 50
+        if re.search(re.escape(current_time) + r'\s*\(', all_splits_text):
+            paren_match = re.search(re.escape(current_time) + r'\s*\(([\d:.]+)\)', all_splits_text)
+            if paren_match:
+                split_diff = paren_match.group(1)
+                splits.append((distance, split_diff, current_time))
+                times_idx += 1
+                if times_idx < len(all_times) and all_times[times_idx] == split_diff:
+                    times_idx += 1
+                split_num += 1
+            else:
+                times_idx += 1
+        else:
+            splits.append((distance, current_time, None))
+            times_idx += 1
+            split_num += 1
+    return splits
+
+
+def tokenizer_splits(splits_lines):
+    return individual_splits(tokenize_split_lines(splits_lines))
+
+
+def synthetic_1650_page(swimmers=40, splits=33, per_line=5):
+    """A HY-TEK style 1650 free results page (same layout as the NCAA championship pages)."""
+    lines = ["Event 11  Men 1650 Yard Freestyle", "=" * 80,
+             "    Name                    Yr School                 Seed Time  Finals Time  Points",
+             "=" * 80]
+    for rank in range(1, swimmers + 1):
+        split_centis = [2200 + rank] + [2500 + (rank * 7 + i * 13) % 90 for i in range(splits - 1)]
+        total = sum(split_centis)
+        lines.append(f"  {rank} Swimmer{rank}, Test          JR School {rank}   14:40.00   {format_centiseconds(total)}  20")
+        tokens = ["r:+0.66", format_centiseconds(split_centis[0])]
+        cumulative = split_centis[0]
+        for split in split_centis[1:]:
+            cumulative += split
+            tokens.append(f"{format_centiseconds(cumulative)} ({format_centiseconds(split)})")
+        for start in range(0, len(tokens), per_line):
+            lines.append("     " + "  ".join(tokens[start:start + per_line]))
+        lines.append("")
+    return '\n'.join(lines)
+
+
+def split_blocks(page_text):
+    """Group the split lines under each ranked result line of a page."""
+    blocks = []
+    current = None
+    for line in page_text.split('\n'):
+        stripped = line.strip()
+        if re.match(r'^\d+\s+\S', stripped):
+            current = []
+            blocks.append(current)
+        elif current is not None and stripped and re.search(r'\d+\.\d+', stripped):
+            current.append(stripped)
+        else:
+            current = None
+    return [block for block in blocks if block]
+
+
+def load_pages(args):
+    if not args:
+        return {'synthetic 1650 free': synthetic_1650_page()}
+    if args[0] == '--archive':
+        from response_archive import ResponseArchive
+        archive = ResponseArchive(args[1], 'replay')
+        return {url: archive.read_text(url, 'pre') for url in archive.index.get('pre', {})}
+    pages = {}
+    for path in args:
+        with open(path, encoding='utf-8') as f:
+            pages[path] = f.read()
+    return pages
+
+
+def bench(func, blocks, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for block in blocks:
+            func(block)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    repeat = 20
+    pages = load_pages(sys.argv[1:])
+    blocks = [block for page_text in pages.values() for block in split_blocks(page_text)]
+    split_count = sum(len(tokenizer_splits(block)) for block in blocks)
+    print(f"{len(pages)} page(s), {len(blocks)} results, {split_count} splits, x{repeat}")
+
+    mismatches = sum(1 for block in blocks if legacy_splits(block) != tokenizer_splits(block)[:33])
+    print(f"Results where legacy and tokenizer output differ: {mismatches}")
+
+    legacy_seconds = bench(legacy_splits, blocks, repeat)
+    tokenizer_seconds = bench(tokenizer_splits, blocks, repeat)
+    for label, seconds in (('legacy', legacy_seconds), ('tokenizer', tokenizer_seconds)):
+        print(f"  {label:10s} {seconds * 1000:9.1f} ms  {split_count * repeat / seconds:12,.0f} splits/s")
+    print(f"  speedup    {legacy_seconds / tokenizer_seconds:9.1f}x")
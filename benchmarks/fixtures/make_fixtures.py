@@ -0,0 +1,191 @@
+# Rebuild the parser benchmark fixtures from the results already saved in this repo
+#
+#   python benchmarks/fixtures/make_fixtures.py
+#
+# The HY-TEK pages are laid out the way swimmeetresults.tech prints them, rebuilt from
+# ncaa_meet_results.xlsx (2025 NCAA Division I Men, 250326*.htm). The SwimCloud meet, event
+# and /times/ pages use the markup SwimCloudScraper parses, rebuilt from the NYSPHSAA
+# Federation results in output_stuff/Corning_Painted_Post_High_School_v14.xlsx.
+# swimcloud_event_large.htm stands in for a big invitational event page: every individual
+# swim of that meet in one results table.
+# Values the workbooks never kept (reaction times, seed times, points) are left out.
+
+import html
+import json
+import os
+import re
+import sys
+
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(HERE))
+sys.path.insert(0, ROOT)
+
+from hytek_splits import format_centiseconds
+from swim_times import time_to_centiseconds
+
+NCAA_XLSX = os.path.join(ROOT, 'ncaa_meet_results.xlsx')
+SWIMCLOUD_XLSX = os.path.join(ROOT, 'output_stuff', 'Corning_Painted_Post_High_School_v14.xlsx')
+NCAA_URL = 'https://swimmeetresults.tech/NCAA-Division-I-Men-2025/'
+
+HYTEK_HEADER = [
+    "Licensed to NCAA                       HY-TEK's MEET MANAGER 8.0 - 9:12 PM  3/29/2025  Page 1",
+    "                         NCAA Division I Championship Meet",
+    "                        Federal Way, WA - 3/26/2025 to 3/29/2025",
+    "                                       Results",
+    "",
+]
+
+
+def centis(value):
+    return time_to_centiseconds(str(value))
+
+
+def text(value):
+    """Workbook cell -> printed time ('1:02.48', '20.32')."""
+    if isinstance(value, float):
+        return format_centiseconds(round(value * 100))
+    return str(value)
+
+
+def hytek_page(lines):
+    return '<html><body><pre>\n' + html.escape('\n'.join(HYTEK_HEADER + lines)) + '\n</pre></body></html>\n'
+
+
+def split_lines(tokens, per_line=5):
+    return ['    ' + '  '.join(tokens[start:start + per_line]) for start in range(0, len(tokens), per_line)]
+
+
+def relay_page(df, event_number, event_name):
+    """Relays with two splits per leg (200s: 25s, 400s: 50s)."""
+    lines = [f"Event {event_number}  {event_name}",
+             "=" * 83,
+             "    School                                                Finals Time  Points",
+             "=" * 83,
+             " A - Final"]
+    rank = 0
+    for team, legs in df.groupby('Team Name', sort=False):
+        legs = legs.sort_values('Order')
+        if len(legs) != 4 or legs[['Split', 'Leg', 'Cumulative']].isna().any().any():
+            continue
+        rank += 1
+        finals = text(legs['Cumulative'].iloc[-1])
+        lines.append(f"{rank:>3} {team:<50}{finals:>14}")
+        names = [f"{order}) {name}" for order, name in zip(legs['Order'], legs['Name'])]
+        lines.append(f"     {names[0]:<36}{names[1]}")
+        lines.append(f"     {names[2]:<36}{names[3]}")
+
+        tokens = []
+        leg_start = 0
+        for _, leg in legs.iterrows():
+            first, leg_time, cumulative = centis(text(leg['Split'])), centis(text(leg['Leg'])), centis(text(leg['Cumulative']))
+            if leg['Order'] == 1:
+                tokens.append(format_centiseconds(first))
+            else:
+                tokens.append(f"{format_centiseconds(leg_start + first)} ({format_centiseconds(first)})")
+            tokens.append(f"{format_centiseconds(cumulative)} ({format_centiseconds(leg_time)})")
+            leg_start = cumulative
+        lines.extend(split_lines(tokens))
+    return hytek_page(lines)
+
+
+def individual_page(df, event_number, event_name):
+    lines = [f"Event {event_number}  {event_name}",
+             "=" * 83,
+             "    Name                    Yr School                 Finals Time  Points",
+             "=" * 83]
+    for _, row in df.iterrows():
+        lines.append(f"{row['Rank']:>3} {row['Name']:<23} {row['Year']:<2} {row['School']:<24}{text(row['Finals_Time']):>11}")
+        tokens = []
+        n = 1
+        while f'split_{n}_time' in row and pd.notna(row[f'split_{n}_time']):
+            split_time = text(row[f'split_{n}_time'])
+            cumulative = row[f'split_{n}_cumulative']
+            tokens.append(split_time if pd.isna(cumulative) else f"{text(cumulative)} ({split_time})")
+            n += 1
+        lines.extend(split_lines(tokens, per_line=6))
+        lines.append("")
+    return hytek_page(lines)
+
+
+def diving_page(df, event_number, event_name):
+    lines = [f"Event {event_number}  {event_name}",
+             "=" * 83,
+             "    Name                    Yr School                 Finals Score",
+             "=" * 83,
+             "Preliminaries"]
+    for _, row in df.iterrows():
+        lines.append(f"{row['Rank']:>3} {row['Name']:<23} {row['Year']:<2} {row['School']:<24}{float(row['Score']):>10.2f}")
+    return hytek_page(lines)
+
+
+def swimcloud_meet_page(meet_id, meet_name, events):
+    links = ''.join(
+        f'<li><a href="/results/{meet_id}/event/{number}/" class="c-events__link">'
+        f'<div class="c-events__link-body" title="{html.escape(name)}">{html.escape(name)}</div></a></li>'
+        for number, name in events)
+    return (f'<html><body><h1 class="c-toolbar__title" id="meet-name">{html.escape(meet_name)}</h1>'
+            f'<ul class="c-events">{links}</ul></body></html>\n')
+
+
+def swimcloud_event_page(df, is_relay):
+    rows = []
+    for place, (_, row) in enumerate(df.iterrows(), 1):
+        time_id = re.search(r'/times/(\d+)', row['time_url']).group(1)
+        name = html.escape(str(row['name']))
+        if is_relay:
+            entry = f'<td class="u-nowrap u-text-semi"><a href="/team/{9000 + place}/">{name}</a></td>'
+        else:
+            entry = (f'<td class="u-nowrap u-text-semi"><a href="/swimmer/{5000 + place}/">{name}</a></td>'
+                     f'<td><a href="/team/{9000 + place}/">Team {place}</a></td>')
+        rows.append(f'<tr><td>{place}</td>{entry}'
+                    f'<td><div id="time{time_id}"><a href="/times/{time_id}/">{row["time"]}</a></div></td></tr>')
+    return f'<html><body><table class="c-table-clean"><tbody>{"".join(rows)}</tbody></table></body></html>\n'
+
+
+def swimcloud_time_page(splits, person=None):
+    rows = ['<tr><th>Distance</th><th>Split</th><th>Leg</th><th>Cumulative</th></tr>']
+    if person:
+        rows.append(f'<tr><td colspan="4">{html.escape(person)}</td></tr>')
+    for split in splits:
+        rows.append(f'<tr><td>{split["split_distance"]}</td><td>{split["split_time"]}</td>'
+                    f'<td>{split["split_time"]}</td><td>{split["cumulative_time"]}</td></tr>')
+    return f'<html><body><table class="c-table-clean">{"".join(rows)}</table></body></html>\n'
+
+
+def write(name, content):
+    with open(os.path.join(HERE, name), 'w', encoding='utf-8') as f:
+        f.write(content)
+    print(f"wrote {name}")
+
+
+if __name__ == "__main__":
+    ncaa = pd.read_excel(NCAA_XLSX, sheet_name=None)
+    relays = ncaa['Relay Results']
+    individuals = ncaa['Individual Results']
+    diving = ncaa['Diving Results']
+
+    for page, number, name in [('250326F001', 1, 'Men 200 Yard Medley Relay'),
+                               ('250326F021', 21, 'Men 400 Yard Freestyle Relay')]:
+        write(f'hytek_{page}_relay.htm', relay_page(relays[relays['meet_url'] == NCAA_URL + page + '.htm'], number, name))
+    write('hytek_250326F015_1650_free.htm',
+          individual_page(individuals[individuals['meet_url'] == NCAA_URL + '250326F015.htm'], 15, 'Men 1650 Yard Freestyle'))
+    write('hytek_250326P006_diving.htm',
+          diving_page(diving[diving['meet_url'] == NCAA_URL + '250326P006.htm'], 6, 'Men 1 mtr Diving'))
+
+    swimcloud = pd.read_excel(SWIMCLOUD_XLSX, sheet_name=1)
+    meet_id = re.search(r'/results/(\d+)', swimcloud['meet_url'].iloc[0]).group(1)
+    events = list(swimcloud[['event_number', 'event_name']].drop_duplicates().itertuples(index=False, name=None))
+    write(f'swimcloud_meet_{meet_id}.htm', swimcloud_meet_page(meet_id, swimcloud['meet_name'].iloc[0], events))
+    for number in (1, 2):
+        event = swimcloud[swimcloud['event_number'] == number]
+        write(f'swimcloud_meet_{meet_id}_event_{number}.htm',
+              swimcloud_event_page(event, bool(event['is_relay'].iloc[0])))
+
+    write('swimcloud_event_large.htm', swimcloud_event_page(swimcloud[~swimcloud['is_relay'].astype(bool)], False))
+
+    for number in (2, 8):
+        row = swimcloud[(swimcloud['event_number'] == number) & swimcloud['splits_json'].notna()].iloc[0]
+        time_id = re.search(r'/times/(\d+)', row['time_url']).group(1)
+        write(f'swimcloud_time_{time_id}.htm', swimcloud_time_page(json.loads(row['splits_json'])))
@@ -0,0 +1,321 @@
+# Bounded pool of long-lived headless Chrome workers
+#
+# One Chrome cold start per split page was the slowest part of a team crawl and
+# leaked a browser process every time. Workers here are created lazily up to
+# the pool size, handed out one caller at a time, and thrown away (quit) after
+# a set number of pages or once their process tree grows past a memory limit.
+#
+# ChromeProfile is the lean browser setup both scrapers use by default. All we read
+# from a page is one table or <pre>, so it:
+#   - blocks images, media, fonts and stylesheets, and ad/analytics/tracker hosts
+#     (content settings plus DevTools Network.setBlockedURLs)
+#   - uses the 'eager' page-load strategy: driver.get returns at DOMContentLoaded, and
+#     the readiness waits in page_ready.py take it from there
+#   - keeps a persistent user-data-dir (and so disk cache) per pool slot, so a run
+#     starts warm; Chrome locks a profile directory, so each live worker gets its own
+#   - trims background networking, extensions and renderer processes to cut memory
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+try:
+    import psutil
+except ImportError:  # memory based recycling is skipped without psutil
+    psutil = None
+
+
+# Third-party hosts SwimCloud and results pages pull ads, analytics and trackers from
+BLOCKED_HOSTS = (
+    'googletagmanager.com', 'google-analytics.com', 'analytics.google.com', 'doubleclick.net',
+    'googlesyndication.com', 'googleadservices.com', 'adservice.google.com', 'amazon-adsystem.com',
+    'facebook.net', 'connect.facebook.net', 'hotjar.com', 'scorecardresearch.com', 'quantserve.com',
+    'cloudflareinsights.com', 'adnxs.com', 'criteo.com', 'taboola.com', 'outbrain.com', 'pubmatic.com',
+    'rubiconproject.com', 'moatads.com', 'sentry.io', 'intercom.io', 'segment.io', 'fullstory.com',
+)
+
+# Resource types no parser reads, by URL pattern (for Network.setBlockedURLs)
+BLOCKED_EXTENSIONS = ('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp',
+                      'woff', 'woff2', 'ttf', 'otf', 'eot', 'mp4', 'webm', 'mp3', 'm4a')
+
+
+def default_chrome_options():
+    """Headless Chrome options shared by every pooled worker."""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    return chrome_options
+
+
+class ChromeProfile:
+    def __init__(self, headless=True, user_data_dir='.swim_chrome', block_stylesheets=True,
+                 blocked_hosts=BLOCKED_HOSTS, disk_cache_mb=256):
+        """
+        Lean Chrome setup for scraping.
+
+        Args:
+            headless: Run without a window (the profile is the same either way)
+            user_data_dir: Directory holding one persistent profile per pool slot (None: a throwaway
+                profile per browser, i.e. a cold cache every start)
+            block_stylesheets: Also block CSS (the DOM is read, never laid out for a person)
+            blocked_hosts: Hosts whose requests are blocked outright
+            disk_cache_mb: Size of each profile's HTTP disk cache
+        """
+        self.headless = headless
+        self.user_data_dir = user_data_dir
+        self.block_stylesheets = block_stylesheets
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.disk_cache_mb = disk_cache_mb
+
+    def blocked_urls(self):
+        """URL patterns for Network.setBlockedURLs."""
+        patterns = [f'*.{extension}*' for extension in BLOCKED_EXTENSIONS]
+        if self.block_stylesheets:
+            patterns.append('*.css*')
+        patterns += [f'*{host}*' for host in self.blocked_hosts]
+        return patterns
+
+    def options(self, slot=0):
+        """ChromeOptions for the browser in pool slot `slot`."""
+        chrome_options = Options()
+        chrome_options.page_load_strategy = 'eager'
+        if self.headless:
+            chrome_options.add_argument('--headless=new')
+        for argument in ('--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu', '--window-size=1280,900',
+                         '--disable-extensions', '--disable-background-networking', '--disable-default-apps',
+                         '--disable-sync', '--disable-component-update', '--disable-domain-reliability',
+                         '--no-first-run', '--no-default-browser-check', '--mute-audio', '--metrics-recording-only',
+                         '--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication',
+                         '--disable-blink-features=AutomationControlled', '--blink-settings=imagesEnabled=false',
+                         '--renderer-process-limit=2', f'--disk-cache-size={self.disk_cache_mb * 1024 * 1024}'):
+            chrome_options.add_argument(argument)
+        if self.user_data_dir:
+            profile_dir = os.path.abspath(os.path.join(self.user_data_dir, f'worker-{slot}'))
+            os.makedirs(profile_dir, exist_ok=True)
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+            'profile.default_content_setting_values.geolocation': 2,
+            'profile.managed_default_content_settings.media_stream': 2,
+            'profile.managed_default_content_settings.plugins': 2,
+        })
+        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
+        return chrome_options
+
+    def apply(self, driver):
+        """Block the non-essential requests on a started driver (DevTools; skipped if unavailable)."""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls()})
+        except Exception as e:
+            print(f"WARNING: Could not set up request blocking ({e}); loading every resource")
+
+    def start(self, slot=0):
+        """Start a Chrome with this profile."""
+        driver = webdriver.Chrome(options=self.options(slot))
+        self.apply(driver)
+        return driver
+
+
+def page_bytes(driver):
+    """Bytes transferred for the current page and its resources (Resource Timing; 0 if unavailable)."""
+    try:
+        return int(driver.execute_script(
+            "return performance.getEntries()"
+            ".reduce((total, entry) => total + (entry.transferSize || 0), 0);") or 0)
+    except Exception:
+        return 0
+
+
+class BrowserWorker:
+    """A single Chrome instance plus the bookkeeping the pool needs to recycle it."""
+
+    def __init__(self, worker_id, options_factory, profile=None, slot=0):
+        self.worker_id = worker_id
+        self.slot = slot
+        if profile is not None:
+            self.driver = profile.start(slot)
+        else:
+            self.driver = webdriver.Chrome(options=options_factory())
+        self.pages = 0
+
+    def rss_mb(self):
+        """
+        Resident memory of chromedriver and every Chrome process under it.
+
+        Returns:
+            Memory in MB, or None if psutil is not installed or the process is gone
+        """
+        if psutil is None:
+            return None
+        try:
+            root = psutil.Process(self.driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+        except (psutil.Error, AttributeError):
+            return None
+
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"WARNING: Error shutting down browser worker {self.worker_id}: {e}")
+
+
+class BrowserPool:
+    def __init__(self, size=1, max_pages=50, max_rss_mb=1024, options_factory=None, profile=None):
+        """
+        Initialize a pool of at most `size` browsers. Browsers are only started when first needed.
+
+        Args:
+            size: Maximum number of Chrome instances alive at once
+            max_pages: Pages a worker may load before it is quit and replaced (None to disable)
+            max_rss_mb: Memory (MB) a worker's process tree may reach before it is replaced (None to disable)
+            options_factory: Callable returning fresh ChromeOptions (defaults to headless Chrome)
+            profile: ChromeProfile to start workers with instead (each live worker gets its own slot)
+        """
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1")
+
+        self.size = size
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.options_factory = options_factory or default_chrome_options
+        self.profile = profile
+        self._free_slots = list(range(size))  # profile directories not held by a live worker
+
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        # Signalled whenever a worker goes idle or a live slot frees up (a worker was recycled)
+        self._available = threading.Condition(self._lock)
+        self._live = 0
+        self._next_id = 1
+        self._closed = False
+
+        self.started = 0
+        self.recycled = 0
+
+    def _create_worker(self):
+        with self._lock:
+            worker_id = self._next_id
+            self._next_id += 1
+            slot = self._free_slots.pop(0)
+        print(f"Starting pooled headless Chrome worker {worker_id}...")
+        try:
+            worker = BrowserWorker(worker_id, self.options_factory, self.profile, slot)
+        except Exception:
+            self._free_slot(slot)
+            raise
+        self.started += 1
+        return worker
+
+    def _free_slot(self, slot):
+        with self._lock:
+            self._free_slots.append(slot)
+            self._free_slots.sort()
+
+    def acquire(self):
+        """Take an idle worker, start a new one if below `size`, otherwise block until one is free."""
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                try:
+                    return self._idle.get_nowait()
+                except queue.Empty:
+                    pass
+                if self._live < self.size:
+                    self._live += 1
+                    break
+                self._available.wait()
+
+        try:
+            return self._create_worker()
+        except Exception:
+            with self._available:
+                self._live -= 1
+                self._available.notify()
+            raise
+
+    def release(self, worker, broken=False):
+        """
+        Return a worker to the pool, recycling it if it is broken, worn out or too large.
+
+        Args:
+            worker: The worker handed out by acquire()
+            broken: True if the caller saw the browser fail (it is never reused)
+        """
+        worker.pages += 1
+
+        reason = None
+        if broken:
+            reason = "error"
+        elif self.max_pages and worker.pages >= self.max_pages:
+            reason = f"{worker.pages} pages"
+        elif self.max_rss_mb:
+            rss = worker.rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                reason = f"{rss:.0f} MB RSS"
+
+        if reason is None and not self._closed:
+            with self._available:
+                self._idle.put(worker)
+                self._available.notify()
+            return
+
+        if reason:
+            print(f"Recycling browser worker {worker.worker_id} ({reason})")
+            self.recycled += 1
+        worker.quit()
+        self._free_slot(worker.slot)
+        with self._available:
+            self._live -= 1
+            self._available.notify()
+
+    @contextmanager
+    def page(self):
+        """
+        Context manager yielding a WebDriver from the pool.
+
+        Example:
+            with pool.page() as driver:
+                driver.get(url)
+        """
+        worker = self.acquire()
+        broken = False
+        try:
+            yield worker.driver
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(worker, broken=broken)
+
+    def close(self):
+        """Quit every idle browser. Workers still checked out are quit when they are released."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.quit()
+            self._free_slot(worker.slot)
+            with self._available:
+                self._live -= 1
+        with self._available:
+            self._available.notify_all()  # waiters in acquire() raise instead of blocking forever
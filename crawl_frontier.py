@@ -0,0 +1,373 @@
+# Crawl frontier: which URLs are queued, in flight, done or failed, and what to fetch next
+#
+# URL dedup used to be `url not in some_list`, per page, so a crawl was quadratic in its
+# size and nothing knew which pages had already been fetched elsewhere in the crawl.
+# CrawlFrontier keeps that state for a whole crawl (team, meet, event and /times/ pages,
+# HY-TEK index and event pages):
+#
+#   - Dedup: every URL ever scheduled is remembered as a 64-bit hash in a set (O(1), about
+#     80 bytes per URL), or, for crawls too big for that, in a Bloom filter of fixed size
+#     (bloom_capacity; about 1.8 bytes per URL at a 0.1% false-positive rate, where a
+#     false positive means a URL is wrongly taken as already crawled).
+#   - Scheduling: pop() serves the highest-priority kind first (deepest pages first, so a
+#     crawl finishes what it started and the queue stays small), FIFO within a kind, and
+#     rotates between hosts within a kind so no host's backlog starves another's.
+#   - Scrapers that must process pages in page order claim() them instead of popping:
+#     the same dedup and state, without going through the queue.
+#   - Persistence: with a path, save() writes the state to a small SQLite file (new hashes
+#     only, plus the queue and failures) and a new CrawlFrontier on the same path restores
+#     it. Pages in flight at the last save are queued again on restore.
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, deque, namedtuple
+from urllib.parse import urlsplit
+
+# Lower is served first: split pages before the event that needs them, events before the next meet
+KIND_PRIORITY = {'time': 0, 'event': 1, 'meet': 2, 'team': 3, 'index': 3}
+
+# A scheduled URL; data is any JSON-serialisable context the scraper needs back (e.g. a session dict)
+FrontierEntry = namedtuple('FrontierEntry', ['url', 'kind', 'seq', 'data'])
+
+
+def url_hash(url):
+    """64-bit (signed, to fit a SQLite INTEGER) hash of a URL."""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.001, bits=None):
+        """
+        Fixed-size set of URL hashes that may give false positives but never false negatives.
+
+        Args:
+            capacity: URLs it is sized for; past that the false-positive rate climbs
+            error_rate: False-positive rate at capacity
+            bits: Saved bit array (from .bits) to restore
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest):
+        # Double hashing: h1 + i * h2, with h2 an odd mix of the same 64-bit hash
+        h1 = digest & 0xFFFFFFFFFFFFFFFF
+        h2 = ((h1 * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 1 | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, digest):
+        """Add a URL hash; True if it was (probably) not in the filter yet."""
+        new = False
+        for position in self._positions(digest):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, digest):
+        return all(self.bits[position // 8] & (1 << (position % 8)) for position in self._positions(digest))
+
+    def __len__(self):
+        return self.count
+
+
+class CrawlFrontier:
+    def __init__(self, path=None, resume=True, bloom_capacity=None, error_rate=0.001, priorities=None):
+        """
+        Create a frontier, restoring it from path if one was saved there.
+
+        Args:
+            path: SQLite file to save to and restore from (None keeps everything in memory)
+            resume: Restore what was saved at path; False starts the frontier over
+            bloom_capacity: Dedup with a Bloom filter sized for this many URLs instead of an exact
+                hash set (a frontier saved with one restores with it)
+            error_rate: Bloom filter false-positive rate at bloom_capacity
+            priorities: kind -> priority (lower first), merged over KIND_PRIORITY
+        """
+        self.path = path
+        self.priorities = {**KIND_PRIORITY, **(priorities or {})}
+        self._lock = threading.Lock()
+        self._seen = BloomFilter(bloom_capacity, error_rate) if bloom_capacity else set()
+        self._unsaved = []  # hashes added since the last save (exact set only)
+        self._queues = {}  # kind -> OrderedDict of host -> deque of FrontierEntry
+        self._queued = {}  # url -> FrontierEntry
+        self._in_flight = {}  # url -> FrontierEntry
+        self._failed = {}  # url -> (FrontierEntry, error)
+        self._done = {}  # kind -> count
+        self._seq = 0
+        self._conn = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS seen (hash INTEGER PRIMARY KEY);
+                CREATE TABLE IF NOT EXISTS queue (
+                    url TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    data TEXT
+                );
+                CREATE TABLE IF NOT EXISTS failed (
+                    url TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    data TEXT,
+                    error TEXT
+                );
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value NOT NULL);
+            """)
+            if resume:
+                self._restore()
+            else:
+                self.clear()
+
+    # ---------------- SCHEDULING ---------------- #
+
+    def add(self, url, kind, data=None):
+        """
+        Queue a URL unless it was already scheduled.
+
+        Args:
+            url: Page URL
+            kind: Page type ('team', 'meet', 'event', 'time', 'index' or a kind given in priorities)
+            data: JSON-serialisable context handed back with the entry
+
+        Returns:
+            True if the URL was queued
+        """
+        with self._lock:
+            if not self._mark_seen(url):
+                return False
+            self._enqueue(FrontierEntry(url, kind, self._next_seq(), data))
+            return True
+
+    def pop(self, kind=None):
+        """
+        Next URL to fetch (now in flight), or None if nothing of that kind is queued.
+
+        Args:
+            kind: Only this kind (default: the highest-priority kind with anything queued)
+        """
+        with self._lock:
+            kinds = [kind] if kind is not None else sorted(self._queues, key=self._priority)
+            for queued_kind in kinds:
+                hosts = self._queues.get(queued_kind)
+                if not hosts:
+                    continue
+                host, queue = next(iter(hosts.items()))
+                entry = queue.popleft()
+                if queue:
+                    hosts.move_to_end(host)  # round-robin between hosts
+                else:
+                    del hosts[host]
+                del self._queued[entry.url]
+                self._in_flight[entry.url] = entry
+                return entry
+            return None
+
+    def claim(self, url, kind, data=None):
+        """
+        Take a URL straight to in flight, for scrapers that work through pages in page order.
+
+        Returns:
+            True if the caller should fetch it: never seen, queued, or failed before.
+            False if it is done or already in flight.
+        """
+        with self._lock:
+            if url in self._in_flight:
+                return False
+            entry = self._queued.pop(url, None)
+            if entry is not None:
+                self._dequeue(entry)
+            elif url in self._failed:
+                entry = self._failed.pop(url)[0]
+            elif self._mark_seen(url):
+                entry = FrontierEntry(url, kind, self._next_seq(), data)
+            else:
+                return False
+            self._in_flight[url] = entry
+            return True
+
+    def done(self, url):
+        """Mark an in-flight URL finished."""
+        with self._lock:
+            entry = self._in_flight.pop(url, None)
+            if entry is not None:
+                self._done[entry.kind] = self._done.get(entry.kind, 0) + 1
+
+    def failed(self, url, error):
+        """Mark an in-flight URL failed; claim() hands it out again, requeue_failed() queues it."""
+        with self._lock:
+            entry = self._in_flight.pop(url, None)
+            if entry is not None:
+                self._failed[url] = (entry, str(error))
+
+    def requeue_failed(self, kind=None):
+        """Queue failed URLs (of one kind, or all) again; returns how many."""
+        with self._lock:
+            urls = [url for url, (entry, _) in self._failed.items() if kind is None or entry.kind == kind]
+            for url in urls:
+                self._enqueue(self._failed.pop(url)[0])
+            return len(urls)
+
+    # ---------------- STATE ---------------- #
+
+    def state(self, url):
+        """'queued', 'in_flight', 'failed', 'done', or None if the URL was never scheduled."""
+        with self._lock:
+            if url in self._queued:
+                return 'queued'
+            if url in self._in_flight:
+                return 'in_flight'
+            if url in self._failed:
+                return 'failed'
+            return 'done' if url_hash(url) in self._seen else None
+
+    def __contains__(self, url):
+        return self.state(url) is not None
+
+    def pending(self, kind=None):
+        """Number of queued URLs (of one kind, or all)."""
+        with self._lock:
+            if kind is None:
+                return len(self._queued)
+            return sum(len(queue) for queue in self._queues.get(kind, {}).values())
+
+    def summary(self):
+        """Counts by state (done by kind) and how many URLs were ever seen."""
+        with self._lock:
+            return {
+                'seen': len(self._seen),
+                'queued': len(self._queued),
+                'in_flight': len(self._in_flight),
+                'failed': len(self._failed),
+                'done': dict(self._done),
+            }
+
+    # ---------------- PERSISTENCE ---------------- #
+
+    def save(self):
+        """Write the frontier to path (no-op without one). In-flight URLs are saved as queued."""
+        if self._conn is None:
+            return
+        with self._lock:
+            conn = self._conn
+            conn.execute('BEGIN')
+            try:
+                if isinstance(self._seen, BloomFilter):
+                    bloom = {'capacity': self._seen.capacity, 'error_rate': self._seen.error_rate,
+                             'count': self._seen.count}
+                    self._set_meta(conn, 'bloom', json.dumps(bloom))
+                    conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                                 ('bloom_bits', bytes(self._seen.bits)))
+                else:
+                    conn.executemany('INSERT OR IGNORE INTO seen (hash) VALUES (?)',
+                                     ((digest,) for digest in self._unsaved))
+                conn.execute('DELETE FROM queue')
+                conn.executemany('INSERT INTO queue (url, kind, seq, data) VALUES (?, ?, ?, ?)',
+                                 ((entry.url, entry.kind, entry.seq, json.dumps(entry.data))
+                                  for entry in [*self._queued.values(), *self._in_flight.values()]))
+                conn.execute('DELETE FROM failed')
+                conn.executemany('INSERT INTO failed (url, kind, seq, data, error) VALUES (?, ?, ?, ?, ?)',
+                                 ((entry.url, entry.kind, entry.seq, json.dumps(entry.data), error)
+                                  for entry, error in self._failed.values()))
+                self._set_meta(conn, 'seq', str(self._seq))
+                self._set_meta(conn, 'done', json.dumps(self._done))
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            self._unsaved = []
+
+    def clear(self):
+        """Forget everything, in memory and at path."""
+        with self._lock:
+            if isinstance(self._seen, BloomFilter):
+                self._seen = BloomFilter(self._seen.capacity, self._seen.error_rate)
+            else:
+                self._seen = set()
+            self._unsaved = []
+            self._queues, self._queued, self._in_flight, self._failed, self._done = {}, {}, {}, {}, {}
+            self._seq = 0
+            if self._conn is not None:
+                for table in ('seen', 'queue', 'failed', 'meta'):
+                    self._conn.execute(f'DELETE FROM {table}')
+
+    def close(self):
+        """Save and close the file, if any."""
+        if self._conn is not None:
+            self.save()
+            self._conn.close()
+            self._conn = None
+
+    def _restore(self):
+        conn = self._conn
+        meta = dict(conn.execute('SELECT key, value FROM meta').fetchall())
+        if 'bloom' in meta:
+            bloom = json.loads(meta['bloom'])
+            self._seen = BloomFilter(bloom['capacity'], bloom['error_rate'], meta['bloom_bits'])
+            self._seen.count = bloom['count']
+        for (digest,) in conn.execute('SELECT hash FROM seen'):
+            self._seen.add(digest)
+        self._seq = int(meta.get('seq', 0))
+        self._done = json.loads(meta.get('done', '{}'))
+        for url, kind, seq, data in conn.execute('SELECT url, kind, seq, data FROM queue ORDER BY seq'):
+            self._enqueue(FrontierEntry(url, kind, seq, json.loads(data)))
+        for url, kind, seq, data, error in conn.execute('SELECT url, kind, seq, data, error FROM failed'):
+            self._failed[url] = (FrontierEntry(url, kind, seq, json.loads(data)), error)
+        if self._queued or self._failed or self._done:
+            print(f"Restored crawl frontier from {self.path}: {len(self._queued)} queued, "
+                  f"{len(self._failed)} failed, {sum(self._done.values())} done")
+
+    @staticmethod
+    def _set_meta(conn, key, value):
+        conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    # ---------------- INTERNALS (lock held) ---------------- #
+
+    def _priority(self, kind):
+        return self.priorities.get(kind, max(self.priorities.values()) + 1)
+
+    def _next_seq(self):
+        self._seq += 1
+        return self._seq
+
+    def _mark_seen(self, url):
+        """Remember a URL; True if it was not seen before."""
+        digest = url_hash(url)
+        if isinstance(self._seen, BloomFilter):
+            return self._seen.add(digest)
+        if digest in self._seen:
+            return False
+        self._seen.add(digest)
+        if self._conn is not None:
+            self._unsaved.append(digest)
+        return True
+
+    def _enqueue(self, entry):
+        hosts = self._queues.setdefault(entry.kind, OrderedDict())
+        hosts.setdefault(urlsplit(entry.url).netloc, deque()).append(entry)
+        self._queued[entry.url] = entry
+
+    def _dequeue(self, entry):
+        """Take a queued entry out of its host queue (claim() of a queued URL)."""
+        hosts = self._queues[entry.kind]
+        host = urlsplit(entry.url).netloc
+        hosts[host].remove(entry)
+        if not hosts[host]:
+            del hosts[host]
@@ -0,0 +1,154 @@
+# Completion journal for resumable crawls
+#
+# SwimCloudScraper records every finished split page (time_url), event and meet
+# here as it goes. A run started with resume=True replays what the journal already
+# has - no requests, no sleeps - and only scrapes what is missing, so a crawl that
+# died at meet 30 of 40 (or halfway through an event's split pages) picks up where
+# it stopped. Because finished events are replayed from the journal, the output is
+# rebuilt in full on every run and never gets duplicate sheets or rows.
+#
+# The journal is a small SQLite file (WAL mode, one connection per thread, like the
+# page cache index): split pages are recorded from the browser pool threads.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from scrape_records import EventRecords
+
+# CrawlJournal.event() for an event that finished without results (None: not in the journal)
+NO_RECORDS = object()
+
+
+class CrawlJournal:
+    def __init__(self, path, resume=True):
+        """
+        Open (or create) a journal.
+
+        Args:
+            path: Journal file
+            resume: Keep what an earlier run recorded; False starts the journal over
+        """
+        self.path = path
+        self.resume = resume
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._connections = []  # every thread's connection, so close() can close them all
+        self._connections_lock = threading.Lock()
+        self._connect().executescript("""
+            CREATE TABLE IF NOT EXISTS meets (
+                meet_url TEXT PRIMARY KEY,
+                meet_name TEXT,
+                finished_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS events (
+                meet_url TEXT NOT NULL,
+                event_url TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                records TEXT NOT NULL,
+                finished_at REAL NOT NULL,
+                PRIMARY KEY (meet_url, event_url)
+            );
+            CREATE TABLE IF NOT EXISTS splits (
+                time_url TEXT PRIMARY KEY,
+                splits TEXT NOT NULL,
+                finished_at REAL NOT NULL
+            );
+        """)
+        if not resume:
+            self.clear()
+
+        # Work skipped thanks to the journal, for the end-of-run summary
+        self.replayed_events = 0
+        self.replayed_splits = 0
+
+    def _connect(self):
+        """One SQLite connection per thread (split pages finish on the browser pool threads)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Only this thread uses it, but close() closes it from whichever thread calls it
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute('DELETE FROM meets')
+        conn.execute('DELETE FROM events')
+        conn.execute('DELETE FROM splits')
+
+    # ---------------- SPLIT PAGES ---------------- #
+
+    def splits(self, time_url):
+        """Recorded split rows for a time_url, or None if that page was not finished."""
+        row = self._connect().execute('SELECT splits FROM splits WHERE time_url = ?', (time_url,)).fetchone()
+        if row is None:
+            return None
+        self.replayed_splits += 1
+        return json.loads(row[0])
+
+    def finish_splits(self, time_url, split_times):
+        self._connect().execute('INSERT OR REPLACE INTO splits (time_url, splits, finished_at) VALUES (?, ?, ?)',
+                                (time_url, json.dumps(split_times), time.time()))
+
+    # ---------------- EVENTS ---------------- #
+
+    def event(self, meet_url, event_url):
+        """Recorded EventRecords for a finished event, NO_RECORDS if it had no results, or None."""
+        row = self._connect().execute('SELECT records FROM events WHERE meet_url = ? AND event_url = ?',
+                                      (meet_url, event_url)).fetchone()
+        if row is None:
+            return None
+        self.replayed_events += 1
+        records = json.loads(row[0])
+        return NO_RECORDS if records is None else EventRecords(**records)
+
+    def finish_event(self, meet_url, event_url, position, records):
+        """
+        Record a finished event (records=None for an event that had no results).
+
+        Args:
+            position: Index of the event in its meet, to replay events in page order
+        """
+        payload = json.dumps(records._asdict() if records else None)
+        self._connect().execute(
+            'INSERT OR REPLACE INTO events (meet_url, event_url, position, records, finished_at) VALUES (?, ?, ?, ?, ?)',
+            (meet_url, event_url, position, payload, time.time()))
+
+    # ---------------- MEETS ---------------- #
+
+    def meet_finished(self, meet_url):
+        row = self._connect().execute('SELECT finished_at FROM meets WHERE meet_url = ?', (meet_url,)).fetchone()
+        return row is not None and row[0] is not None
+
+    def meet_events(self, meet_url):
+        """EventRecords of every recorded event of a meet, in page order (events without results left out)."""
+        rows = self._connect().execute('SELECT records FROM events WHERE meet_url = ? ORDER BY position',
+                                       (meet_url,)).fetchall()
+        events = []
+        for (payload,) in rows:
+            records = json.loads(payload)
+            if records is not None:
+                events.append(EventRecords(**records))
+        self.replayed_events += len(rows)
+        return events
+
+    def finish_meet(self, meet_url, meet_name):
+        self._connect().execute('INSERT OR REPLACE INTO meets (meet_url, meet_name, finished_at) VALUES (?, ?, ?)',
+                                (meet_url, meet_name, time.time()))
+
+    def close(self):
+        """Close every thread's connection (the browser pool threads open their own)."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
@@ -0,0 +1,234 @@
+# Single-pass tokenizer for HY-TEK split lines
+#
+# A HY-TEK individual result is followed by split lines such as
+#     r:+0.66  21.34  44.55 (23.21)  1:08.12 (23.57)  1:31.65 (23.53)
+# Each line is scanned once, left to right, into typed tokens. Split rows are
+# then built from the token stream, so a time is paired with the parenthesised
+# split that actually follows it (not the first place the same string occurs).
+
+import re
+from collections import namedtuple
+
+from swim_times import time_to_centiseconds
+
+REACTION = 'reaction'
+TIME = 'time'
+PAREN = 'paren'
+MARKER = 'marker'
+
+# Status markers that can show up where times would be
+STATUS_MARKERS = ('DQ', 'DFS', 'DNF', 'NS', 'SCR', 'NT')
+
+_TOKEN_RE = re.compile(r"""
+      r:(?P<reaction>[+-]?\d+\.\d+|NRT)
+    | \((?P<paren>(?:\d+:)?\d+\.\d+)\)
+    | (?P<time>(?:\d+:)?\d+\.\d+)
+    | \b(?P<marker>DQ|DFS|DNF|NS|SCR|NT)\b
+""", re.VERBOSE)
+
+Token = namedtuple('Token', ['kind', 'text', 'centiseconds'])
+
+
+def tokenize_split_line(line):
+    """
+    Scan one split line into tokens.
+
+    Args:
+        line: A line of split text
+
+    Returns:
+        list of Token(kind, text, centiseconds); kind is REACTION, TIME, PAREN or MARKER
+    """
+    tokens = []
+    for match in _TOKEN_RE.finditer(line):
+        kind = match.lastgroup
+        text = match.group(kind)
+        centis = None if kind == MARKER else time_to_centiseconds(text)
+        tokens.append(Token(kind, text, centis))
+    return tokens
+
+
+def tokenize_split_lines(lines):
+    """Tokenize every split line of one result, in order."""
+    tokens = []
+    for line in lines:
+        tokens.extend(tokenize_split_line(line))
+    return tokens
+
+
+def individual_splits(tokens, interval=50):
+    """
+    Build split rows for an individual swim from its token stream.
+
+    A time followed by a parenthesised value is a cumulative time and the value
+    in parentheses is its split. A time with no parentheses after it is a split
+    on its own (the first 50 of most races), with no cumulative.
+
+    Args:
+        tokens: Tokens from tokenize_split_lines()
+        interval: Distance covered by each split
+
+    Returns:
+        list of (distance, split_text, cumulative_text or None)
+    """
+    splits = []
+    i = 0
+    count = len(tokens)
+    while i < count:
+        token = tokens[i]
+        if token.kind == TIME:
+            distance = (len(splits) + 1) * interval
+            if i + 1 < count and tokens[i + 1].kind == PAREN:
+                splits.append((distance, tokens[i + 1].text, token.text))
+                i += 2
+                continue
+            splits.append((distance, token.text, None))
+        i += 1
+    return splits
+
+
+def format_centiseconds(centis):
+    """Format integer centiseconds the way HY-TEK prints times ("21.34", "1:08.12")."""
+    if centis is None:
+        return None
+    sign = '-' if centis < 0 else ''
+    minutes, rest = divmod(abs(centis), 6000)
+    if minutes:
+        return f"{sign}{minutes}:{rest // 100:02d}.{rest % 100:02d}"
+    return f"{sign}{rest // 100}.{rest % 100:02d}"
+
+
+# ---------------- RELAYS ---------------- #
+
+# In a HY-TEK relay block every time is the cumulative race time, and the value in
+# parentheses after it is the time since the current leg started:
+#     r:+0.58  19.28  40.57 (40.57)  59.68 (19.11)  1:21.59 (41.02) ...
+# so the parenthesised value at the last split of a leg is that swimmer's leg time.
+
+RelayLeg = namedtuple('RelayLeg', ['leg', 'distance', 'reaction', 'splits', 'leg_time', 'cumulative'])
+# splits is a list of (race distance, split_text, cumulative_text) for that leg
+
+_DISTANCE_RE = re.compile(r'(\d+)\s+(LC Meter|SC Meter|Meter|Yard)', re.IGNORECASE)
+COURSES = {'yard': 'SCY', 'sc meter': 'SCM', 'meter': 'SCM', 'lc meter': 'LCM'}
+
+
+def event_distance_and_course(event_name):
+    """
+    Read the race distance and course from an event name.
+
+    Args:
+        event_name: e.g. "Men 400 Yard Freestyle Relay"
+
+    Returns:
+        (distance, course) such as (400, 'SCY'), or (None, None) if the name has no distance
+    """
+    match = _DISTANCE_RE.search(event_name or '')
+    if not match:
+        return None, None
+    return int(match.group(1)), COURSES[match.group(2).lower()]
+
+
+def relay_split_schedule(event_name, split_count, legs=4):
+    """
+    Work out how a relay's splits are laid out.
+
+    The split count is the best evidence (8 splits over 4 legs of a 400 = 50s), as long as
+    the interval it implies is possible in that course (25s in short course, 50s long course).
+    Otherwise fall back to 50s, which every course allows.
+
+    Returns:
+        (leg_distance, splits_per_leg, split_interval); distances are None if the event name has none
+    """
+    distance, course = event_distance_and_course(event_name)
+    leg_distance = distance // legs if distance else None
+    min_interval = 50 if course == 'LCM' else 25
+
+    counted_per_leg = split_count // legs if split_count and split_count % legs == 0 else None
+    if counted_per_leg and (not leg_distance or leg_distance // counted_per_leg >= min_interval):
+        splits_per_leg = counted_per_leg
+    elif leg_distance:
+        splits_per_leg = max(leg_distance // 50, 1)
+    else:
+        splits_per_leg = 1
+
+    split_interval = leg_distance // splits_per_leg if leg_distance else None
+    return leg_distance, splits_per_leg, split_interval
+
+
+def _group_legs(marks, splits_per_leg, legs):
+    """Cut the (cumulative, leg-relative) marks into legs in one pass."""
+    if len(marks) == splits_per_leg * legs:
+        return [marks[start:start + splits_per_leg] for start in range(0, len(marks), splits_per_leg)]
+
+    # Uneven split count: a leg starts wherever the leg-relative time drops back down
+    groups = []
+    previous = None
+    for mark in marks:
+        relative = mark[1]
+        if not groups or (relative is not None and previous is not None and relative.centiseconds < previous):
+            groups.append([])
+        groups[-1].append(mark)
+        if relative is not None:
+            previous = relative.centiseconds
+    return groups
+
+
+def relay_legs(tokens, event_name, legs=4):
+    """
+    Build per-leg split data for a relay from its split token stream.
+
+    Works for any number of splits per leg (200 relays with 4 splits, 400s with 8,
+    800s with 16, ...). Single pass over the tokens, no backtracking.
+
+    Args:
+        tokens: Tokens from tokenize_split_lines()
+        event_name: Event name, used for the race distance
+        legs: Number of swimmers
+
+    Returns:
+        list of RelayLeg
+    """
+    reaction = None
+    marks = []
+    i = 0
+    count = len(tokens)
+    while i < count:
+        token = tokens[i]
+        if token.kind == REACTION and not marks and reaction is None:
+            reaction = token.text
+        elif token.kind == TIME:
+            if i + 1 < count and tokens[i + 1].kind == PAREN:
+                marks.append((token, tokens[i + 1]))
+                i += 1
+            else:
+                marks.append((token, None))
+        i += 1
+
+    leg_distance, splits_per_leg, split_interval = relay_split_schedule(event_name, len(marks), legs)
+
+    result = []
+    leg_start_centis = 0
+    for leg_number, group in enumerate(_group_legs(marks, splits_per_leg, legs)[:legs], 1):
+        interval = leg_distance // len(group) if leg_distance else split_interval
+        leg_offset = (leg_number - 1) * leg_distance if leg_distance else None
+
+        splits = []
+        previous_relative = 0
+        for split_index, (cumulative, relative) in enumerate(group, 1):
+            relative_centis = relative.centiseconds if relative else cumulative.centiseconds - leg_start_centis
+            distance = leg_offset + split_index * interval if interval else None
+            splits.append((distance, format_centiseconds(relative_centis - previous_relative), cumulative.text))
+            previous_relative = relative_centis
+
+        last_cumulative = group[-1][0]
+        result.append(RelayLeg(
+            leg=leg_number,
+            distance=leg_distance,
+            reaction=reaction if leg_number == 1 else None,
+            splits=splits,
+            leg_time=format_centiseconds(previous_relative),
+            cumulative=last_cumulative.text,
+        ))
+        leg_start_centis = last_cumulative.centiseconds
+
+    return result
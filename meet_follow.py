@@ -0,0 +1,186 @@
+# Live meet follower for HY-TEK results sites
+#
+# During a meet the results site re-exports pages as events finish. Instead of
+# re-scraping the whole meet, MeetFollower polls it:
+#   - every page is requested conditionally (If-None-Match / If-Modified-Since), so an
+#     unchanged page costs a 304 and no parsing
+#   - a page that did come back is reduced to its <pre> text and hashed (ignoring the
+#     HY-TEK export timestamp line), so a re-export with the same results is skipped too
+#   - only new or changed events are parsed and yielded, as EventRecords deltas
+#   - a page that fails (network error, bad status, unparsable export) is logged and keeps
+#     its previous state, so the next poll tries it again
+#
+# The deltas go wherever the caller sends them, e.g. straight into the SQLite store,
+# which replaces an event's rows when it is written again:
+#
+#     store = ResultsStore('live.sqlite', batch_events=1)
+#     store.write_records(scraper.follow_meet(index_url, poll_interval=30))
+
+import hashlib
+import re
+import time
+from urllib.parse import urljoin
+
+import lxml.html
+
+from scrape_records import EventRecords
+
+# "Licensed to ... HY-TEK's MEET MANAGER 8.0 - 6:43 PM  3/26/2025  Page 1" changes on every export
+_EXPORT_STAMP_RE = re.compile(r"^.*HY-TEK's MEET MANAGER.*$", re.MULTILINE | re.IGNORECASE)
+
+
+def results_digest(page_text):
+    """SHA-256 of an event page's <pre> text, without the export timestamp line."""
+    return hashlib.sha256(_EXPORT_STAMP_RE.sub('', page_text).encode('utf-8')).hexdigest()
+
+
+class MeetFollower:
+    def __init__(self, scraper, index_url, poll_interval=30):
+        """
+        Follow one live meet.
+
+        Args:
+            scraper: SwimMeetScraper (its session, delay, split_format and parsers are used)
+            index_url: URL of the meet index page
+            poll_interval: Seconds from the start of one poll to the start of the next
+        """
+        self.scraper = scraper
+        self.index_url = index_url
+        self.poll_interval = poll_interval
+
+        self.validators = {}  # url -> (etag, last_modified, body)
+        self.digests = {}  # event url -> results_digest of its <pre> text
+        self.sessions = []
+        self.meet_name = None
+
+        self.requests = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.polls = 0
+
+    def _get(self, url):
+        """
+        Conditional GET.
+
+        Returns:
+            (body, changed); changed is False when the server answered 304 or sent the same bytes
+        """
+        etag, last_modified, previous = self.validators.get(url, (None, None, None))
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        self.scraper._delay_request(url)
+        with self.scraper.metrics.stage('fetch', url):
+            response = self.scraper.session.get(url, headers=headers, timeout=30)
+            self.requests += 1
+            if response.status_code == 304 and previous is not None:
+                self.not_modified += 1
+                return previous, False
+
+            response.raise_for_status()
+            body = response.content
+        self.validators[url] = (response.headers.get('ETag'), response.headers.get('Last-Modified'), body)
+        return body, body != previous
+
+    def _refresh_sessions(self):
+        """Re-read the session list if the index (or its event frame) changed."""
+        index_body, changed = self._get(self.index_url)
+        index_doc = lxml.html.fromstring(index_body)
+        frame_url, frame_doc = self.index_url, index_doc
+
+        frame_srcs = index_doc.xpath('//frame/@src')
+        if frame_srcs:
+            frame_url = urljoin(self.index_url, frame_srcs[0])
+            frame_body, frame_changed = self._get(frame_url)
+            changed = changed or frame_changed
+            frame_doc = lxml.html.fromstring(frame_body)
+
+        if changed or not self.sessions:
+            self.sessions = self.scraper._sessions_from_doc(frame_doc, frame_url, self.index_url)
+
+    def poll(self):
+        """
+        One pass over the meet.
+
+        Yields:
+            EventRecords for every event that is new or changed since the last poll
+        """
+        try:
+            self._refresh_sessions()
+        except Exception as e:
+            self.errors += 1
+            print(f"Error refreshing sessions from {self.index_url}: {e}")
+
+        for session in self.sessions:
+            url = session['full_url']
+            validators = self.validators.get(url)
+            try:
+                records = self._poll_event(url)
+            except Exception as e:
+                # Forget this poll's copy, so the next poll fetches and parses the page again
+                if validators is None:
+                    self.validators.pop(url, None)
+                else:
+                    self.validators[url] = validators
+                self.errors += 1
+                print(f"Error polling {url}: {e}")
+                continue
+            if records is not None:
+                yield records
+
+    def _poll_event(self, url):
+        """EventRecords of one event page if it is new or changed, else None."""
+        scraper = self.scraper
+        body, changed = self._get(url)
+        if not changed and url in self.digests:
+            return None
+
+        page_text = scraper._pre_text(body)
+        if not page_text:
+            return None
+        digest = results_digest(page_text)
+        if self.digests.get(url) == digest:
+            return None
+
+        meet_name = self.meet_name or scraper._extract_meet_name(page_text)
+        split_rows = [] if scraper.split_format == 'long' else None
+        results, event_type, event_number, event_name = scraper._parse_event(
+            url, meet_name, url, split_rows, page_text=page_text)
+
+        # Only a page that parsed counts as seen
+        self.digests[url] = digest
+        self.meet_name = meet_name
+        # Later plain scrapes must not read the pre-change copy from the page cache
+        if scraper.page_cache:
+            scraper.page_cache.put_text(url, page_text, 'pre')
+
+        if not results:
+            return None
+        return EventRecords(meet_name, url, event_number, event_name, event_type, results, split_rows or [])
+
+    def follow(self, max_polls=None):
+        """
+        Poll until stopped (or max_polls polls), yielding each new or changed event.
+
+        Yields:
+            EventRecords deltas (see poll)
+        """
+        while max_polls is None or self.polls < max_polls:
+            started = time.time()
+            changed_events = 0
+            for records in self.poll():
+                changed_events += 1
+                yield records
+            self.polls += 1
+            print(f"Poll {self.polls}: {changed_events} new/changed events, "
+                  f"{self.not_modified}/{self.requests} requests not modified, {self.errors} errors so far")
+            self.scraper.metrics.count('polls')
+            self.scraper.metrics.count('changed_events', changed_events)
+            self.scraper.metrics.maybe_flush()
+
+            if max_polls is not None and self.polls >= max_polls:
+                break
+            time.sleep(max(self.poll_interval - (time.time() - started), 0))
@@ -0,0 +1,181 @@
+# Output sinks for SwimCloudScraper.scrape_team_results
+#
+# The scraper hands each finished meet to a sink once; a sink never reopens what
+# it already wrote, so writing a season is O(rows).
+#   ExcelSink   - the familiar workbook (one sheet per meet + "_Splits" sheet), written in
+#                 openpyxl write-only (streaming) mode, saved once at close()
+#   ParquetSink - results.parquet and splits.parquet, one row group per meet, explicit dtypes
+# export_excel() turns a Parquet output into the workbook afterwards, one meet at a time.
+
+import os
+
+import pandas as pd
+from openpyxl import Workbook
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for ParquetSink / export_excel
+    pa = None
+    pq = None
+
+
+def _excel_value(value):
+    """openpyxl can't write pandas NA/NaN, numpy scalars or categoricals as-is."""
+    if value is None or value is pd.NA:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+def _append_frame(worksheet, df):
+    worksheet.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        worksheet.append([_excel_value(value) for value in row])
+
+
+def _sheet_names(meet_name):
+    # Truncate string for sheet name compatibility
+    sheet_name = meet_name[:31]
+    return sheet_name, f"{sheet_name[:25]}_Splits"
+
+
+class OutputSink:
+    """Interface: write_meet() once per meet, then close()."""
+
+    path = None
+
+    def write_meet(self, meet_name, df_meet, df_splits):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class ExcelSink(OutputSink):
+    def __init__(self, path):
+        """
+        Stream meets into an .xlsx workbook (constant memory, saved at close()).
+
+        Args:
+            path: Output .xlsx filename
+        """
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+
+    def write_meet(self, meet_name, df_meet, df_splits):
+        sheet_name, split_sheet_name = _sheet_names(meet_name)
+        _append_frame(self.workbook.create_sheet(title=sheet_name), df_meet)
+        if not df_splits.empty:
+            _append_frame(self.workbook.create_sheet(title=split_sheet_name), df_splits)
+
+    def close(self):
+        if not self.workbook.worksheets:
+            # An empty workbook can't be saved
+            self.workbook.create_sheet(title='Sheet1')
+        self.workbook.save(self.path)
+
+
+# Explicit column types so every meet's row group has the same schema
+RESULTS_SCHEMA = pa.schema([
+    ('meet_name', pa.string()),
+    ('meet_url', pa.string()),
+    ('event_number', pa.string()),
+    ('event_name', pa.string()),
+    ('is_relay', pa.bool_()),
+    ('name', pa.string()),
+    ('time', pa.string()),
+    ('time_url', pa.string()),
+    ('team', pa.string()),
+    ('swimmer_id', pa.string()),
+    ('team_id', pa.string()),
+    ('time_cs', pa.int32()),
+]) if pa else None
+
+SPLITS_SCHEMA = pa.schema([
+    ('meet_name', pa.string()),
+    ('meet_url', pa.string()),
+    ('event_number', pa.string()),
+    ('event_name', pa.string()),
+    ('is_relay', pa.bool_()),
+    ('name', pa.string()),
+    ('time_url', pa.string()),
+    ('Distance', pa.int16()),
+    ('split', pa.string()),
+    ('leg', pa.string()),
+    ('Cumulative', pa.string()),
+    ('Person', pa.string()),
+    ('split_cs', pa.int32()),
+    ('leg_cs', pa.int32()),
+    ('Cumulative_cs', pa.int32()),
+]) if pa else None
+
+
+class ParquetSink(OutputSink):
+    def __init__(self, path):
+        """
+        Append each meet as a row group of results.parquet / splits.parquet.
+
+        Args:
+            path: Output directory
+        """
+        if pa is None:
+            raise ImportError("ParquetSink needs pyarrow (pip install pyarrow)")
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.results_path = os.path.join(path, 'results.parquet')
+        self.splits_path = os.path.join(path, 'splits.parquet')
+        self._results_writer = pq.ParquetWriter(self.results_path, RESULTS_SCHEMA)
+        self._splits_writer = pq.ParquetWriter(self.splits_path, SPLITS_SCHEMA)
+
+    @staticmethod
+    def _table(df, schema):
+        df = df.reindex(columns=schema.names)
+        if 'Distance' in df.columns:
+            df['Distance'] = pd.to_numeric(df['Distance'], errors='coerce').astype('Int16')
+        return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+    def write_meet(self, meet_name, df_meet, df_splits):
+        self._results_writer.write_table(self._table(df_meet, RESULTS_SCHEMA))
+        # An empty row group keeps results and splits row groups lined up one per meet
+        self._splits_writer.write_table(self._table(df_splits, SPLITS_SCHEMA))
+
+    def close(self):
+        self._results_writer.close()
+        self._splits_writer.close()
+
+
+def load_parquet(path):
+    """
+    Load a ParquetSink output directory back into pandas.
+
+    Returns:
+        Tuple of (results DataFrame, splits DataFrame)
+    """
+    return (pd.read_parquet(os.path.join(path, 'results.parquet')),
+            pd.read_parquet(os.path.join(path, 'splits.parquet')))
+
+
+def export_excel(path, output_file):
+    """
+    Write a ParquetSink output as the usual workbook, one meet (row group) at a time.
+
+    Args:
+        path: ParquetSink output directory
+        output_file: .xlsx filename to create
+    """
+    results = pq.ParquetFile(os.path.join(path, 'results.parquet'))
+    splits = pq.ParquetFile(os.path.join(path, 'splits.parquet'))
+
+    sink = ExcelSink(output_file)
+    for row_group in range(results.num_row_groups):
+        df_meet = results.read_row_group(row_group).to_pandas()
+        if df_meet.empty:
+            continue
+        df_splits = splits.read_row_group(row_group).to_pandas()
+        sink.write_meet(df_meet['meet_name'].iloc[0], df_meet, df_splits)
+    sink.close()
+    print(f"Exported {results.metadata.num_rows} results to {output_file}")
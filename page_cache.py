@@ -0,0 +1,234 @@
+# Persistent on-disk page cache shared by SwimCloudScraper and SwimMeetScraper
+#
+# Page bodies are stored once under their SHA-256 digest (content addressed),
+# and a small SQLite index maps (url, kind) to a digest plus its expiry and
+# HTTP validators. SQLite in WAL mode and write-then-rename blob files make the
+# cache safe to share between several scraper processes.
+#
+# kind separates the different things we keep for the same URL:
+#   'http'        - raw requests response body
+#   'page_source' - Selenium driver.page_source
+#   'pre'         - text of the <pre> element on a HY-TEK event page
+#   'sessions'    - JSON list of sessions read from a HY-TEK meet index
+
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# (url regex, ttl in seconds) - first match wins, None means keep forever
+DEFAULT_TTL_RULES = [
+    # A single swim's split page never changes once it exists
+    (r'swimcloud\.com/times/\d+', None),
+    # Team result lists grow as the season goes on
+    (r'swimcloud\.com/team/\d+/results', 6 * HOUR),
+    # Meet and event pages on SwimCloud can still be corrected for a while
+    (r'swimcloud\.com/results/\d+', DAY),
+    # HY-TEK index / latest-event pages change while a meet is running
+    (r'/(index|evtindex|lastevt|[^/]*lastevt)\.htm$', 5 * 60),
+    (r'/$', 5 * 60),
+    # Finished HY-TEK event pages are static
+    (r'\.htm$', None),
+]
+DEFAULT_TTL = DAY
+
+
+class CachedPage:
+    """A cache hit: the stored body plus what we know about its freshness."""
+
+    def __init__(self, body, fresh, etag=None, last_modified=None, fetched_at=None):
+        self.body = body
+        self.fresh = fresh
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+    @property
+    def text(self):
+        return self.body.decode('utf-8')
+
+
+class PageCache:
+    def __init__(self, cache_dir='.swim_cache', ttl_rules=None, default_ttl=DEFAULT_TTL):
+        """
+        Open (or create) a page cache directory.
+
+        Args:
+            cache_dir: Directory holding index.sqlite and the objects/ blob store
+            ttl_rules: List of (url regex, seconds or None for forever); defaults to DEFAULT_TTL_RULES
+            default_ttl: TTL in seconds for URLs no rule matches
+        """
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, 'objects')
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        rules = DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules
+        self.ttl_rules = [(re.compile(pattern), ttl) for pattern, ttl in rules]
+        self.default_ttl = default_ttl
+
+        self.index_path = os.path.join(cache_dir, 'index.sqlite')
+        self._local = threading.local()
+        self._connect().execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL,
+                etag TEXT,
+                last_modified TEXT,
+                PRIMARY KEY (url, kind)
+            )
+        """)
+
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        """One SQLite connection per thread (the browser pool fetches from several threads)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def ttl_for(self, url):
+        """TTL in seconds for a URL (None = never expires)."""
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def _blob_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _write_blob(self, body):
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial blob
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        return digest
+
+    def get(self, url, kind='http', allow_stale=False):
+        """
+        Look up a cached page.
+
+        Args:
+            url: Page URL
+            kind: What was stored for the URL ('http', 'page_source', 'pre', 'sessions')
+            allow_stale: Also return expired entries (marked fresh=False) for revalidation
+
+        Returns:
+            CachedPage, or None if nothing (usable) is cached
+        """
+        row = self._connect().execute(
+            'SELECT digest, fetched_at, expires_at, etag, last_modified FROM pages WHERE url = ? AND kind = ?',
+            (url, kind)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        digest, fetched_at, expires_at, etag, last_modified = row
+        fresh = expires_at is None or expires_at > time.time()
+        if not fresh and not allow_stale:
+            self.misses += 1
+            return None
+
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        if fresh:
+            self.hits += 1
+        return CachedPage(body, fresh, etag, last_modified, fetched_at)
+
+    def put(self, url, body, kind='http', etag=None, last_modified=None):
+        """
+        Store a page body (bytes or str) for a URL.
+
+        Returns:
+            The SHA-256 digest the body is stored under
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        digest = self._write_blob(body)
+        now = time.time()
+        ttl = self.ttl_for(url)
+        expires_at = None if ttl is None else now + ttl
+        self._connect().execute(
+            'INSERT OR REPLACE INTO pages (url, kind, digest, fetched_at, expires_at, etag, last_modified) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (url, kind, digest, now, expires_at, etag, last_modified))
+        return digest
+
+    def touch(self, url, kind='http'):
+        """Restart the TTL of an entry after the server said it has not changed (304)."""
+        now = time.time()
+        ttl = self.ttl_for(url)
+        expires_at = None if ttl is None else now + ttl
+        self._connect().execute(
+            'UPDATE pages SET fetched_at = ?, expires_at = ? WHERE url = ? AND kind = ?',
+            (now, expires_at, url, kind))
+
+    def get_text(self, url, kind):
+        """Fresh cached text for a URL, or None."""
+        cached = self.get(url, kind)
+        return cached.text if cached else None
+
+    def put_text(self, url, text, kind):
+        self.put(url, text.encode('utf-8'), kind)
+
+    def fetch(self, session, url, before_request=None):
+        """
+        GET a URL through the cache with a requests.Session.
+
+        Fresh entries are returned without touching the network. Stale entries that
+        have an ETag/Last-Modified are revalidated with a conditional request.
+
+        Args:
+            session: requests.Session used on a miss
+            url: Page URL
+            before_request: Optional callable run right before a network request (e.g. a politeness delay)
+
+        Returns:
+            Response body as bytes
+        """
+        cached = self.get(url, 'http', allow_stale=True)
+        if cached and cached.fresh:
+            return cached.body
+
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        if before_request:
+            before_request()
+        response = session.get(url, headers=headers)
+        if cached and response.status_code == 304:
+            self.touch(url, 'http')
+            return cached.body
+
+        response.raise_for_status()
+        self.put(url, response.content, 'http',
+                 etag=response.headers.get('ETag'),
+                 last_modified=response.headers.get('Last-Modified'))
+        return response.content
@@ -0,0 +1,116 @@
+# Readiness-driven page loading for Selenium
+#
+# Every browser page used to be driver.get() followed by a fixed time.sleep(delay)
+# before reading the DOM: too long for a page that renders in 300 ms, too short for
+# one that takes 3 s. load_page() waits on a concrete readiness condition instead
+# (the split table is present, the <frame> is attached, the <pre> has text), polling
+# every READY_POLL seconds up to a bounded timeout. If the condition never holds the
+# page is read anyway, as before, so a slow page degrades to the old behaviour
+# rather than failing.
+#
+# Conditions are plain callables taking the driver, so WebDriverWait and Selenium's
+# expected_conditions compose with them. Pages that legitimately lack the element
+# (a swim with no splits, an event page with no <pre>) are covered by or_settled(),
+# which also accepts a page whose document has been complete for `settle` seconds.
+#
+# Each wait's latency goes to ScrapeMetrics.observe_ready() for tuning timeouts.
+
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Seconds between readiness checks
+READY_POLL = 0.1
+
+
+def css_present(selector):
+    """Ready once an element matching the CSS selector is in the DOM."""
+    def condition(driver):
+        return bool(driver.find_elements(By.CSS_SELECTOR, selector))
+    condition.label = selector
+    return condition
+
+
+def text_present(selector):
+    """Ready once an element matching the CSS selector has non-whitespace text."""
+    def condition(driver):
+        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+        return bool(elements) and bool(elements[0].text.strip())
+    condition.label = f"{selector} text"
+    return condition
+
+
+def or_settled(condition, settle):
+    """
+    condition, or a page whose document.readyState has been 'complete' for settle seconds.
+
+    For pages that may never show the element: they cost load time + settle, not the timeout.
+    """
+    completed_at = []
+
+    def settled(driver):
+        if condition(driver):
+            return True
+        if driver.execute_script('return document.readyState') != 'complete':
+            return False
+        if not completed_at:
+            completed_at.append(time.monotonic())
+        return time.monotonic() - completed_at[0] >= settle
+    settled.label = getattr(condition, 'label', 'condition')
+    return settled
+
+
+def wait_ready(driver, ready, timeout, url=None, metrics=None):
+    """
+    Wait for a readiness condition on the current page.
+
+    Args:
+        driver: WebDriver
+        ready: Condition callable (driver -> bool)
+        timeout: Most seconds to wait
+        url: Page URL, for the metrics host label and the timeout message
+        metrics: Optional ScrapeMetrics to record the wait in
+
+    Returns:
+        True if the condition held, False if it timed out
+    """
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=READY_POLL,
+                      ignored_exceptions=(WebDriverException,)).until(ready)
+        is_ready = True
+    except TimeoutException:
+        is_ready = False
+        print(f"  Page not ready after {timeout}s ({getattr(ready, 'label', 'condition')}), reading it anyway: {url}")
+    if metrics:
+        metrics.observe_ready(getattr(ready, 'label', 'condition'), url, time.perf_counter() - start, not is_ready)
+    return is_ready
+
+
+def load_page(driver, url, ready=None, timeout=10, delay=1.0, metrics=None):
+    """
+    driver.get(url), then wait until the page is ready to read.
+
+    Args:
+        driver: WebDriver
+        url: Page URL
+        ready: Condition callable; None sleeps `delay` seconds instead (the old fixed wait)
+        timeout: Most seconds to wait for `ready`
+        delay: Fixed wait used when ready is None
+        metrics: Optional ScrapeMetrics; the fixed wait is recorded as sleep, the readiness wait
+            as a readiness latency
+
+    Returns:
+        True if the page became ready (always True for the fixed wait)
+    """
+    driver.get(url)
+    if ready is None:
+        if metrics:
+            with metrics.stage('sleep', url):
+                time.sleep(delay)
+        else:
+            time.sleep(delay)
+        return True
+    return wait_ready(driver, ready, timeout, url, metrics)
@@ -0,0 +1,171 @@
+# Process-pool parsing of HY-TEK event text
+#
+# Parsing a <pre> results page is CPU-bound pure Python, so re-parsing an archived
+# season on one thread leaves every other core idle. ParallelParser sends chunks of
+# (url, page_text) to a pool of worker processes, each running SwimMeetScraper's own
+# parsers, so the output is exactly what parse_event_page gives.
+#
+# To keep inter-process traffic small, each chunk comes back as columnar batches
+# (column names once, then one list of values per column) instead of a list of dicts
+# that repeats every key on every row.
+#
+#     parser = ParallelParser(workers=8)
+#     frames = parser.parse_frames(texts_from_archive('ncaa_2025.swimarchive'))
+#     frames['individual'], frames['relay'], frames['diving'], frames['splits']
+
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from split_table import splits_frame
+from swim_times import add_centisecond_columns
+
+# One event's place in a batch: its rows are rows[start:stop] of the event_type batch
+EventSpan = namedtuple('EventSpan', ['url', 'event_number', 'event_name', 'event_type', 'start', 'stop'])
+
+# Parsed chunk: events is a list of EventSpan, batches maps event_type (and 'splits' for
+# long-format split rows) to a (columns, values) columnar batch
+ParsedChunk = namedtuple('ParsedChunk', ['events', 'batches'])
+
+_worker_scraper = None
+
+
+def _init_worker(split_format, quiet):
+    """Pool initializer: one parser per worker process."""
+    global _worker_scraper
+    from swim_meet_data import SwimMeetScraper
+    _worker_scraper = SwimMeetScraper(split_format=split_format)
+    if quiet:
+        # The parsers print progress for every result
+        sys.stdout = open(os.devnull, 'w')
+
+
+def to_columns(rows):
+    """
+    List of dicts -> columnar batch.
+
+    Returns:
+        (columns, values): column names in first-seen order, and one list per column
+    """
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    return columns, [[row.get(column) for row in rows] for column in columns]
+
+
+def from_columns(batch):
+    """Columnar batch -> DataFrame."""
+    columns, values = batch
+    return pd.DataFrame(dict(zip(columns, values)), columns=columns)
+
+
+def parse_chunk(items, scraper=None):
+    """
+    Parse a chunk of event pages (runs inside a worker process).
+
+    Args:
+        items: list of (url, page_text, meet_name, meet_url); meet_name/meet_url may be None
+        scraper: SwimMeetScraper to parse with (default: this worker's)
+
+    Returns:
+        ParsedChunk
+    """
+    scraper = scraper or _worker_scraper
+    rows = {}
+    split_rows = [] if scraper.split_format == 'long' else None
+    events = []
+    for url, page_text, meet_name, meet_url in items:
+        try:
+            results, event_type, event_number, event_name = scraper._parse_event(
+                url, meet_name, meet_url, split_rows, page_text=page_text)
+        except Exception as e:
+            print(f"Error parsing {url}: {e}")
+            continue
+        if not results:
+            continue
+        batch_rows = rows.setdefault(event_type, [])
+        events.append(EventSpan(url, event_number, event_name, event_type,
+                                len(batch_rows), len(batch_rows) + len(results)))
+        batch_rows.extend(results)
+
+    batches = {event_type: to_columns(type_rows) for event_type, type_rows in rows.items()}
+    if split_rows:
+        batches['splits'] = to_columns(split_rows)
+    return ParsedChunk(events, batches)
+
+
+def texts_from_archive(path):
+    """
+    (url, page_text, None, None) for every <pre> text recorded in a ResponseArchive.
+
+    meet_name is read from each page and meet_url defaults to the event URL, as in parse_event_page.
+    """
+    from response_archive import ResponseArchive
+    archive = ResponseArchive(path, 'replay')
+    try:
+        for url in archive.index.get('pre', {}):
+            yield url, archive.read_text(url, 'pre'), None, None
+    finally:
+        archive.close()
+
+
+class ParallelParser:
+    def __init__(self, workers=None, chunksize=8, split_format='wide', quiet=True):
+        """
+        Args:
+            workers: Worker processes (default: one per CPU)
+            chunksize: Event pages sent to a worker at a time
+            split_format: 'wide' or 'long', as for SwimMeetScraper
+            quiet: Silence the parsers' per-result printing in the workers
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.split_format = split_format
+        self.quiet = quiet
+
+    def _chunks(self, items):
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= self.chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def parse(self, items):
+        """
+        Parse event pages across the process pool.
+
+        Args:
+            items: Iterable of (url, page_text, meet_name, meet_url)
+
+        Yields:
+            ParsedChunk per chunk, in input order
+        """
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.split_format, self.quiet)) as pool:
+            yield from pool.map(parse_chunk, self._chunks(items))
+
+    def parse_frames(self, items):
+        """
+        Parse event pages and assemble the usual DataFrames.
+
+        Returns:
+            dict with 'relay', 'individual', 'diving' DataFrames (with <col>_cs time columns)
+            and, for split_format='long', the typed 'splits' table
+        """
+        parts = {'relay': [], 'individual': [], 'diving': [], 'splits': []}
+        for chunk in self.parse(items):
+            for kind, batch in chunk.batches.items():
+                parts[kind].append(from_columns(batch))
+
+        frames = {}
+        for kind in ('relay', 'individual', 'diving'):
+            df = pd.concat(parts[kind], ignore_index=True) if parts[kind] else pd.DataFrame()
+            frames[kind] = add_centisecond_columns(df)
+        if self.split_format == 'long':
+            splits = pd.concat(parts['splits'], ignore_index=True) if parts['splits'] else pd.DataFrame()
+            frames['splits'] = splits_frame(splits)
+        return frames
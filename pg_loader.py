@@ -0,0 +1,242 @@
+# Bulk loader for the PostgreSQL "AllResults" table
+#
+# Rows go in a batch at a time: COPY into a temporary staging table, then one
+# set-based INSERT ... ON CONFLICT upsert keyed on (meet_url, event_number, "Name", "Order").
+# Re-loading a meet updates its rows instead of duplicating them.
+#
+# Connection settings come from the environment, never from source:
+#   DATABASE_URL                      - full libpq URL/DSN, if set
+#   PGHOST, PGPORT, PGDATABASE, PGUSER,
+#   PGPASSWORD, PGSSLMODE, ...        - standard libpq variables, used when DATABASE_URL is not set
+
+import io
+import os
+from contextlib import contextmanager
+
+import pandas as pd
+import psycopg2
+from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
+
+from swim_times import to_centiseconds
+
+TABLE = 'AllResults'
+KEY_COLUMNS = ['meet_url', 'event_number', 'Name', 'Order']
+
+# Staging columns, in COPY order. Times are staged as integer centiseconds and
+# converted to the table's types in the upsert.
+STAGE_COLUMNS = ['meet_name', 'meet_url', 'event_number', 'event_name', 'is_relay',
+                 'team_name', 'name', 'order', 'split_cs', 'leg_cs', 'cumulative_cs']
+
+_CREATE_STAGE = """
+    CREATE TEMPORARY TABLE IF NOT EXISTS all_results_stage (
+        meet_name text,
+        meet_url text,
+        event_number integer,
+        event_name text,
+        is_relay boolean,
+        team_name text,
+        name text,
+        "order" integer,
+        split_cs integer,
+        leg_cs integer,
+        cumulative_cs integer
+    ) ON COMMIT DELETE ROWS
+"""
+
+# DISTINCT ON keeps one row per key, since ON CONFLICT can't touch the same row twice in one statement
+_UPSERT = """
+    INSERT INTO {table}
+        (meet_name, meet_url, event_number, event_name, is_relay,
+         "Team Name", "Name", "Order", "Split", "Leg", "Cumulative")
+    SELECT DISTINCT ON (meet_url, event_number, name, "order")
+        meet_name, meet_url, event_number, event_name, is_relay,
+        team_name, name, "order",
+        split_cs / 100.0, leg_cs / 100.0, make_interval(secs => cumulative_cs / 100.0)
+    FROM all_results_stage
+    ORDER BY meet_url, event_number, name, "order"
+    ON CONFLICT (meet_url, event_number, "Name", "Order") DO UPDATE SET
+        meet_name = EXCLUDED.meet_name,
+        event_name = EXCLUDED.event_name,
+        is_relay = EXCLUDED.is_relay,
+        "Team Name" = EXCLUDED."Team Name",
+        "Split" = EXCLUDED."Split",
+        "Leg" = EXCLUDED."Leg",
+        "Cumulative" = EXCLUDED."Cumulative"
+"""
+
+
+def connection_dsn():
+    """
+    The DSN to connect with: DATABASE_URL, or '' so libpq reads PGHOST/PGUSER/... itself.
+    """
+    return os.environ.get('DATABASE_URL', '')
+
+
+def _centiseconds(df, column):
+    """Centiseconds for a time column, reusing the <column>_cs companion if the scraper added it."""
+    if f'{column}_cs' in df.columns:
+        return df[f'{column}_cs'].astype('Int32')
+    if column in df.columns:
+        return to_centiseconds(df[column])
+    return pd.Series(pd.NA, index=df.index, dtype='Int32')
+
+
+def stage_frame(df, event_type):
+    """
+    Map a SwimMeetScraper results DataFrame onto the staging columns.
+
+    Relay rows keep their per-leg Split/Leg/Cumulative. Individual rows are loaded with
+    Order 0, School as the team and the final time as Cumulative.
+
+    Args:
+        df: Relay or individual results (scrape_entire_meet sheets or parse_event_page output)
+        event_type: 'relay' or 'individual'
+
+    Returns:
+        DataFrame with STAGE_COLUMNS
+    """
+    stage = pd.DataFrame({
+        'meet_name': df['meet_name'],
+        'meet_url': df['meet_url'],
+        'event_number': pd.to_numeric(df['event_number'], errors='coerce').astype('Int32'),
+        'event_name': df['event_name'],
+        'is_relay': event_type == 'relay',
+        'name': df['Name'],
+    }, index=df.index)
+
+    if event_type == 'relay':
+        stage['team_name'] = df['Team Name']
+        stage['order'] = pd.to_numeric(df['Order'], errors='coerce').astype('Int32')
+        stage['split_cs'] = _centiseconds(df, 'Split')
+        stage['leg_cs'] = _centiseconds(df, 'Leg')
+        stage['cumulative_cs'] = _centiseconds(df, 'Cumulative')
+    else:
+        stage['team_name'] = df['School'] if 'School' in df.columns else None
+        stage['order'] = 0
+        stage['split_cs'] = pd.Series(pd.NA, index=df.index, dtype='Int32')
+        stage['leg_cs'] = pd.Series(pd.NA, index=df.index, dtype='Int32')
+        stage['cumulative_cs'] = _centiseconds(df, 'Finals_Time')
+
+    return stage[STAGE_COLUMNS]
+
+
+class ResultsLoader:
+    def __init__(self, dsn=None, min_connections=1, max_connections=4, table=TABLE, batch_rows=5000,
+                 ensure_key=True):
+        """
+        Pooled bulk loader for "AllResults".
+
+        Args:
+            dsn: Connection string (None reads the environment, see connection_dsn())
+            min_connections, max_connections: Connection pool size
+            table: Target table name
+            batch_rows: Rows per COPY/upsert batch in load_records()
+            ensure_key: Create the unique index the upsert needs, if missing
+        """
+        self.table = table
+        self.batch_rows = batch_rows
+        self.pool = ThreadedConnectionPool(min_connections, max_connections,
+                                           connection_dsn() if dsn is None else dsn)
+        self.rows_loaded = 0
+        if ensure_key:
+            self.ensure_key()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection; commits on success, rolls back on error."""
+        conn = self.pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+
+    def ensure_key(self):
+        """Create the unique index on (meet_url, event_number, "Name", "Order") used by ON CONFLICT."""
+        with self.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(sql.SQL('CREATE UNIQUE INDEX IF NOT EXISTS {index} ON {table} ({columns})').format(
+                index=sql.Identifier(f'{self.table}_result_key'),
+                table=sql.Identifier(self.table),
+                columns=sql.SQL(', ').join(sql.Identifier(column) for column in KEY_COLUMNS)))
+
+    def load_stage(self, stage):
+        """
+        COPY staged rows into the temporary table and upsert them in one transaction.
+
+        Args:
+            stage: DataFrame with STAGE_COLUMNS (see stage_frame())
+
+        Returns:
+            Number of rows loaded
+        """
+        if stage.empty:
+            return 0
+
+        buffer = io.StringIO()
+        # CSV format: empty unquoted fields are NULL
+        stage.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+
+        with self.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(_CREATE_STAGE)
+            cursor.copy_expert(
+                sql.SQL('COPY all_results_stage ({columns}) FROM STDIN WITH (FORMAT csv)').format(
+                    columns=sql.SQL(', ').join(sql.Identifier(column) for column in STAGE_COLUMNS)),
+                buffer)
+            cursor.execute(sql.SQL(_UPSERT).format(table=sql.Identifier(self.table)))
+
+        self.rows_loaded += len(stage)
+        return len(stage)
+
+    def load_frames(self, relay_df=None, individual_df=None, diving_df=None):
+        """
+        Load the DataFrames SwimMeetScraper produces.
+
+        "AllResults" has no column for diving scores, so diving results are not loaded.
+
+        Returns:
+            Number of rows loaded
+        """
+        loaded = 0
+        if relay_df is not None and not relay_df.empty:
+            loaded += self.load_stage(stage_frame(relay_df, 'relay'))
+        if individual_df is not None and not individual_df.empty:
+            loaded += self.load_stage(stage_frame(individual_df, 'individual'))
+        if diving_df is not None and not diving_df.empty:
+            print(f"Skipping {len(diving_df)} diving results (no score column in \"{self.table}\")")
+        return loaded
+
+    def load_records(self, event_records):
+        """
+        Load a stream of EventRecords (SwimMeetScraper.iter_meet_results) in batches of batch_rows.
+
+        Returns:
+            Number of rows loaded
+        """
+        loaded = 0
+        pending = {'relay': [], 'individual': []}
+        for records in event_records:
+            if records.event_type not in pending:
+                continue
+            pending[records.event_type].extend(records.results)
+            if len(pending[records.event_type]) >= self.batch_rows:
+                loaded += self.load_stage(stage_frame(pd.DataFrame(pending[records.event_type]), records.event_type))
+                pending[records.event_type] = []
+
+        for event_type, rows in pending.items():
+            if rows:
+                loaded += self.load_stage(stage_frame(pd.DataFrame(rows), event_type))
+        return loaded
+
+    def close(self):
+        self.pool.closeall()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
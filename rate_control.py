@@ -0,0 +1,298 @@
+# Adaptive per-host request pacing
+#
+# The scrapers used to sleep a fixed delay before every request (and 8-14 random
+# seconds before every SwimCloud split page), whatever the server was doing and
+# however long the previous page took to parse. RateController paces each host
+# instead:
+#   - a token bucket per host, refilled at `rate` requests/second: a request only
+#     waits for what is left of its interval, so time already spent parsing,
+#     rendering or writing counts against the budget instead of stacking on top
+#   - AIMD on the rate: every healthy response adds additive_step (up to max_rate,
+#     the polite ceiling); a 429 or 5xx multiplies it by backoff, and a response
+#     much slower than the host's usual latency slows it down a little
+#   - Retry-After (seconds or an HTTP date) holds the host until then
+#   - robots.txt: Disallow'd URLs raise RobotsDisallowed, and a Crawl-delay or
+#     Request-rate lowers the ceiling for that host. It is read once per host; requests
+#     to that host wait for it (wait_async reads it in a worker thread, off the event loop)
+#
+# requests sessions report every response through response_hook; Chrome renders and
+# aiohttp requests call feedback() themselves.
+
+import asyncio
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+# Responses that mean "slow down" (and are worth retrying after the wait)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+# Titles of the block / challenge pages a rendered page gets instead of its content
+_BLOCKED_TITLE_RE = re.compile(r'<title[^>]*>[^<]*(too many requests|rate limit|access denied|just a moment|attention required)',
+                               re.IGNORECASE)
+
+
+def looks_blocked(html):
+    """True if a rendered page looks like a rate-limit, block or bot-challenge page."""
+    return bool(_BLOCKED_TITLE_RE.search(html))
+
+
+class RobotsDisallowed(Exception):
+    """The host's robots.txt does not allow this URL."""
+
+
+def retry_after_seconds(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRate:
+    """Token bucket plus AIMD rate for one host."""
+
+    def __init__(self, max_rate, min_rate, additive_step, backoff, latency_factor, burst):
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.additive_step = additive_step
+        self.backoff = backoff
+        self.latency_factor = latency_factor
+        self.burst = burst
+
+        self.rate = max_rate
+        self.next_slot = 0.0  # when the bucket is next full enough for a request (monotonic)
+        self.blocked_until = 0.0  # Retry-After
+        self.latency = {}  # kind ('http', 'render') -> running latency baseline (seconds)
+
+        self.requests = 0
+        self.throttled = 0
+        self.slowdowns = 0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Claim the next request slot; returns the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate
+            start = max(now, self.next_slot - (self.burst - 1) * interval, self.blocked_until)
+            self.next_slot = max(self.next_slot, start) + interval
+            self.requests += 1
+            return start - now
+
+    def feedback(self, status=None, latency=None, retry_after=None, ok=None, kind='http'):
+        """
+        Adjust the rate after a response.
+
+        Args:
+            status: HTTP status (None for a browser render)
+            latency: Seconds the request or render took
+            retry_after: Seconds the server asked us to wait
+            ok: False for a failure without a status (e.g. a render with no results table)
+            kind: Which latency baseline to compare with ('http' or 'render')
+        """
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+            baseline = self.latency.get(kind)
+            throttled = status in RETRY_STATUSES or ok is False
+            if throttled:
+                self.rate = max(self.min_rate, self.rate * self.backoff)
+                self.throttled += 1
+            elif latency is not None and baseline and latency > self.latency_factor * baseline:
+                self.rate = max(self.min_rate, self.rate * 0.75)
+                self.slowdowns += 1
+            else:
+                self.rate = min(self.max_rate, self.rate + self.additive_step)
+                if latency is not None:
+                    self.latency[kind] = latency if baseline is None else 0.8 * baseline + 0.2 * latency
+                return
+
+            # A lower rate applies to the very next request, not the one after it
+            self.next_slot = max(self.next_slot, now + 1.0 / self.rate)
+
+    def as_dict(self):
+        return {'rate': round(self.rate, 4), 'max_rate': self.max_rate, 'requests': self.requests,
+                'throttled': self.throttled, 'slowdowns': self.slowdowns,
+                'latency': {kind: round(seconds, 3) for kind, seconds in self.latency.items()}}
+
+
+class RateController:
+    def __init__(self, max_rate=1.0, min_rate=0.02, additive_step=0.05, backoff=0.5, latency_factor=3.0,
+                 burst=1, jitter=0.1, robots=True, session=None, metrics=None):
+        """
+        Args:
+            max_rate: Polite ceiling, requests per second per host
+            min_rate: Floor the rate never backs off below
+            additive_step: Requests/second added after each healthy response
+            backoff: Rate multiplier after a 429 or 5xx
+            latency_factor: A response this many times slower than the host's usual latency slows the rate
+            burst: Requests a host may take back to back after an idle spell (1: always spaced)
+            jitter: Random extra fraction added to each wait (so workers don't fire in lockstep)
+            robots: Fetch and obey each host's robots.txt
+            session: requests.Session used to fetch robots.txt (its User-Agent is matched against it)
+            metrics: Optional ScrapeMetrics; throttled responses are counted there
+        """
+        if not 0 < min_rate <= max_rate:
+            raise ValueError(f"Need 0 < min_rate <= max_rate (got {min_rate}, {max_rate})")
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.additive_step = additive_step
+        self.backoff = backoff
+        self.latency_factor = latency_factor
+        self.burst = burst
+        self.jitter = jitter
+        self.robots = robots
+        self.session = session
+        self.metrics = metrics
+
+        self.hosts = {}
+        self._robots = {}  # host -> RobotFileParser, or None when there is no usable robots.txt
+        self._robots_loaded = {}  # host -> threading.Event, set once its robots.txt has been read
+        self._lock = threading.Lock()
+
+    def _claim_host(self, host):
+        """
+        HostRate for a host (created at max_rate on first use) and its robots.txt state.
+
+        Returns:
+            (host_rate, loaded, fresh): fresh is True for the one caller that must read robots.txt
+            and then set loaded; everyone else waits for loaded
+        """
+        with self._lock:
+            if host not in self.hosts:
+                self.hosts[host] = HostRate(self.max_rate, self.min_rate, self.additive_step,
+                                            self.backoff, self.latency_factor, self.burst)
+            fresh = host not in self._robots_loaded
+            if fresh:
+                self._robots_loaded[host] = threading.Event()
+                if not self.robots:
+                    self._robots_loaded[host].set()
+                    fresh = False
+            return self.hosts[host], self._robots_loaded[host], fresh
+
+    def host(self, url):
+        """HostRate for a URL's host (created at max_rate on first use), once its robots.txt is read."""
+        parts = urlsplit(url)
+        host_rate, loaded, fresh = self._claim_host(parts.netloc)
+        if fresh:
+            try:
+                self._load_robots(parts, host_rate)
+            finally:
+                loaded.set()
+        else:
+            loaded.wait()
+        return host_rate
+
+    async def host_async(self, url):
+        """host() for asyncio code: robots.txt is read in a worker thread, so the event loop keeps running."""
+        parts = urlsplit(url)
+        host_rate, loaded, fresh = self._claim_host(parts.netloc)
+        if fresh:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._load_robots, parts, host_rate)
+            finally:
+                loaded.set()
+        else:
+            # Another coroutine or thread is reading it; poll rather than tie up an executor thread
+            while not loaded.is_set():
+                await asyncio.sleep(0.05)
+        return host_rate
+
+    # ---------------- ROBOTS ---------------- #
+
+    def _user_agent(self):
+        return self.session.headers.get('User-Agent', '*') if self.session else '*'
+
+    def _load_robots(self, parts, host_rate):
+        """Fetch a host's robots.txt; a missing or unreadable one allows everything."""
+        robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+        parser = RobotFileParser(robots_url)
+        try:
+            response = (self.session or requests).get(robots_url, timeout=10)
+            status, text = response.status_code, response.text
+        except Exception as e:
+            print(f"Could not read {robots_url} ({e}); treating every page as allowed")
+            return
+
+        if status in (401, 403):
+            parser.disallow_all = True
+        elif status >= 400:
+            return
+        else:
+            parser.parse(text.splitlines())
+
+        agent = self._user_agent()
+        delay = parser.crawl_delay(agent)
+        request_rate = parser.request_rate(agent)
+        ceiling = host_rate.max_rate
+        if delay:
+            ceiling = min(ceiling, 1.0 / float(delay))
+        if request_rate:
+            ceiling = min(ceiling, request_rate.requests / request_rate.seconds)
+        if ceiling < host_rate.max_rate:
+            print(f"robots.txt for {parts.netloc} limits crawling to {ceiling:.3g} requests/s")
+            host_rate.max_rate = ceiling
+            host_rate.min_rate = min(host_rate.min_rate, ceiling)
+            host_rate.rate = min(host_rate.rate, ceiling)
+        self._robots[parts.netloc] = parser
+
+    def allowed(self, url):
+        parser = self._robots.get(urlsplit(url).netloc)
+        return parser is None or parser.can_fetch(self._user_agent(), url)
+
+    # ---------------- PACING ---------------- #
+
+    def _delay(self, url, host_rate=None):
+        host_rate = host_rate or self.host(url)
+        if not self.allowed(url):
+            raise RobotsDisallowed(f"robots.txt disallows {url}")
+        delay = host_rate.reserve()
+        if delay > 0 and self.jitter:
+            delay *= 1 + random.uniform(0, self.jitter)
+        return delay
+
+    def wait(self, url):
+        """Block until the URL's host may take another request."""
+        delay = self._delay(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, url):
+        """wait() for asyncio code."""
+        delay = self._delay(url, await self.host_async(url))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def feedback(self, url, status=None, latency=None, headers=None, ok=None, kind='http'):
+        """Report how a request to url went (see HostRate.feedback)."""
+        retry_after = retry_after_seconds(headers.get('Retry-After')) if headers else None
+        host_rate = self.host(url)
+        host_rate.feedback(status, latency, retry_after, ok, kind)
+        if self.metrics and (status in RETRY_STATUSES or ok is False):
+            self.metrics.count('throttled_responses')
+        if status in RETRY_STATUSES or ok is False:
+            print(f"  Slowing down for {urlsplit(url).netloc}: {status or 'bad page'}, "
+                  f"now {host_rate.rate:.3g} requests/s" + (f", retry after {retry_after:.0f}s" if retry_after else ""))
+
+    def response_hook(self, response, *args, **kwargs):
+        """requests 'response' hook: feeds every response of a session into the controller."""
+        if not response.url.endswith('/robots.txt'):
+            self.feedback(response.url, response.status_code, response.elapsed.total_seconds(), response.headers)
+
+    def summary(self):
+        """Per-host rate state, e.g. for the end-of-run report."""
+        return {host: host_rate.as_dict() for host, host_rate in self.hosts.items()}
@@ -0,0 +1,219 @@
+# Record/replay archive for fully offline scraping runs
+#
+# In 'record' mode every page body the scrapers see (requests responses,
+# Selenium page sources, HY-TEK session lists and <pre> text) is written into
+# a single zip file. index.json inside the zip maps (kind, url) to its entry.
+# In 'replay' mode the same pipeline is served entirely from that file: no
+# network, no browser, and a page missing from the archive is an error rather
+# than a silent fetch.
+#
+# A zip is only readable once close() writes its central directory, and long recordings
+# are often killed before that. So every recorded page is also appended (and flushed) to
+# an index log next to the archive, <path>.index.jsonl. Replaying an archive that was
+# never closed recovers it first: the page entries are read back from their local zip
+# headers, matched with the index log, and rewritten into a complete archive (temp file,
+# then rename). Only a page being written at the moment of the crash is lost.
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zipfile
+import zlib
+
+INDEX_NAME = 'index.json'
+# Local file header: signature, version, flags, method, time, date, crc, sizes, name/extra lengths
+LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+class ArchiveMiss(KeyError):
+    """Raised in replay mode when a page was never recorded."""
+
+
+class ResponseArchive:
+    def __init__(self, path, mode='record'):
+        """
+        Open an archive file.
+
+        Args:
+            path: Archive file (a zip, e.g. 'ncaa_2025.swimarchive')
+            mode: 'record' to create/overwrite the archive, 'replay' to serve pages from it
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown archive mode '{mode}' (expected 'record' or 'replay')")
+
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+
+        self.index_log_path = path + '.index.jsonl'
+
+        if mode == 'record':
+            self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+            self._index_log = open(self.index_log_path, 'w', encoding='utf-8')
+            self.index = {}
+            print(f"Recording every fetched page to archive: {path}")
+        else:
+            if not self._complete(path):
+                recover(path)
+            self._zip = zipfile.ZipFile(path, 'r')
+            self.index = json.loads(self._zip.read(INDEX_NAME))
+            print(f"Replaying {sum(len(urls) for urls in self.index.values())} archived pages from: {path}")
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    def write(self, url, body, kind='http'):
+        """Record a page body (bytes or str). Recording the same (kind, url) again replaces it."""
+        if self.mode != 'record':
+            return
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            recorded = self.index.get(kind, {}).get(url)
+            if recorded and recorded['sha256'] == digest:
+                return
+
+            # Entry names are unique per write; the index points at the latest one
+            entry = f"pages/{hashlib.sha1(f'{kind} {url}'.encode('utf-8')).hexdigest()}-{len(self._zip.filelist)}"
+            self._zip.writestr(entry, body)
+            record = {
+                'entry': entry,
+                'sha256': digest,
+                'size': len(body),
+                'recorded_at': time.time(),
+            }
+            self.index.setdefault(kind, {})[url] = record
+
+            # Page first, then its index line, both out of Python's buffers: a crash leaves
+            # at worst an entry without an index line, which recovery ignores
+            self._zip.fp.flush()
+            self._index_log.write(json.dumps({'kind': kind, 'url': url, **record}) + '\n')
+            self._index_log.flush()
+
+    def write_text(self, url, text, kind):
+        self.write(url, text.encode('utf-8'), kind)
+
+    def has(self, url, kind='http'):
+        return url in self.index.get(kind, {})
+
+    def read(self, url, kind='http'):
+        """
+        Read a recorded page body.
+
+        Raises:
+            ArchiveMiss: if the page was not recorded
+        """
+        try:
+            entry = self.index[kind][url]['entry']
+        except KeyError:
+            raise ArchiveMiss(f"{kind} page not in archive {self.path}: {url}")
+        with self._lock:
+            return self._zip.read(entry)
+
+    def read_text(self, url, kind):
+        return self.read(url, kind).decode('utf-8')
+
+    def close(self):
+        """Finish the archive. In record mode this writes the index, so always close a recording."""
+        with self._lock:
+            if self._zip is None:
+                return
+            if self.mode == 'record':
+                self._zip.writestr(INDEX_NAME, json.dumps(self.index))
+                print(f"Archived {sum(len(urls) for urls in self.index.values())} pages to {self.path}")
+            self._zip.close()
+            self._zip = None
+            if self.mode == 'record':
+                # The archive is complete; its index log is no longer needed
+                self._index_log.close()
+                os.remove(self.index_log_path)
+
+    @staticmethod
+    def _complete(path):
+        """True if the archive is a readable zip with its index (it was closed)."""
+        try:
+            with zipfile.ZipFile(path, 'r') as archive:
+                return INDEX_NAME in archive.namelist()
+        except zipfile.BadZipFile:
+            return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _local_entries(path):
+    """
+    Read every page entry of a zip from its local headers (no central directory needed).
+
+    Returns:
+        dict of entry name -> body; stops at the first truncated or unreadable entry
+    """
+    entries = {}
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(LOCAL_HEADER.size)
+            if len(header) < LOCAL_HEADER.size:
+                break
+            signature, _, flags, method, _, _, crc, compressed_size, _, name_length, extra_length = \
+                LOCAL_HEADER.unpack(header)
+            if signature != b'PK\x03\x04' or flags & 0x08:
+                break  # central directory reached, or sizes we cannot know up front
+            name = f.read(name_length).decode('utf-8')
+            f.seek(extra_length, os.SEEK_CUR)
+            data = f.read(compressed_size)
+            if len(data) < compressed_size:
+                break
+            try:
+                body = zlib.decompress(data, -15) if method == zipfile.ZIP_DEFLATED else data
+            except zlib.error:
+                break
+            if zlib.crc32(body) != crc:
+                break
+            entries[name] = body
+    return entries
+
+
+def recover(path):
+    """
+    Rebuild an archive whose recording was interrupted before close(), from its index log.
+
+    Returns:
+        Number of pages recovered
+    """
+    index_log_path = path + '.index.jsonl'
+    if not os.path.exists(index_log_path):
+        raise zipfile.BadZipFile(f"Archive {path} is incomplete and has no index log to recover it from")
+
+    entries = _local_entries(path)
+    index = {}
+    with open(index_log_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break  # the line being written when the recording died
+            if record['entry'] in entries:
+                kind, url = record.pop('kind'), record.pop('url')
+                index.setdefault(kind, {})[url] = record
+
+    temp_path = path + '.recovering'
+    with zipfile.ZipFile(temp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for urls in index.values():
+            for record in urls.values():
+                archive.writestr(record['entry'], entries[record['entry']])
+        archive.writestr(INDEX_NAME, json.dumps(index))
+    os.replace(temp_path, path)
+    os.remove(index_log_path)
+
+    pages = sum(len(urls) for urls in index.values())
+    print(f"Recovered {pages} pages from interrupted recording: {path}")
+    return pages
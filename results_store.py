@@ -0,0 +1,497 @@
+# Embedded SQLite store for scraped results
+#
+# A normalized, indexed alternative to re-reading the Excel workbooks:
+#   meets    - one row per meet (SwimCloud meet page / HY-TEK meet directory)
+#   events   - one row per event page, with distance / stroke / course parsed from the name
+#   teams, swimmers (with their SwimCloud ids, when SwimCloud results carry them)
+#   results  - one row per swim (HY-TEK relays: one row per leg)
+#   splits   - one row per split of a result, times in integer centiseconds
+#
+# Both scrapers write through write_records(), which takes the EventRecords stream from
+# SwimCloudScraper.iter_team_results() or SwimMeetScraper.iter_meet_results():
+#
+#     with ResultsStore('swim.sqlite') as store:
+#         store.write_records(meet_scraper.iter_meet_results(index_url))
+#         store.write_records(cloud_scraper.iter_team_results(team_id), team_name='Texas')
+#         store.fastest(100, 'Freestyle', season='2024-2025')
+#
+# Writes are batched (one transaction per batch of events) and re-writing an event
+# replaces its rows, so a meet can be loaded again after a re-scrape.
+
+import re
+import sqlite3
+from datetime import date
+
+import pandas as pd
+
+from hytek_splits import event_distance_and_course
+from split_table import split_rows
+from swim_times import to_centiseconds
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meets (
+        id INTEGER PRIMARY KEY,
+        url TEXT NOT NULL UNIQUE,
+        name TEXT,
+        source TEXT,
+        meet_date TEXT,
+        season TEXT
+    );
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY,
+        meet_id INTEGER NOT NULL REFERENCES meets(id),
+        key TEXT NOT NULL,
+        event_number TEXT,
+        name TEXT,
+        url TEXT,
+        event_type TEXT,
+        is_relay INTEGER,
+        distance INTEGER,
+        stroke TEXT,
+        course TEXT,
+        UNIQUE (meet_id, key)
+    );
+    CREATE TABLE IF NOT EXISTS teams (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        swimcloud_id TEXT
+    );
+    CREATE TABLE IF NOT EXISTS swimmers (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        team_id INTEGER REFERENCES teams(id),
+        swimcloud_id TEXT
+    );
+    CREATE TABLE IF NOT EXISTS results (
+        id INTEGER PRIMARY KEY,
+        event_id INTEGER NOT NULL REFERENCES events(id),
+        entry TEXT NOT NULL,
+        relay_order INTEGER NOT NULL DEFAULT 0,
+        swimmer_id INTEGER REFERENCES swimmers(id),
+        team_id INTEGER REFERENCES teams(id),
+        rank INTEGER,
+        year TEXT,
+        time TEXT,
+        time_cs INTEGER,
+        reaction_cs INTEGER,
+        score REAL,
+        time_url TEXT,
+        UNIQUE (event_id, entry, relay_order)
+    );
+    CREATE TABLE IF NOT EXISTS splits (
+        result_id INTEGER NOT NULL REFERENCES results(id) ON DELETE CASCADE,
+        split_index INTEGER NOT NULL,
+        distance INTEGER,
+        split_cs INTEGER,
+        cumulative_cs INTEGER,
+        swimmer_id INTEGER REFERENCES swimmers(id),
+        PRIMARY KEY (result_id, split_index)
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_meets_season ON meets (season);
+    CREATE INDEX IF NOT EXISTS idx_events_meet ON events (meet_id);
+    CREATE INDEX IF NOT EXISTS idx_events_race ON events (distance, stroke, course, is_relay);
+    CREATE INDEX IF NOT EXISTS idx_swimmers_name ON swimmers (name);
+    CREATE INDEX IF NOT EXISTS idx_results_swimmer ON results (swimmer_id);
+    CREATE INDEX IF NOT EXISTS idx_results_event_time ON results (event_id, time_cs);
+    CREATE INDEX IF NOT EXISTS idx_splits_swimmer ON splits (swimmer_id);
+"""
+
+STROKES = {
+    'freestyle': 'Freestyle', 'free': 'Freestyle',
+    'backstroke': 'Backstroke', 'back': 'Backstroke',
+    'breaststroke': 'Breaststroke', 'breast': 'Breaststroke',
+    'butterfly': 'Butterfly', 'fly': 'Butterfly',
+    'individual medley': 'IM', 'im': 'IM',
+    'medley': 'Medley',
+    'diving': 'Diving',
+}
+_STROKE_RE = re.compile(r'\b(' + '|'.join(sorted(STROKES, key=len, reverse=True)) + r')\b', re.IGNORECASE)
+# SwimCloud style "100 Y Free" / "200 L Back"
+_SHORT_COURSE_RE = re.compile(r'\b(\d+)\s+(Y|S|L)\b')
+_SHORT_COURSES = {'Y': 'SCY', 'S': 'SCM', 'L': 'LCM'}
+# HY-TEK event pages are named <yymmdd><session><event>.htm
+_HYTEK_DATE_RE = re.compile(r'/(\d{2})(\d{2})(\d{2})[A-Z]\d+\.htm$', re.IGNORECASE)
+
+
+def parse_race(event_name):
+    """
+    Distance, stroke and course from an event name ("Men 100 Yard Freestyle", "100 Y Free").
+
+    Returns:
+        (distance, stroke, course); unknown parts are None
+    """
+    distance, course = event_distance_and_course(event_name)
+    if distance is None:
+        match = _SHORT_COURSE_RE.search(event_name or '')
+        if match:
+            distance, course = int(match.group(1)), _SHORT_COURSES[match.group(2)]
+    match = _STROKE_RE.search(event_name or '')
+    stroke = STROKES[match.group(1).lower()] if match else None
+    return distance, stroke, course
+
+
+def season_for(day):
+    """Season label for a date: August starts a new season ("2024-2025")."""
+    start = day.year if day.month >= 8 else day.year - 1
+    return f'{start}-{start + 1}'
+
+
+def _hytek_meet(page_url):
+    """(meet directory URL, meet date) for a HY-TEK event page URL."""
+    meet_url = page_url.rsplit('/', 1)[0] + '/'
+    match = _HYTEK_DATE_RE.search(page_url)
+    meet_date = None
+    if match:
+        try:
+            meet_date = date(2000 + int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            pass
+    return meet_url, meet_date
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float_or_none(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _centis_list(values):
+    """Centiseconds (or None) for a list of time strings, converted in one vectorized pass."""
+    return [None if pd.isna(centis) else int(centis) for centis in to_centiseconds(list(values))]
+
+
+def _wide_splits(result):
+    """(distance, split_text, cumulative_text) for the split_<n>_* columns of a HY-TEK individual result."""
+    splits = []
+    n = 1
+    while f'split_{n}_time' in result:
+        if result[f'split_{n}_time'] is not None:
+            splits.append((result.get(f'split_{n}_distance'), result[f'split_{n}_time'],
+                           result.get(f'split_{n}_cumulative')))
+        n += 1
+    return splits
+
+
+def _relay_leg_splits(result):
+    """
+    Split rows for one HY-TEK relay leg from its Leg_Splits / Leg_Distance / Cumulative columns.
+
+    Cumulative times are worked back from the leg's final cumulative time.
+    """
+    split_centis = _centis_list((result.get('Leg_Splits') or '').split())
+    if not split_centis or None in split_centis:
+        return []
+    order = _int_or_none(result.get('Order')) or 1
+    leg_distance = _int_or_none(result.get('Leg_Distance'))
+    interval = leg_distance // len(split_centis) if leg_distance else None
+
+    cumulative = _centis_list([result.get('Cumulative')])[0]
+    rows = []
+    for index, split in enumerate(split_centis, 1):
+        remaining = sum(split_centis[index:])
+        rows.append({
+            'split_index': index,
+            'distance': (order - 1) * leg_distance + index * interval if interval else None,
+            'split_cs': split,
+            'cumulative_cs': cumulative - remaining if cumulative is not None else None,
+        })
+    return rows
+
+
+class ResultsStore:
+    def __init__(self, path='swim_results.sqlite', batch_events=50):
+        """
+        Open (or create) a results database.
+
+        Args:
+            path: SQLite database file
+            batch_events: Events written per transaction by write_records()
+        """
+        self.path = path
+        self.batch_events = batch_events
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.executescript(SCHEMA)
+        self._add_swimcloud_ids()
+
+        # name/key -> id, so a batch doesn't look the same team or swimmer up again
+        self._teams = {}
+        self._swimmers = {}
+        self._meets = {}
+
+    # ---------------- WRITES ---------------- #
+
+    def _add_swimcloud_ids(self):
+        """Add the swimcloud_id columns (and their indexes) to a database created before them."""
+        for table in ('teams', 'swimmers'):
+            columns = {row[1] for row in self.conn.execute(f'PRAGMA table_info({table})')}
+            if 'swimcloud_id' not in columns:
+                self.conn.execute(f'ALTER TABLE {table} ADD COLUMN swimcloud_id TEXT')
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_swimcloud ON {table} (swimcloud_id)')
+
+    def _team_id(self, name, swimcloud_id=None):
+        if not name:
+            return None
+        if name not in self._teams:
+            self.conn.execute('INSERT OR IGNORE INTO teams (name) VALUES (?)', (name,))
+            self._teams[name] = self.conn.execute('SELECT id FROM teams WHERE name = ?', (name,)).fetchone()[0]
+        if swimcloud_id:
+            self.conn.execute('UPDATE teams SET swimcloud_id = ? WHERE id = ? AND swimcloud_id IS NULL',
+                              (swimcloud_id, self._teams[name]))
+        return self._teams[name]
+
+    def _swimmer_id(self, name, team_id, swimcloud_id=None):
+        """
+        Swimmer row id, by SwimCloud id when the result has one (two swimmers of a team can share a
+        name), else by name and team. A swimmer first stored without an id takes the id on.
+        """
+        if not name:
+            return None
+        key = ('swimcloud', swimcloud_id) if swimcloud_id else (name, team_id)
+        if key not in self._swimmers:
+            row = None
+            if swimcloud_id:
+                row = self.conn.execute('SELECT id FROM swimmers WHERE swimcloud_id = ?', (swimcloud_id,)).fetchone()
+                if row is None:
+                    row = self.conn.execute('SELECT id FROM swimmers WHERE name = ? AND team_id IS ? '
+                                            'AND swimcloud_id IS NULL', (name, team_id)).fetchone()
+                    if row is not None:
+                        self.conn.execute('UPDATE swimmers SET swimcloud_id = ? WHERE id = ?', (swimcloud_id, row[0]))
+            else:
+                row = self.conn.execute('SELECT id FROM swimmers WHERE name = ? AND team_id IS ?', key).fetchone()
+            if row is None:
+                row = (self.conn.execute('INSERT INTO swimmers (name, team_id, swimcloud_id) VALUES (?, ?, ?)',
+                                         (name, team_id, swimcloud_id)).lastrowid,)
+            self._swimmers[key] = row[0]
+        return self._swimmers[key]
+
+    def _meet_id(self, url, name, source, meet_date, season):
+        if url not in self._meets:
+            self.conn.execute("""
+                INSERT INTO meets (url, name, source, meet_date, season) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    name = excluded.name,
+                    meet_date = COALESCE(excluded.meet_date, meets.meet_date),
+                    season = COALESCE(excluded.season, meets.season)
+            """, (url, name, source, meet_date and meet_date.isoformat(), season))
+            self._meets[url] = self.conn.execute('SELECT id FROM meets WHERE url = ?', (url,)).fetchone()[0]
+        return self._meets[url]
+
+    def _event_id(self, meet_id, key, records, url):
+        distance, stroke, course = parse_race(records.event_name)
+        self.conn.execute("""
+            INSERT INTO events (meet_id, key, event_number, name, url, event_type, is_relay, distance, stroke, course)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (meet_id, key) DO UPDATE SET
+                event_number = excluded.event_number, name = excluded.name, url = excluded.url,
+                event_type = excluded.event_type, is_relay = excluded.is_relay,
+                distance = excluded.distance, stroke = excluded.stroke, course = excluded.course
+        """, (meet_id, key, str(records.event_number), records.event_name, url, records.event_type,
+              int(records.event_type == 'relay'), distance, stroke, course))
+        event_id = self.conn.execute('SELECT id FROM events WHERE meet_id = ? AND key = ?', (meet_id, key)).fetchone()[0]
+        # Re-writing an event replaces its results (and, by cascade, their splits)
+        self.conn.execute('DELETE FROM results WHERE event_id = ?', (event_id,))
+        return event_id
+
+    def _write_hytek(self, records, season):
+        meet_url, meet_date = _hytek_meet(records.meet_url)
+        if season is None and meet_date:
+            season = season_for(meet_date)
+        meet_id = self._meet_id(meet_url, records.meet_name, 'hytek', meet_date, season)
+        event_id = self._event_id(meet_id, records.meet_url, records, records.meet_url)
+
+        results = records.results
+        is_relay = records.event_type == 'relay'
+        times = _centis_list(r.get('Leg' if is_relay else 'Finals_Time') for r in results)
+        reactions = _centis_list(r.get('Reaction') for r in results)
+
+        # Long-format split rows (split_format='long'), by (Name, Order)
+        long_splits = {}
+        for row in records.splits:
+            long_splits.setdefault((row['Name'], row['Order']), []).append(row)
+
+        rows = []
+        result_splits = []
+        for result, time_cs, reaction_cs in zip(results, times, reactions):
+            team_id = self._team_id(result.get('Team Name') if is_relay else result.get('School'))
+            swimmer_id = self._swimmer_id(result.get('Name'), team_id)
+            order = _int_or_none(result.get('Order')) or 0
+            rows.append((event_id, result.get('Name'), order, swimmer_id, team_id, _int_or_none(result.get('Rank')),
+                         result.get('Year'), result.get('Leg' if is_relay else 'Finals_Time'), time_cs, reaction_cs,
+                         _float_or_none(result.get('Score')), None))
+
+            if (result.get('Name'), order) in long_splits:
+                splits = long_splits[(result.get('Name'), order)]
+            elif is_relay:
+                splits = _relay_leg_splits(result)
+            else:
+                splits = split_rows(None, None, None, None, _wide_splits(result))
+            result_splits.append([(s['split_index'], s['distance'], s['split_cs'], s['cumulative_cs'], swimmer_id)
+                                  for s in splits])
+
+        self._insert_results(rows, result_splits)
+
+    def _write_swimcloud(self, records, team_name, season):
+        season = season or records.season
+        meet_id = self._meet_id(records.meet_url, records.meet_name, 'swimcloud', None, season)
+        event_id = self._event_id(meet_id, f'{records.event_number}|{records.event_name}', records, None)
+
+        results = records.results
+        is_relay = records.event_type == 'relay'
+        times = _centis_list(r['time'] for r in results)
+
+        splits_by_url = {}
+        for split in records.splits:
+            splits_by_url.setdefault(split['time_url'], []).append(split)
+
+        rows = []
+        result_splits = []
+        for result, time_cs in zip(results, times):
+            if is_relay:
+                team_id = self._team_id(result['name'], result.get('team_id'))
+                swimmer_id = None
+            else:
+                # Older records (journaled before results carried the team) fall back to the scraped team
+                team_id = self._team_id(result.get('team') or team_name, result.get('team_id'))
+                swimmer_id = self._swimmer_id(result['name'], team_id, result.get('swimmer_id'))
+            rows.append((event_id, result['name'], 0, swimmer_id, team_id, None, None, result['time'], time_cs,
+                         None, None, result['time_url']))
+
+            splits = splits_by_url.get(result['time_url'], [])
+            split_centis = _centis_list(s['split'] for s in splits)
+            cumulative_centis = _centis_list(s['Cumulative'] for s in splits)
+            result_splits.append([
+                (index, _int_or_none(split['Distance']), split_cs, cumulative_cs,
+                 self._swimmer_id(split['Person'], team_id) if is_relay else swimmer_id)
+                for index, (split, split_cs, cumulative_cs) in enumerate(zip(splits, split_centis, cumulative_centis), 1)
+            ])
+
+        self._insert_results(rows, result_splits)
+
+    def _insert_results(self, rows, result_splits):
+        split_rows_out = []
+        for row, splits in zip(rows, result_splits):
+            # Duplicate (entry, order) on one page: keep the first, like the upsert key says
+            cursor = self.conn.execute("""
+                INSERT OR IGNORE INTO results (event_id, entry, relay_order, swimmer_id, team_id, rank, year,
+                                               time, time_cs, reaction_cs, score, time_url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, row)
+            if cursor.rowcount:
+                split_rows_out.extend((cursor.lastrowid,) + split for split in splits)
+        self.conn.executemany("""
+            INSERT OR REPLACE INTO splits (result_id, split_index, distance, split_cs, cumulative_cs, swimmer_id)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, split_rows_out)
+
+    def write_event(self, records, team_name=None, season=None):
+        """
+        Write one EventRecords (no transaction handling; see write_records).
+
+        Args:
+            records: EventRecords from either scraper
+            team_name: Team of SwimCloud individual results that don't name their own (the scraped team)
+            season: Season label such as '2024-2025' (HY-TEK meets default to the season of the page
+                date, SwimCloud meets to the season of the team results page they were listed on)
+        """
+        if not records.results:
+            return
+        if 'time_url' in records.results[0]:
+            self._write_swimcloud(records, team_name, season)
+        else:
+            self._write_hytek(records, season)
+
+    def write_records(self, event_records, team_name=None, season=None):
+        """
+        Write a stream of EventRecords, batch_events events per transaction.
+
+        Returns:
+            Number of results written
+        """
+        written = 0
+        pending = 0
+        self.conn.execute('BEGIN')
+        try:
+            for records in event_records:
+                self.write_event(records, team_name, season)
+                written += len(records.results)
+                pending += 1
+                if pending >= self.batch_events:
+                    self.conn.execute('COMMIT')
+                    self.conn.execute('BEGIN')
+                    pending = 0
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            # Cached ids may point at rolled-back rows
+            self._teams.clear()
+            self._swimmers.clear()
+            self._meets.clear()
+            raise
+        return written
+
+    # ---------------- QUERIES ---------------- #
+
+    def query(self, sql, params=()):
+        """Run a query and return a DataFrame."""
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def fastest(self, distance, stroke, course=None, season=None, limit=10):
+        """
+        Fastest individual swims of a race, e.g. fastest(100, 'Freestyle', season='2024-2025').
+
+        Returns:
+            DataFrame of swimmer, team, time, meet, event
+        """
+        return self.query("""
+            SELECT s.name AS swimmer, t.name AS team, r.time, r.time_cs, m.name AS meet, e.name AS event
+            FROM events e
+            JOIN meets m ON m.id = e.meet_id
+            JOIN results r ON r.event_id = e.id
+            LEFT JOIN swimmers s ON s.id = r.swimmer_id
+            LEFT JOIN teams t ON t.id = r.team_id
+            WHERE e.distance = ? AND e.stroke = ? AND e.is_relay = 0
+              AND (? IS NULL OR e.course = ?)
+              AND (? IS NULL OR m.season = ?)
+              AND r.time_cs IS NOT NULL
+            ORDER BY r.time_cs
+            LIMIT ?
+        """, (distance, stroke, course, course, season, season, limit))
+
+    def swims_by(self, name):
+        """
+        Every swim (individual results and relay legs) by a swimmer name, as printed by the site.
+
+        Returns:
+            DataFrame of meet, event, relay_order, time, team
+        """
+        return self.query("""
+            SELECT m.name AS meet, m.meet_date, e.name AS event, r.relay_order, r.time, r.time_cs, t.name AS team
+            FROM swimmers s
+            JOIN results r ON r.swimmer_id = s.id
+            JOIN events e ON e.id = r.event_id
+            JOIN meets m ON m.id = e.meet_id
+            LEFT JOIN teams t ON t.id = r.team_id
+            WHERE s.name = ?
+            ORDER BY m.meet_date, e.event_number
+        """, (name,))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
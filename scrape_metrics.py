@@ -0,0 +1,346 @@
+# Per-stage timing and throughput metrics for scrape runs
+#
+# Both scrapers keep a ScrapeMetrics (scraper.metrics) and time their work in stages,
+# per host:
+#   fetch  - HTTP requests (and the archive/page-cache reads that stand in for them)
+#   render - Chrome page loads
+#   parse  - BeautifulSoup / lxml / regex parsing
+#   write  - output sinks and Excel files
+#   sleep  - deliberate politeness delays
+#
+# Stage times are exclusive: a sleep taken inside a fetch (the page cache only sleeps
+# when it really goes to the network) counts as sleep, not fetch, so on one thread the
+# stages add up to the run's wall time. Each stage/host keeps a count, total seconds,
+# errors and a latency histogram with Prometheus-style cumulative buckets.
+#
+# Browser readiness waits (page_ready.py) are kept apart from the stages, as latency
+# histograms per condition and host, with the waits that timed out counted as errors;
+# they are what ready_timeout should be tuned from.
+#
+# A run's progress (meets or events done out of the total) gives a rate and an ETA.
+# With prom_path set, a Prometheus text file is rewritten every flush_interval seconds
+# during the run (point node_exporter's textfile collector at it, or just cat it);
+# finish() prints the summary and writes the JSON summary to json_path.
+#
+#     metrics = ScrapeMetrics(prom_path='swim.prom', json_path='swim_metrics.json')
+#     scraper = SwimCloudScraper(metrics=metrics)
+#     scraper.scrape_team_results(185)
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+# Histogram bucket upper bounds, in seconds (the last bucket is +Inf)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+STAGES = ('fetch', 'render', 'parse', 'write', 'sleep')
+
+
+def host_of(url):
+    """Host label for a URL ('www.swimcloud.com'); anything that is not a URL is used as is."""
+    if not url:
+        return '-'
+    return urlparse(url).netloc or url
+
+
+class StageStats:
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, seconds, error=False):
+        self.count += 1
+        self.errors += error
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def quantile(self, q):
+        """Approximate quantile: upper bound of the bucket holding it, capped at max_seconds."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(BUCKETS[i], round(self.max_seconds, 3)) if i < len(BUCKETS) else round(self.max_seconds, 3)
+        return self.max_seconds
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'seconds': round(self.seconds, 3),
+            'mean_seconds': round(self.seconds / self.count, 4) if self.count else 0.0,
+            'p50_seconds': self.quantile(0.5),
+            'p95_seconds': self.quantile(0.95),
+            'max_seconds': round(self.max_seconds, 3),
+            'buckets': dict(zip([str(b) for b in BUCKETS] + ['+Inf'], self.buckets)),
+        }
+
+
+class ScrapeMetrics:
+    def __init__(self, prom_path=None, json_path=None, flush_interval=15):
+        """
+        Args:
+            prom_path: Prometheus text file, rewritten during the run (None to disable)
+            json_path: JSON summary written by finish() (None to disable)
+            flush_interval: Seconds between rewrites of prom_path
+        """
+        self.prom_path = prom_path
+        self.json_path = json_path
+        self.flush_interval = flush_interval
+
+        self.stages = defaultdict(StageStats)  # (stage, host) -> StageStats
+        self.ready = defaultdict(StageStats)  # (readiness condition, host) -> StageStats
+        self.items = defaultdict(int)  # 'meets', 'events', 'results', 'split_pages', ...
+        self.started = time.time()
+        self.progress_total = None
+        self.progress_done = 0
+        self.progress_unit = 'items'
+        self.progress_started = None
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._last_flush = 0.0
+
+    # ---------------- RECORDING ---------------- #
+
+    @contextmanager
+    def stage(self, name, url=None):
+        """
+        Time a block as one `name` stage for the host of url.
+
+        Time spent in stages nested inside it (on the same thread) is left out of its own time.
+        """
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = [0.0]  # seconds spent in nested stages
+        stack.append(frame)
+        error = False
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            self.observe(name, host_of(url), elapsed - frame[0], error)
+
+    def observe(self, name, host, seconds, error=False):
+        """Record one already-timed stage (used where stage() can't nest, e.g. across awaits)."""
+        with self._lock:
+            self.stages[(name, host)].observe(seconds, error)
+        self.maybe_flush()
+
+    def observe_ready(self, condition, url, seconds, timed_out=False):
+        """Record how long a browser page took to meet a readiness condition."""
+        with self._lock:
+            self.ready[(condition, host_of(url))].observe(seconds, timed_out)
+
+    def count(self, item, n=1):
+        with self._lock:
+            self.items[item] += n
+
+    def start_progress(self, total, unit):
+        """Begin counting progress towards total units (e.g. 40 meets)."""
+        with self._lock:
+            self.progress_total = total
+            self.progress_done = 0
+            self.progress_unit = unit
+            self.progress_started = time.time()
+
+    def advance(self, n=1):
+        """Mark n more units done and print the progress line."""
+        with self._lock:
+            self.progress_done += n
+        print(self.progress_line())
+        self.maybe_flush()
+
+    # ---------------- PROGRESS ---------------- #
+
+    def progress(self):
+        """
+        Returns:
+            dict with done, total, unit, rate_per_min and eta_seconds (None until something is done)
+        """
+        done, total = self.progress_done, self.progress_total
+        elapsed = time.time() - (self.progress_started or self.started)
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / rate if rate and total is not None else None
+        return {'done': done, 'total': total, 'unit': self.progress_unit,
+                'rate_per_min': round(rate * 60, 3), 'eta_seconds': round(eta, 1) if eta is not None else None}
+
+    def progress_line(self):
+        p = self.progress()
+        if p['total']:
+            line = f"Progress: {p['done']}/{p['total']} {p['unit']} ({p['done'] / p['total']:.0%})"
+        else:
+            line = f"Progress: {p['done']} {p['unit']}"
+        line += f", {p['rate_per_min']:.2f} {p['unit']}/min"
+        if p['eta_seconds'] is not None:
+            line += f", ETA {format_duration(p['eta_seconds'])}"
+        return line
+
+    # ---------------- EXPORT ---------------- #
+
+    def stage_totals(self):
+        """Seconds per stage over every host."""
+        totals = dict.fromkeys(STAGES, 0.0)
+        with self._lock:
+            for (name, _), stats in self.stages.items():
+                totals[name] = totals.get(name, 0.0) + stats.seconds
+        return totals
+
+    def summary(self):
+        with self._lock:
+            stages = {}
+            for (name, host), stats in sorted(self.stages.items()):
+                stages.setdefault(name, {})[host] = stats.as_dict()
+            ready = {}
+            for (condition, host), stats in sorted(self.ready.items()):
+                ready.setdefault(condition, {})[host] = stats.as_dict()
+            items = dict(self.items)
+        return {
+            'started': self.started,
+            'wall_seconds': round(time.time() - self.started, 3),
+            'stage_seconds': {name: round(seconds, 3) for name, seconds in self.stage_totals().items()},
+            'stages': stages,
+            'ready': ready,
+            'items': items,
+            'progress': self.progress(),
+        }
+
+    def prometheus_text(self):
+        """Every metric in the Prometheus text exposition format."""
+        lines = ['# HELP swim_scrape_stage_seconds Time spent per scrape stage and host',
+                 '# TYPE swim_scrape_stage_seconds histogram']
+        with self._lock:
+            stages = sorted(self.stages.items())
+            ready = sorted(self.ready.items())
+            items = sorted(self.items.items())
+        for (name, host), stats in stages:
+            lines += _histogram_lines('swim_scrape_stage_seconds', f'stage="{name}",host="{host}"', stats)
+
+        lines += ['# HELP swim_scrape_stage_errors_total Stages that raised, per stage and host',
+                  '# TYPE swim_scrape_stage_errors_total counter']
+        lines += [f'swim_scrape_stage_errors_total{{stage="{name}",host="{host}"}} {stats.errors}'
+                  for (name, host), stats in stages]
+
+        if ready:
+            lines += ['# HELP swim_scrape_ready_seconds Browser page readiness wait per condition and host',
+                      '# TYPE swim_scrape_ready_seconds histogram']
+            for (condition, host), stats in ready:
+                lines += _histogram_lines('swim_scrape_ready_seconds',
+                                          f'condition="{_escape_label(condition)}",host="{host}"', stats)
+            lines += ['# HELP swim_scrape_ready_timeouts_total Readiness waits that timed out',
+                      '# TYPE swim_scrape_ready_timeouts_total counter']
+            lines += [f'swim_scrape_ready_timeouts_total{{condition="{_escape_label(condition)}",host="{host}"}} '
+                      f'{stats.errors}' for (condition, host), stats in ready]
+
+        lines += ['# HELP swim_scrape_items_total Items scraped (meets, events, results, split pages)',
+                  '# TYPE swim_scrape_items_total counter']
+        lines += [f'swim_scrape_items_total{{item="{item}"}} {n}' for item, n in items]
+
+        p = self.progress()
+        lines += ['# HELP swim_scrape_progress_done Units of the run finished',
+                  '# TYPE swim_scrape_progress_done gauge',
+                  f'swim_scrape_progress_done{{unit="{p["unit"]}"}} {p["done"]}']
+        if p['total'] is not None:
+            lines += ['# HELP swim_scrape_progress_total Units in the run',
+                      '# TYPE swim_scrape_progress_total gauge',
+                      f'swim_scrape_progress_total{{unit="{p["unit"]}"}} {p["total"]}']
+        if p['eta_seconds'] is not None:
+            lines += ['# HELP swim_scrape_eta_seconds Estimated seconds until the run finishes',
+                      '# TYPE swim_scrape_eta_seconds gauge',
+                      f'swim_scrape_eta_seconds {p["eta_seconds"]}']
+        return '\n'.join(lines) + '\n'
+
+    def maybe_flush(self):
+        """Rewrite prom_path if flush_interval has passed since the last write."""
+        if self.prom_path and time.time() - self._last_flush >= self.flush_interval:
+            self.write_prometheus()
+
+    def write_prometheus(self, path=None):
+        """Write the Prometheus text atomically (readers never see half a file)."""
+        path = path or self.prom_path
+        self._last_flush = time.time()
+        _write_atomic(path, self.prometheus_text())
+
+    def write_json(self, path=None):
+        _write_atomic(path or self.json_path, json.dumps(self.summary(), indent=2) + '\n')
+
+    def finish(self):
+        """Print the per-stage summary and write the JSON summary / Prometheus file, if configured."""
+        totals = self.stage_totals()
+        wall = time.time() - self.started
+        print(f"\nTime by stage ({format_duration(wall)} wall):")
+        for name, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+            count = sum(stats.count for (stage, _), stats in self.stages.items() if stage == name)
+            if not count:
+                continue
+            share = f"{seconds / wall:6.1%}" if wall else ''
+            print(f"   {name:8} {format_duration(seconds):>10} {share}  ({count} calls)")
+        if self.items:
+            print("   " + ", ".join(f"{n} {item}" for item, n in sorted(self.items.items())))
+        for (condition, host), stats in sorted(self.ready.items()):
+            print(f"   ready '{condition}' on {host}: p50 <= {stats.quantile(0.5)}s, p95 <= {stats.quantile(0.95)}s, "
+                  f"max {stats.max_seconds:.2f}s, {stats.errors}/{stats.count} timed out")
+
+        if self.json_path:
+            self.write_json()
+            print(f"Metrics summary saved to {self.json_path}")
+        if self.prom_path:
+            self.write_prometheus()
+
+
+def format_duration(seconds):
+    """1h02m, 3m05s, 4.2s"""
+    if seconds >= 3600:
+        return f"{int(seconds // 3600)}h{int(seconds % 3600 // 60):02d}m"
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m{int(seconds % 60):02d}s"
+    return f"{seconds:.1f}s"
+
+
+def _histogram_lines(metric, labels, stats):
+    lines = []
+    cumulative = 0
+    for bound, n in zip([str(b) for b in BUCKETS] + ['+Inf'], stats.buckets):
+        cumulative += n
+        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{metric}_sum{{{labels}}} {stats.seconds:.6f}')
+    lines.append(f'{metric}_count{{{labels}}} {stats.count}')
+    return lines
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
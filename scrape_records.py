@@ -0,0 +1,39 @@
+# Records yielded by the streaming scraper APIs
+# (SwimCloudScraper.iter_team_results and SwimMeetScraper.iter_meet_results)
+
+from collections import namedtuple
+
+# One parsed event. results and splits are lists of the same dictionaries the
+# DataFrame-returning methods build their rows from.
+#   event_type: 'relay' or 'individual' (SwimCloud); 'relay', 'individual' or 'diving' (HY-TEK)
+#   splits: SwimCloud split rows, or long-format HY-TEK split rows (split_format='long')
+#   season: Season label ('2024-2025') of the SwimCloud results page the meet was listed on;
+#       None for HY-TEK (results_store.py takes it from the page date)
+EventRecords = namedtuple('EventRecords', [
+    'meet_name', 'meet_url', 'event_number', 'event_name', 'event_type', 'results', 'splits', 'season',
+], defaults=[None])
+
+
+def group_meets(event_records):
+    """
+    Regroup a stream of EventRecords into whole meets (consecutive events with the same meet_url).
+
+    Yields:
+        Tuple of (meet_name, result dictionaries, split dictionaries) for each meet
+    """
+    current_url = None
+    meet_name = None
+    results = []
+    splits = []
+    for records in event_records:
+        if records.meet_url != current_url:
+            if results:
+                yield meet_name, results, splits
+            current_url = records.meet_url
+            meet_name = records.meet_name
+            results = []
+            splits = []
+        results.extend(records.results)
+        splits.extend(records.splits)
+    if results:
+        yield meet_name, results, splits
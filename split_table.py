@@ -0,0 +1,98 @@
+# Long ("tidy") split table: one row per (result, split index)
+#
+# The wide layout puts split_1_distance ... split_33_cumulative on every result
+# row as Python-object strings, mostly None, and cuts off after 33 splits. The
+# long layout stores each split once with categorical keys, an integer distance
+# and integer-centisecond times, and has no split limit. The wide view is a
+# pivot of the long table, produced only when someone asks for it.
+
+import pandas as pd
+
+from hytek_splits import format_centiseconds
+from swim_times import time_to_centiseconds
+
+KEY_COLUMNS = ['meet_url', 'event_number', 'event_name', 'Name', 'Order']
+CATEGORY_COLUMNS = ['meet_url', 'event_number', 'event_name', 'Name']
+
+
+def split_rows(meet_url, event_number, event_name, name, splits, order=0):
+    """
+    Turn one result's parsed splits into long-format rows.
+
+    Args:
+        meet_url, event_number, event_name, name: Identify the result
+        splits: list of (distance, split_text, cumulative_text or None)
+        order: Relay leg (1-4); 0 for individual swims
+
+    Returns:
+        list of dictionaries, one per split
+    """
+    rows = []
+    cumulative_centis = 0
+    for split_index, (distance, split_time, cumulative) in enumerate(splits, 1):
+        split_centis = time_to_centiseconds(split_time)
+        if cumulative is not None:
+            cumulative_centis = time_to_centiseconds(cumulative)
+        elif split_centis is not None:
+            # HY-TEK leaves the cumulative off the first split, where it equals the split
+            cumulative_centis = (cumulative_centis or 0) + split_centis
+        rows.append({
+            'meet_url': meet_url,
+            'event_number': event_number,
+            'event_name': event_name,
+            'Name': name,
+            'Order': order,
+            'split_index': split_index,
+            'distance': distance,
+            'split_cs': split_centis,
+            'cumulative_cs': cumulative_centis,
+        })
+    return rows
+
+
+def splits_frame(rows):
+    """
+    Build the typed long split table from split_rows() output.
+
+    Keys are categoricals, distance is int16, times are nullable int32 centiseconds.
+    """
+    df = pd.DataFrame(rows, columns=KEY_COLUMNS + ['split_index', 'distance', 'split_cs', 'cumulative_cs'])
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype('category')
+    df['Order'] = df['Order'].astype('int8')
+    df['split_index'] = df['split_index'].astype('int16')
+    df['distance'] = df['distance'].astype('Int16')
+    df['split_cs'] = df['split_cs'].astype('Int32')
+    df['cumulative_cs'] = df['cumulative_cs'].astype('Int32')
+    return df
+
+
+def long_to_wide(long_df, as_text=True):
+    """
+    Pivot the long split table back to one row per result with split_<n>_* columns.
+
+    Args:
+        long_df: DataFrame from splits_frame()
+        as_text: Format times as HY-TEK strings ("1:08.12") like the wide parser output;
+            False keeps integer centiseconds
+
+    Returns:
+        DataFrame keyed by KEY_COLUMNS with split_<n>_distance/time/cumulative columns
+        for as many splits as the longest swim has
+    """
+    wide = long_df.pivot_table(index=KEY_COLUMNS, columns='split_index',
+                               values=['distance', 'split_cs', 'cumulative_cs'],
+                               aggfunc='first', observed=True)
+
+    columns = {}
+    for split_index in sorted(wide.columns.get_level_values('split_index').unique()):
+        columns[f'split_{split_index}_distance'] = wide[('distance', split_index)]
+        columns[f'split_{split_index}_time'] = wide[('split_cs', split_index)]
+        columns[f'split_{split_index}_cumulative'] = wide[('cumulative_cs', split_index)]
+    wide = pd.DataFrame(columns, index=wide.index)
+
+    if as_text:
+        for column in wide.columns:
+            if not column.endswith('_distance'):
+                wide[column] = wide[column].map(lambda centis: None if pd.isna(centis) else format_centiseconds(int(centis)))
+    return wide.reset_index()
@@ -7,8 +7,6 @@
 # Combined Brandon and John's changes
 
 # Import everything needed
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 import requests
 from bs4 import BeautifulSoup
 import time
@@ -16,14 +14,67 @@ import pandas as pd
 from urllib.parse import urljoin
 import re
 import random
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from browser_pool import BrowserPool, ChromeProfile, page_bytes
+from page_cache import PageCache
+from response_archive import ResponseArchive
+from swim_times import add_centisecond_columns
+from output_sinks import OutputSink, ExcelSink, ParquetSink, export_excel
+from scrape_records import EventRecords, group_meets
+from crawl_journal import CrawlJournal, NO_RECORDS
+from crawl_frontier import CrawlFrontier
+from scrape_metrics import ScrapeMetrics
+from rate_control import RateController, RETRY_STATUSES, looks_blocked
+from page_ready import load_page, css_present, or_settled
+import swimcloud_lxml
+
+# _journaled_split_times() result for a split page an earlier crawl finished that the journal lacks
+NOT_JOURNALED = object()
 
 class SwimCloudScraper:
-    def __init__(self, delay=1.0, rand_delay_min=8, rand_delay_max=14):
+    # SwimCloud's id for the 2024-2025 season (each season before it is one lower)
+    CURRENT_SEASON = 28
+    # Retries of a page that answered 429/5xx (adaptive rate control only)
+    MAX_RETRIES = 3
+
+    def __init__(self, delay=1.0, rand_delay_min=8, rand_delay_max=14,
+                 pool_size=1, pages_per_worker=50, max_worker_rss_mb=1024, max_per_host=4,
+                 cache_dir=None, archive_path=None, archive_mode='record', metrics=None,
+                 rate_control='adaptive', max_rate=None, ready_timeout=10, chrome_profile='lean',
+                 parser='lxml', frontier=None):
         """
         Initialize the scraper with a delay between requests.
         
         Args:
             delay: Seconds to wait between requests (default 1.0)
+            rand_delay_min, rand_delay_max: Random sleep before each split page (rate_control='fixed' only)
+            pool_size: Number of headless Chrome workers used for split pages (default 1)
+            pages_per_worker: Split pages a Chrome worker loads before it is restarted
+            max_worker_rss_mb: Restart a Chrome worker once its memory grows past this (MB)
+            max_per_host: Concurrent requests per host for the async backend (default 4)
+            cache_dir: Directory of the on-disk page cache shared with SwimMeetScraper (None to disable)
+            archive_path: Record/replay archive file (None to disable)
+            archive_mode: 'record' saves every page seen into archive_path, 'replay' serves the
+                whole run from it with no network and no browser
+            metrics: ScrapeMetrics to record stage timings in (scrape_metrics.py); may be shared
+                with a SwimMeetScraper. Default: a private one, summarised at the end of each run
+            rate_control: 'adaptive' paces each host with a RateController (rate_control.py: backs off
+                on 429/5xx and Retry-After, obeys robots.txt, retries throttled pages); 'fixed' keeps
+                the fixed sleeps before every request
+            max_rate: Adaptive ceiling in requests per second per host (default 1 / delay)
+            ready_timeout: Most seconds a split page may take to show its table (see page_ready.py);
+                None waits a fixed `delay` after every page load instead
+            chrome_profile: 'lean' (default: blocks images/fonts/CSS/trackers, eager page loads, warm
+                profile per worker under .swim_chrome/swimcloud, see browser_pool.py), 'stock' for the
+                plain headless Chrome, or a ChromeProfile
+            parser: 'lxml' (default) parses team, meet and event pages with precompiled XPath
+                (swimcloud_lxml.py); 'bs4' keeps the BeautifulSoup parsers. Both give the same output
+            frontier: CrawlFrontier (crawl_frontier.py) shared by every crawl of this scraper, e.g. one
+                with a path to persist it across runs: meet, event and split pages it has finished are
+                never fetched again, so crawls with it need resume=True (a journal kept across runs)
+                to replay finished work. Default: a fresh in-memory frontier per crawl
         """
         self.base_url = "https://www.swimcloud.com"
         self.delay = delay
@@ -34,21 +85,126 @@ class SwimCloudScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         self.team_name = None
+        self.meet_seasons = {}  # meet_url -> SwimCloud season id of the results page it was listed on
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.ready_timeout = ready_timeout
+        if chrome_profile == 'lean':
+            chrome_profile = ChromeProfile(user_data_dir=os.path.join('.swim_chrome', 'swimcloud'))
+        elif chrome_profile == 'stock':
+            chrome_profile = None
+        elif not isinstance(chrome_profile, ChromeProfile):
+            raise ValueError(f"Unknown chrome_profile '{chrome_profile}' (expected 'lean', 'stock' or a ChromeProfile)")
+        self.chrome_profile = chrome_profile
+        if parser not in ('lxml', 'bs4'):
+            raise ValueError(f"Unknown parser '{parser}' (expected 'lxml' or 'bs4')")
+        self.parser = parser
+        self.frontier = frontier
+        self.page_cache = PageCache(cache_dir) if cache_dir else None
+        self.archive = ResponseArchive(archive_path, archive_mode) if archive_path else None
+        self.metrics = metrics or ScrapeMetrics()
+        if rate_control == 'adaptive':
+            self.rate_controller = RateController(max_rate=max_rate or (1.0 / delay if delay else 1.0),
+                                                  session=self.session, metrics=self.metrics)
+            self.session.hooks['response'].append(self.rate_controller.response_hook)
+        elif rate_control == 'fixed':
+            self.rate_controller = None
+        else:
+            raise ValueError(f"Unknown rate_control '{rate_control}' (expected 'adaptive' or 'fixed')")
 
         ## JN- changing selenium chrome to headless
-        self._init_selenium()
-
-    def _init_selenium(self):
-        """Initialize Selenium with headless Chrome. Disable if you want to see for debugging porpoises"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        self.driver = webdriver.Chrome(options=chrome_options)
-        print("Initializing headless Chrome for Selenium...")
+        self._init_selenium(pages_per_worker, max_worker_rss_mb)
+
+    def _init_selenium(self, pages_per_worker, max_worker_rss_mb):
+        """Initialize the pool of headless Chrome workers. Browsers start on first use, not here."""
+        self.browser_pool = BrowserPool(size=self.pool_size,
+                                        max_pages=pages_per_worker,
+                                        max_rss_mb=max_worker_rss_mb,
+                                        profile=self.chrome_profile)
+        print(f"Initializing headless Chrome pool for Selenium ({self.pool_size} worker(s))...")
+
+    def close(self):
+        """Shut down every pooled Chrome worker and finish the archive, if any."""
+        if hasattr(self, 'browser_pool'):
+            self.browser_pool.close()
+        if getattr(self, 'archive', None):
+            self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Always finish an archive recording, even when the scrape fails or is interrupted
+        self.close()
     
-    def _delay_request(self):
-        """Add delay between requests to be respectful to the server."""
-        time.sleep(self.delay)
+    def _delay_request(self, url=None):
+        """Add delay between requests to be respectful to the server (the host's turn, when adaptive)."""
+        with self.metrics.stage('sleep', url or self.base_url):
+            if self.rate_controller:
+                self.rate_controller.wait(url or self.base_url)
+            else:
+                time.sleep(self.delay)
+
+    def _fetch(self, url, delay=False):
+        """
+        GET a page body, served from the page cache when a fresh copy is stored.
+
+        Args:
+            url: Page URL
+            delay: Run _delay_request() first, but only if the network is actually used
+                (adaptive rate control paces every network request)
+
+        Returns:
+            Response body as bytes
+        """
+        with self.metrics.stage('fetch', url):
+            if self.archive and self.archive.replaying:
+                return self.archive.read(url, 'http')
+
+            paced = delay or self.rate_controller is not None
+            for attempt in range(self.MAX_RETRIES + 1):
+                before_request = (lambda: self._delay_request(url)) if paced or attempt else None
+                try:
+                    if self.page_cache:
+                        body = self.page_cache.fetch(self.session, url, before_request)
+                    else:
+                        if before_request:
+                            before_request()
+                        response = self.session.get(url)
+                        response.raise_for_status()
+                        body = response.content
+                    break
+                except requests.HTTPError as e:
+                    status = e.response.status_code if e.response is not None else None
+                    if not self.rate_controller or status not in RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                        raise
+                    print(f"  HTTP {status} for {url}, retrying ({attempt + 1}/{self.MAX_RETRIES})")
+
+            if self.archive:
+                self.archive.write(url, body, 'http')
+            return body
     
+    def _team_results_url(self, team_id, page=1, season=None):
+        """URL of one page of a team's results for a season (default: first page, CURRENT_SEASON)."""
+        season = self.CURRENT_SEASON if season is None else season
+        return f"{self.base_url}/team/{team_id}/results/?page={page}&name=&meettype=&season={season}"
+
+    @classmethod
+    def season_label(cls, season):
+        """Season label ('2024-2025') for a SwimCloud season id."""
+        start = season + 2024 - cls.CURRENT_SEASON
+        return f'{start}-{start + 1}'
+
+    def _note_meet_seasons(self, meet_urls, season=None):
+        """Remember the season each meet was listed under (the first one, for meets listed twice)."""
+        season = self.CURRENT_SEASON if season is None else season
+        for meet_url in meet_urls:
+            self.meet_seasons.setdefault(meet_url, season)
+
+    def _meet_season_label(self, meet_url):
+        season = self.meet_seasons.get(meet_url)
+        return None if season is None else self.season_label(season)
+
     def get_team_name(self, team_id):
         """
         Get the team name from the team page.
@@ -59,81 +215,116 @@ class SwimCloudScraper:
         Returns:
             String with team name
         """
-        url = f"{self.base_url}/team/{team_id}/results/?page=1&name=&meettype=&season=28"
+        url = self._team_results_url(team_id)
         print(f"Fetching team name from: {url}")
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for h1 with class c-toolbar__title
-            team_name_tag = soup.find('h1', class_='c-toolbar__title')
-            if team_name_tag:
-                team_name = team_name_tag.get_text(strip=True)
-                print(f"Found team name: {team_name}")
-                return team_name
-            else:
-                print("WARNING: Could not find team name")
-                return f"Team_{team_id}"
+            html = self._fetch(url)
+            with self.metrics.stage('parse', url):
+                return self._parse_team_name(html, team_id)
         
         except Exception as e:
             print(f"Error fetching team name: {e}")
             return f"Team_{team_id}"
+
+    def _parse_team_name(self, html, team_id):
+        """Pull the team name out of a team results page."""
+        if self.parser == 'lxml':
+            team_name = swimcloud_lxml.team_name(swimcloud_lxml.parse(html))
+        else:
+            soup = BeautifulSoup(html, 'html.parser')
+            # Look for h1 with class c-toolbar__title
+            team_name_tag = soup.find('h1', class_='c-toolbar__title')
+            team_name = team_name_tag.get_text(strip=True) if team_name_tag else None
+        if team_name is not None:
+            print(f"Found team name: {team_name}")
+            return team_name
+        else:
+            print("WARNING: Could not find team name")
+            return f"Team_{team_id}"
     
-    def get_team_meets(self, team_id, max_meets=None):
+    def get_team_meets(self, team_id, max_meets=None, seasons=None, max_pages=50):
         """
         Get all meet URLs for a given team.
         
         Args:
             team_id: The team ID (e.g., 185)
             max_meets: Maximum number of meets to retrieve (None for all)
+            seasons: Backfill: SwimCloud season ids to walk every results page of, in the order
+                given (e.g. range(28, 23, -1) for the last five seasons, newest first).
+                None reads only the first page of CURRENT_SEASON.
+            max_pages: Most results pages read per season when backfilling
         
         Returns:
             List of meet URLs
         """
-        url = f"{self.base_url}/team/{team_id}/results/?page=1&name=&meettype=&season=28"
+        if seasons is not None:
+            from async_fetch import AsyncSwimCloudFetcher
+            fetcher = AsyncSwimCloudFetcher(self, max_per_host=self.max_per_host)
+            meet_urls = fetcher.run(lambda: fetcher.fetch_team_pages(team_id, seasons, max_meets, max_pages))
+            print(f"Found {len(meet_urls)} meets")
+            return meet_urls
+
+        url = self._team_results_url(team_id)
         print(f"Fetching team results from: {url}")
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find all meet links
-            meet_links = []
-            all_links = soup.find_all('a', href=True)
-            
-            for link in all_links:
-                href = link['href']
-                # Look for any link containing /results/ followed by digits
-                if '/results/' in href and re.search(r'/results/(\d+)', href):
-                    # Extract just the meet result URL
-                    match = re.search(r'(/results/\d+)/?', href)
-                    if match:
-                        clean_path = match.group(1) + '/'
-                        meet_url = urljoin(self.base_url, clean_path)
-                        if meet_url not in meet_links:
-                            meet_links.append(meet_url)
-            
-            if not meet_links:
-                print("WARNING: No meet links found!")
-                print("Saving HTML for debugging...")
-                with open(f'team_{team_id}_debug.html', 'w', encoding='utf-8') as f:
-                    f.write(soup.prettify())
-                print(f"Saved page HTML to team_{team_id}_debug.html")
-            
-            if max_meets:
-                meet_links = meet_links[:max_meets]
-            
-            print(f"Found {len(meet_links)} meets")
-            return meet_links
+            html = self._fetch(url)
+            with self.metrics.stage('parse', url):
+                return self._parse_team_meets(html, team_id, max_meets)
         
         except Exception as e:
             print(f"Error fetching team meets: {e}")
             import traceback
             traceback.print_exc()
             return []
+
+    def _parse_team_meets(self, html, team_id, max_meets=None):
+        """Pull the meet URLs out of a team results page."""
+        meet_links = self._page_meet_links(html)
+        self._note_meet_seasons(meet_links)
+
+        if not meet_links:
+            print("WARNING: No meet links found!")
+            print("Saving HTML for debugging...")
+            self._save_debug_html(html, f'team_{team_id}_debug.html')
+            print(f"Saved page HTML to team_{team_id}_debug.html")
+
+        if max_meets:
+            meet_links = meet_links[:max_meets]
+
+        print(f"Found {len(meet_links)} meets")
+        return meet_links
+
+    @staticmethod
+    def _save_debug_html(html, path):
+        """Write a page that could not be parsed, prettified, for a look by hand."""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(BeautifulSoup(html, 'html.parser').prettify())
+
+    def _page_meet_links(self, html):
+        """Meet result URLs linked from a team results page, with the configured parser."""
+        if self.parser == 'lxml':
+            return swimcloud_lxml.meet_links(swimcloud_lxml.parse(html), self.base_url)
+        return self._meet_links(BeautifulSoup(html, 'html.parser'))
+
+    def _meet_links(self, soup):
+        """Meet result URLs linked from a parsed team results page, in page order."""
+        # Find all meet links (dict keys: deduplicated, in page order)
+        meet_links = {}
+        all_links = soup.find_all('a', href=True)
+
+        for link in all_links:
+            href = link['href']
+            # Look for any link containing /results/ followed by digits
+            if '/results/' in href and re.search(r'/results/(\d+)', href):
+                # Extract just the meet result URL
+                match = re.search(r'(/results/\d+)/?', href)
+                if match:
+                    clean_path = match.group(1) + '/'
+                    meet_url = urljoin(self.base_url, clean_path)
+                    meet_links.setdefault(meet_url)
+        return list(meet_links)
     
     def get_meet_events(self, meet_url):
         """
@@ -146,65 +337,11 @@ class SwimCloudScraper:
             Tuple of (meet_name, list of tuples (event_url, event_number, event_name))
         """
         print(f"\nFetching events from meet: {meet_url}")
-        self._delay_request()
         
         try:
-            response = self.session.get(meet_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract meet name
-            meet_name = "Unknown Meet"
-            meet_name_tag = soup.find('h1', id='meet-name')
-            if not meet_name_tag:
-                meet_name_tag = soup.find('h1', class_='c-toolbar__title')
-            if meet_name_tag:
-                meet_name = meet_name_tag.get_text(strip=True)
-            
-            # Extract meet ID from URL
-            match = re.search(r'/results/(\d+)', meet_url)
-            if not match:
-                print("Could not extract meet ID from URL")
-                return meet_name, []
-            
-            meet_id = match.group(1)
-            
-            # Find all event links with their names
-            event_links = []
-            all_links = soup.find_all('a', href=True)
-            
-            for link in all_links:
-                href = link['href']
-                # Match patterns like /results/307921/event/11/
-                match = re.match(rf'^/results/{meet_id}/event/(\d+)/?$', href)
-                if match:
-                    event_number = match.group(1)
-                    event_url = urljoin(self.base_url, f'/results/{meet_id}/event/{event_number}/')
-                    
-                    # Extract event name from the div.c-events__link-body
-                    event_name = "Unknown Event"
-                    event_body = link.find('div', class_='c-events__link-body')
-                    if event_body:
-                        # Try title attribute first
-                        if event_body.get('title'):
-                            event_name = event_body.get('title')
-                        else:
-                            # Otherwise get text content
-                            event_name = event_body.get_text(strip=True)
-                    
-                    if (event_url, event_number, event_name) not in event_links:
-                        event_links.append((event_url, event_number, event_name))
-            
-            if not event_links:
-                print("WARNING: No event links found in meet!")
-                print("Saving HTML for debugging...")
-                with open(f'meet_{meet_id}_debug.html', 'w', encoding='utf-8') as f:
-                    f.write(soup.prettify())
-                print(f"Saved meet HTML to meet_{meet_id}_debug.html")
-            
-            print(f"Meet: {meet_name}")
-            print(f"Found {len(event_links)} events")
-            return meet_name, event_links
+            html = self._fetch(meet_url, delay=True)
+            with self.metrics.stage('parse', meet_url):
+                return self._parse_meet_events(html, meet_url)
         
         except Exception as e:
             print(f"Error fetching meet events: {e}")
@@ -212,56 +349,174 @@ class SwimCloudScraper:
             traceback.print_exc()
             return "Unknown Meet", []
 
-    def scrape_split_times(self, time_url):
+    def _parse_meet_events(self, html, meet_url):
+        """Pull the meet name and event links out of a meet results page."""
+        if self.parser == 'lxml':
+            return self._parse_meet_events_lxml(html, meet_url)
+        soup = BeautifulSoup(html, 'html.parser')
 
-        try:
-            time.sleep(random.randint(self.rand_delay_min, self.rand_delay_max)) # I am a human being, not a robot
-            driver = webdriver.Chrome()
-            time.sleep(self.delay)  # Wait before loading page
-            driver.get(time_url)
-            time.sleep(self.delay)  # Wait for page to load
-            html = driver.page_source
-            soup = BeautifulSoup(html, "html.parser")
+        # Extract meet name
+        meet_name = "Unknown Meet"
+        meet_name_tag = soup.find('h1', id='meet-name')
+        if not meet_name_tag:
+            meet_name_tag = soup.find('h1', class_='c-toolbar__title')
+        if meet_name_tag:
+            meet_name = meet_name_tag.get_text(strip=True)
+
+        # Extract meet ID from URL
+        match = re.search(r'/results/(\d+)', meet_url)
+        if not match:
+            print("Could not extract meet ID from URL")
+            return meet_name, []
 
-            time.sleep(self.delay)  # Wait for JavaScript to load content
+        meet_id = match.group(1)
 
-            table = soup.select_one("table.c-table-clean")
+        # Find all event links with their names (dict keys: deduplicated, in page order)
+        event_links = {}
+        all_links = soup.find_all('a', href=True)
 
-            trs = table.find_all("tr")
+        for link in all_links:
+            href = link['href']
+            # Match patterns like /results/307921/event/11/
+            match = re.match(rf'^/results/{meet_id}/event/(\d+)/?$', href)
+            if match:
+                event_number = match.group(1)
+                event_url = urljoin(self.base_url, f'/results/{meet_id}/event/{event_number}/')
 
-            split_data = []
-            persons_name = ""
+                # Extract event name from the div.c-events__link-body
+                event_name = "Unknown Event"
+                event_body = link.find('div', class_='c-events__link-body')
+                if event_body:
+                    # Try title attribute first
+                    if event_body.get('title'):
+                        event_name = event_body.get('title')
+                    else:
+                        # Otherwise get text content
+                        event_name = event_body.get_text(strip=True)
 
-            for tr in trs:
-                # print(tr.get_text(" | ", strip=True)) ## Just printing the data to see if I was grabbing the corect data.
+                event_links.setdefault((event_url, event_number, event_name))
 
-                data = tr.get_text()
+        return self._report_meet_events(html, meet_name, meet_id, list(event_links))
 
-                pattern = r'(\d+?)(\d{2}\.\d{2})(\d{2}\.\d{2})(\d+:\d{2}\.\d{2}|\d+\.\d{2})$'
+    def _parse_meet_events_lxml(self, html, meet_url):
+        """_parse_meet_events with the lxml backend."""
+        doc = swimcloud_lxml.parse(html)
+        meet_name = swimcloud_lxml.meet_name(doc) or "Unknown Meet"
 
-                match = re.match(pattern, data)
+        match = re.search(r'/results/(\d+)', meet_url)
+        if not match:
+            print("Could not extract meet ID from URL")
+            return meet_name, []
 
-                if match:
-                    values = match.groups()
-                    split_data.append({
-                        'Distance': values[0],
-                        'split': values[1],
-                        'leg': values[2],
-                        'Cumulative': values[3],
-                        'Person': persons_name
-                    })
-                    print(values)
-                elif data != "DistanceSplitLegCumulative":
-                    persons_name = data
-                else:
-                    print("no match! line doesn't contain numbers, need to ignore that.")
+        meet_id = match.group(1)
+        return self._report_meet_events(html, meet_name, meet_id,
+                                        swimcloud_lxml.event_links(doc, meet_id, self.base_url))
 
-            return split_data
+    def _report_meet_events(self, html, meet_name, meet_id, event_links):
+        """Print what was found on a meet page (saving the page if it had no events) and return it."""
+        if not event_links:
+            print("WARNING: No event links found in meet!")
+            print("Saving HTML for debugging...")
+            self._save_debug_html(html, f'meet_{meet_id}_debug.html')
+            print(f"Saved meet HTML to meet_{meet_id}_debug.html")
 
+        print(f"Meet: {meet_name}")
+        print(f"Found {len(event_links)} events")
+        return meet_name, event_links
+
+    def scrape_split_times(self, time_url):
+        """
+        Get the split table for one swim, using a browser from the pool.
+
+        Args:
+            time_url: URL of the /times/<id>/ page
+
+        Returns:
+            List of split dictionaries (Distance, split, leg, Cumulative, Person); [] for a swim
+            without splits, or if the page can't be fetched
+        """
+        try:
+            return self._split_times(time_url)
         except Exception as e:
             print(f"Error with scraping split times: {e}")
             return []
 
+    def _split_times(self, time_url):
+        """scrape_split_times, raising instead of returning [] if the page can't be fetched or read."""
+        if self.archive and self.archive.replaying:
+            html = self.archive.read_text(time_url, 'page_source')
+        elif self.page_cache:
+            html = self.page_cache.get_text(time_url, 'page_source')
+        else:
+            html = None
+
+        if html is None:
+            if self.rate_controller:
+                self._delay_request(time_url)
+            else:
+                with self.metrics.stage('sleep', time_url):
+                    time.sleep(random.randint(self.rand_delay_min, self.rand_delay_max)) # I am a human being, not a robot
+            rendered_at = time.perf_counter()
+            # Wait for JavaScript to render the split table (a swim without splits never shows
+            # one, so a page that has finished loading counts as ready after `delay` seconds)
+            ready = (or_settled(css_present('table.c-table-clean'), self.delay)
+                     if self.ready_timeout is not None else None)
+            with self.metrics.stage('render', time_url), self.browser_pool.page() as driver:
+                load_page(driver, time_url, ready, self.ready_timeout, self.delay, self.metrics)
+                html = driver.page_source
+                self.metrics.count('render_bytes', page_bytes(driver))
+            if self.rate_controller:
+                self.rate_controller.feedback(time_url, latency=time.perf_counter() - rendered_at,
+                                              ok=not looks_blocked(html), kind='render')
+            if self.page_cache and 'c-table-clean' in html:
+                self.page_cache.put_text(time_url, html, 'page_source')
+        if self.archive and not self.archive.replaying:
+            self.archive.write_text(time_url, html, 'page_source')
+        self.metrics.count('split_pages')
+        with self.metrics.stage('parse', time_url):
+            return self._parse_split_times(html)
+
+    def _parse_split_times(self, html):
+        """Pull the split rows out of a /times/ page source."""
+        soup = BeautifulSoup(html, "html.parser")
+
+        table = soup.select_one("table.c-table-clean")
+        if table is None:
+            if looks_blocked(html):
+                raise ValueError("blocked page, no split table")
+            return []  # a swim without splits
+
+        trs = table.find_all("tr")
+
+        split_data = []
+        persons_name = ""
+
+        for tr in trs:
+            # print(tr.get_text(" | ", strip=True)) ## Just printing the data to see if I was grabbing the corect data.
+
+            data = tr.get_text()
+
+            pattern = r'(\d+?)(\d{2}\.\d{2})(\d{2}\.\d{2})(\d+:\d{2}\.\d{2}|\d+\.\d{2})$'
+
+            match = re.match(pattern, data)
+
+            if match:
+                values = match.groups()
+                split_data.append({
+                    'Distance': values[0],
+                    'split': values[1],
+                    'leg': values[2],
+                    'Cumulative': values[3],
+                    'Person': persons_name
+                })
+                print(values)
+            elif data != "DistanceSplitLegCumulative":
+                persons_name = data
+            else:
+                print("no match! line doesn't contain numbers, need to ignore that.")
+
+        return split_data
+
     def get_event_results(self, event_url, event_name):
         """
         Get all results (names and times) for a specific event.
@@ -271,209 +526,489 @@ class SwimCloudScraper:
             event_name: Name of the event (already extracted from meet page)
         
         Returns:
-            Dictionary with event_name, is_relay flag, and list of results
+            Dictionary with event_name, is_relay flag, and list of results (plus the error, with
+            no results, if the page can't be fetched or read)
         """
         print(f"  Fetching results for: {event_name}")
-        self._delay_request()
         
         try:
-            response = self.session.get(event_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Check if this is a relay event
-            is_relay = 'relay' in event_name.lower()
-            
-            # Find all result entries
-            results = []
-            
-            # Strategy: Find all divs with id starting with "time" which contain the time links
-            # Example: <div id="time148087775"><a href="/times/148087775/">1:35.48</a></div>
-            time_divs = soup.find_all('div', id=re.compile(r'^time\d+'))
-            
-            for time_div in time_divs:
-                # Extract time value from the link inside the div
-                time_link = time_div.find('a', href=re.compile(r'^/times/\d+'))
-                if not time_link:
-                    continue
-                
-                time_value = time_link.get_text(strip=True)
-                time_url = urljoin(self.base_url, time_link['href'])
-                # Now find the corresponding athlete/team name
-                # Look for the nearest td with class="u-nowrap u-text-semi" that has a swimmer link
-                # We need to traverse up and find the row, then look for the name
-                # self.scrape_split_times(time_url)
-                # Find the parent table row
-                row = time_div.find_parent('tr')
-                name = "Unknown"
-                
-                if row:
-                    if is_relay:
-                        # For relays, look for team link
-                        team_link = row.find('a', href=re.compile(r'/team/\d+'))
-                        if team_link:
-                            name = team_link.get_text(strip=True)
-                    else:
-                        # For individuals, look for swimmer link
-                        swimmer_link = row.find('a', href=re.compile(r'/swimmer/\d+'))
-                        if swimmer_link:
-                            name = swimmer_link.get_text(strip=True)
-                            name = re.sub(r'\s+', ' ', name)
-                
-                results.append({
-                    'name': name,
-                    'time': time_value,
-                    'time_url': time_url
-                })
-            
-            print(f"    Found {len(results)} results | Relay: {is_relay}")
-            
-            return {
-                'event_name': event_name,
-                'is_relay': is_relay,
-                'results': results
-            }
+            html = self._fetch(event_url, delay=True)
+            with self.metrics.stage('parse', event_url):
+                return self._parse_event_results(html, event_name)
         
         except Exception as e:
             print(f"  Error fetching event results: {e}")
             import traceback
             traceback.print_exc()
-            return {'event_name': event_name, 'is_relay': False, 'results': []}
+            return {'event_name': event_name, 'is_relay': False, 'results': [], 'error': str(e)}
+
+    def _parse_event_results(self, html, event_name):
+        """Pull every result (name, time, time_url, team and SwimCloud swimmer/team ids) out of an event results page."""
+        # Check if this is a relay event
+        is_relay = 'relay' in event_name.lower()
+
+        if self.parser == 'lxml':
+            results = []
+            for row in swimcloud_lxml.result_rows(swimcloud_lxml.parse(html), self.base_url):
+                name = row.team if is_relay else row.swimmer
+                results.append({
+                    'name': "Unknown" if name is None else name,
+                    'time': row.time,
+                    'time_url': row.time_url,
+                    'team': row.team,
+                    'swimmer_id': row.swimmer_id,
+                    'team_id': row.team_id
+                })
+            return self._report_event_results(event_name, is_relay, results)
+
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Find all result entries
+        results = []
+
+        # Strategy: Find all divs with id starting with "time" which contain the time links
+        # Example: <div id="time148087775"><a href="/times/148087775/">1:35.48</a></div>
+        time_divs = soup.find_all('div', id=re.compile(r'^time\d+'))
+
+        for time_div in time_divs:
+            # Extract time value from the link inside the div
+            time_link = time_div.find('a', href=re.compile(r'^/times/\d+'))
+            if not time_link:
+                continue
+
+            time_value = time_link.get_text(strip=True)
+            time_url = urljoin(self.base_url, time_link['href'])
+            # Now find the corresponding athlete/team name
+            # Look for the nearest td with class="u-nowrap u-text-semi" that has a swimmer link
+            # We need to traverse up and find the row, then look for the name
+            # Find the parent table row
+            row = time_div.find_parent('tr')
+            swimmer = team = swimmer_id = team_id = None
+
+            if row:
+                # Team link (the name of a relay) and swimmer link (the name of an individual)
+                team_link = row.find('a', href=re.compile(r'/team/\d+'))
+                if team_link:
+                    team = team_link.get_text(strip=True)
+                    team_id = re.search(r'/team/(\d+)', team_link['href']).group(1)
+                swimmer_link = row.find('a', href=re.compile(r'/swimmer/\d+'))
+                if swimmer_link:
+                    swimmer = re.sub(r'\s+', ' ', swimmer_link.get_text(strip=True))
+                    swimmer_id = re.search(r'/swimmer/(\d+)', swimmer_link['href']).group(1)
+
+            name = team if is_relay else swimmer
+            results.append({
+                'name': "Unknown" if name is None else name,
+                'time': time_value,
+                'time_url': time_url,
+                'team': team,
+                'swimmer_id': swimmer_id,
+                'team_id': team_id
+            })
+
+        return self._report_event_results(event_name, is_relay, results)
+
+    @staticmethod
+    def _report_event_results(event_name, is_relay, results):
+        """Print the result count of an event page and return its results dict."""
+        print(f"    Found {len(results)} results | Relay: {is_relay}")
+
+        return {
+            'event_name': event_name,
+            'is_relay': is_relay,
+            'results': results
+        }
+
+    def _team_fetcher(self, backend):
+        """The AsyncSwimCloudFetcher for backend='async', None for 'sync'."""
+        if backend == 'async':
+            from async_fetch import AsyncSwimCloudFetcher
+            return AsyncSwimCloudFetcher(self, max_per_host=self.max_per_host)
+        if backend == 'sync':
+            return None
+        raise ValueError(f"Unknown backend '{backend}' (expected 'sync' or 'async')")
+
+    def _team_meet_urls(self, team_id, max_meets, fetcher, seasons=None):
+        """Look up a team's name (sets self.team_name) and meet list (every page of seasons, if given)."""
+        print(f"\n{'=' * 70}")
+        print(f"Starting scrape for Team ID: {team_id}")
+        print(f"Max meets: {max_meets if max_meets else 'All'}")
+        print(f"{'=' * 70}\n")
 
-    def scrape_team_results(self, team_id, max_meets=None, output_file=None, test_mode=False):
+        if seasons is not None:
+            self.team_name = self.get_team_name(team_id)
+            meet_urls = self.get_team_meets(team_id, max_meets, seasons)
+        elif fetcher is not None:
+            self.team_name, meet_urls = fetcher.run(lambda: fetcher.fetch_team(team_id, max_meets))
+        else:
+            # Get team name
+            self.team_name = self.get_team_name(team_id)
+            # Get all meets for the team
+            meet_urls = self.get_team_meets(team_id, max_meets)
+
+        if not meet_urls:
+            print("\n❌ No meets found. Please check the team ID or page structure.")
+            return []
+
+        print(f"Length of meet urls: {len(meet_urls)}")
+        return meet_urls
+
+    def _crawl_frontier(self, journal=None):
         """
-        Scrape all results for a team and save to CSV.
+        The CrawlFrontier for a new crawl: the shared one if the scraper was given one, else a fresh one.
+
+        A shared frontier skips every page an earlier crawl finished, so the crawl must replay
+        those from a journal kept across crawls (resume=True).
+        """
+        if self.frontier is None:
+            return CrawlFrontier()
+        if journal is None or not journal.resume:
+            raise ValueError("A shared crawl frontier needs a journal kept across crawls (resume=True) "
+                             "to replay the pages it already finished")
+        return self.frontier
+
+    @staticmethod
+    def _prefetch_meets(fetcher, meet_urls, journal=None, frontier=None):
+        """
+        The async backend fetches every meet and event page up front (skipping meets the journal or
+        the frontier finished).
+
+        Returns:
+            dict of meet_url -> (meet_name, event_links, event_results); empty for the sync backend
+        """
+        if fetcher is None or not meet_urls:
+            return {}
+        unfinished = [meet_url for meet_url in meet_urls
+                      if (journal is None or not journal.meet_finished(meet_url))
+                      and (frontier is None or frontier.state(meet_url) != 'done')]
+        return fetcher.run(lambda: fetcher.fetch_meets(unfinished))
+
+    def _start_team(self, team_id, max_meets=None, backend='sync', journal=None, seasons=None, frontier=None):
+        """
+        Look up the team name and meet list. The async backend also fetches every meet and event page here.
+
+        Returns:
+            Tuple of (meet_urls, prefetched_meets) where prefetched_meets maps
+            meet_url -> (meet_name, event_links, event_results) for the async backend
+        """
+        fetcher = self._team_fetcher(backend)
+        meet_urls = self._team_meet_urls(team_id, max_meets, fetcher, seasons)
+        return meet_urls, self._prefetch_meets(fetcher, meet_urls, journal, frontier)
+
+    def iter_team_results(self, team_id, max_meets=None, test_mode=False, backend='sync', journal=None,
+                          seasons=None):
+        """
+        Scrape a team's results, yielding each event as soon as it (and its split pages) is parsed.
 
         Args:
             team_id: The team ID
             max_meets: Maximum number of meets to scrape (None for all)
-            output_file: Output Excel filename (None to auto-generate from team name)
+            test_mode: Stop after 10 results
+            backend: 'sync' or 'async' (see scrape_team_results)
+            journal: Optional CrawlJournal (crawl_journal.py); finished work is replayed from it
+            seasons: Backfill these SwimCloud seasons (see get_team_meets)
 
-        Returns:
-            DataFrame with all results
+        Yields:
+            EventRecords (see scrape_records.py) with result and split dictionaries for one event
         """
-        print(f"\n{'=' * 70}")
-        print(f"Starting scrape for Team ID: {team_id}")
-        print(f"Max meets: {max_meets if max_meets else 'All'}")
-        print(f"{'=' * 70}\n")
+        frontier = self._crawl_frontier(journal)
+        meet_urls, prefetched_meets = self._start_team(team_id, max_meets, backend, journal, seasons, frontier)
+        yield from self._iter_meets(meet_urls, prefetched_meets, test_mode, journal, frontier)
+
+    def _journaled_split_times(self, time_url, journal, frontier):
+        """
+        scrape_split_times, skipping split pages the journal already has or the frontier already crawled.
+
+        Returns None if the page can't be fetched (it is marked failed, not journaled, so a
+        resumed run fetches it again), NOT_JOURNALED if an earlier crawl finished it but the
+        journal doesn't have its splits.
+        """
+        if journal is not None:
+            split_times = journal.splits(time_url)
+            if split_times is not None:
+                return split_times
+        if not frontier.claim(time_url, 'time'):
+            return NOT_JOURNALED
+        try:
+            split_times = self._split_times(time_url)
+        except Exception as e:
+            print(f"Error with scraping split times: {e}")
+            frontier.failed(time_url, str(e))
+            return None
+        # Journal before marking done, so the frontier never has a page the journal lacks
+        if journal is not None:
+            journal.finish_splits(time_url, split_times)
+        frontier.done(time_url)
+        return split_times
+
+    def _iter_meets(self, meet_urls, prefetched_meets=None, test_mode=False, journal=None, frontier=None):
+        """
+        Yield EventRecords for every event of every meet in meet_urls.
 
+        With a journal, finished meets and events are replayed from it and everything
+        newly finished is recorded (test_mode runs only record split pages, since their
+        events are cut short). Every meet, event and split page is claimed from the
+        frontier before it is fetched, so none is fetched twice; the frontier is saved
+        after each meet. A page that can't be fetched is marked failed in the frontier
+        and its event and meet are left out of the journal, so a resumed run retries them
+        (an event whose split pages failed is still yielded, without those splits).
+        """
+        prefetched_meets = prefetched_meets or {}
+        frontier = frontier or self._crawl_frontier(journal)
         iterations = 0
         max_iterations = 10
 
-        # Get team name
-        self.team_name = self.get_team_name(team_id)
+        # One thread per pooled browser, so split pages in flight never exceed pool_size
+        split_executor = ThreadPoolExecutor(max_workers=self.pool_size)
+        self.metrics.start_progress(len(meet_urls), 'meets')
 
-        # Generate output filename from team name if not provided
-        if output_file is None:
-            # Clean team name for filename (remove special characters)
-            clean_name = re.sub(r'[^\w\s-]', '', self.team_name)
-            clean_name = re.sub(r'[-\s]+', '_', clean_name)
-            output_file = f'{clean_name}.xlsx'
+        try:
+            for meet_idx, meet_url in enumerate(meet_urls, 1):
+                print(f"\n{'─' * 70}")
+                print(f"Processing Meet {meet_idx}/{len(meet_urls)}")
+                print(f"{'─' * 70}")
 
-        print(f"Output file: {output_file}\n")
+                if journal is not None and journal.meet_finished(meet_url):
+                    print(f"  ↺ Already finished, replaying from journal")
+                    for records in journal.meet_events(meet_url):
+                        iterations += len(records.results)
+                        yield records._replace(season=records.season or self._meet_season_label(meet_url))
+                    self.metrics.advance()
+                    continue
 
-        df = pd.DataFrame()
+                if not frontier.claim(meet_url, 'meet'):
+                    print(f"  ⚠️  Meet already crawled but not in the journal; its results are left out")
+                    self.metrics.advance()
+                    continue
 
-        # Get all meets for the team
-        meet_urls = self.get_team_meets(team_id, max_meets)
+                # Get meet name and all events in the meet
+                if meet_url in prefetched_meets:
+                    meet_name, event_links, event_results = prefetched_meets.pop(meet_url)
+                else:
+                    meet_name, event_links = self.get_meet_events(meet_url)
+                    event_results = {}
 
-        if not meet_urls:
-            print("\n❌ No meets found. Please check the team ID or page structure.")
-            return pd.DataFrame()
+                if not event_links:
+                    print(f"  ⚠️  No events found in this meet, skipping...")
+                    frontier.failed(meet_url, 'no events found')
+                    self.metrics.advance()
+                    continue
 
-        # Create a new workbook
-        with pd.ExcelWriter(output_file) as writer:
-            df.to_excel(writer, index=False)
+                meet_result_count = 0
+                failed_events = 0
+                for position, (event_url, event_number, event_name) in enumerate(event_links):
 
-        print(f"Length of meet urls: {len(meet_urls)}")
+                    if journal is not None:
+                        records = journal.event(meet_url, event_url)
+                        if records is NO_RECORDS:
+                            continue
+                        if records is not None:
+                            iterations += len(records.results)
+                            meet_result_count += len(records.results)
+                            yield records._replace(season=records.season or self._meet_season_label(meet_url))
+                            continue
 
-        for meet_idx, meet_url in enumerate(meet_urls, 1):
-            all_results = []
-            all_split_times = []
+                    if not frontier.claim(event_url, 'event'):
+                        print(f"    ⚠️  Event {event_number} already crawled but not in the journal; "
+                              f"its results are left out")
+                        continue
 
-            print(f"\n{'─' * 70}")
-            print(f"Processing Meet {meet_idx}/{len(meet_urls)}")
-            print(f"{'─' * 70}")
+                    # Get all results for this event directly from the event page
+                    event_data = event_results.get(event_url)
+                    if event_data is None:
+                        event_data = self.get_event_results(event_url, event_name)
+                    is_relay = event_data['is_relay']
+                    results = event_data['results']
 
-            # Get meet name and all events in the meet
-            meet_name, event_links = self.get_meet_events(meet_url)
+                    if event_data.get('error'):
+                        failed_events += 1
+                        if not test_mode:
+                            frontier.failed(event_url, event_data['error'])
+                        continue
 
-            if not event_links:
-                print(f"  ⚠️  No events found in this meet, skipping...")
-                continue
+                    if not results:
+                        print(f"    ⚠️  No results found for event {event_number}")
+                        if not test_mode:
+                            if journal is not None:
+                                journal.finish_event(meet_url, event_url, position, None)
+                            frontier.done(event_url)
+                        continue
 
-            for event_url, event_number, event_name in event_links:
+                    if test_mode:
+                        results = results[:max(max_iterations - iterations, 0)]
+                        if not results:
+                            continue
+                    iterations += len(results)
 
-                # Get all results for this event directly from the event page
-                event_data = self.get_event_results(event_url, event_name)
-                is_relay = event_data['is_relay']
-                results = event_data['results']
+                    # Split pages are fetched by the browser pool, pool_size at a time
+                    split_times_per_result = split_executor.map(
+                        lambda result: self._journaled_split_times(result['time_url'], journal, frontier), results)
 
-                if not results:
-                    print(f"    ⚠️  No results found for event {event_number}")
-                    continue
+                    all_results = []
+                    all_split_times = []
+                    failed_splits = 0
+                    skipped_results = 0
 
-                # Add each result to our data
-                for result in results:
-                    iterations += 1
-
-                    if test_mode and iterations > max_iterations:
-                        break
-
-                    all_results.append({
-                        'meet_name': meet_name,
-                        'meet_url': meet_url,
-                        'event_number': event_number,
-                        'event_name': event_name,
-                        'is_relay': is_relay,
-                        'name': result['name'],
-                        'time': result['time'],
-                        'time_url': result['time_url']
-                    })
-
-                    split_times = self.scrape_split_times(result['time_url'])
-
-                    # Add split time data with all the context information
-                    for split in split_times:
-                        all_split_times.append({
+                    # Add each result to our data
+                    for result, split_times in zip(results, split_times_per_result):
+                        if split_times is NOT_JOURNALED:
+                            skipped_results += 1
+                            continue
+                        if split_times is None:
+                            failed_splits += 1
+                            split_times = []
+                        all_results.append({
                             'meet_name': meet_name,
                             'meet_url': meet_url,
                             'event_number': event_number,
                             'event_name': event_name,
                             'is_relay': is_relay,
                             'name': result['name'],
+                            'time': result['time'],
                             'time_url': result['time_url'],
-                            'Distance': split['Distance'],
-                            'split': split['split'],
-                            'leg': split['leg'],
-                            'Cumulative': split['Cumulative'],
-                            'Person': split['Person'],
+                            'team': result.get('team'),
+                            'swimmer_id': result.get('swimmer_id'),
+                            'team_id': result.get('team_id'),
                         })
 
-            print(f"{'─' * 70}\nCompleted Meet: {meet_name}\n{'─' * 70}")
+                        # Add split time data with all the context information
+                        for split in split_times:
+                            all_split_times.append({
+                                'meet_name': meet_name,
+                                'meet_url': meet_url,
+                                'event_number': event_number,
+                                'event_name': event_name,
+                                'is_relay': is_relay,
+                                'name': result['name'],
+                                'time_url': result['time_url'],
+                                'Distance': split['Distance'],
+                                'split': split['split'],
+                                'leg': split['leg'],
+                                'Cumulative': split['Cumulative'],
+                                'Person': split['Person'],
+                            })
 
+                    meet_result_count += len(all_results)
+                    self.metrics.count('events')
+                    self.metrics.count('results', len(all_results))
+                    records = EventRecords(meet_name, meet_url, event_number, event_name,
+                                           'relay' if is_relay else 'individual', all_results, all_split_times,
+                                           self._meet_season_label(meet_url))
+                    if skipped_results:
+                        print(f"    ⚠️  {skipped_results} split page(s) of event {event_number} already crawled "
+                              f"but not in the journal; those results are left out")
+                    if failed_splits:
+                        print(f"    ⚠️  {failed_splits} split page(s) failed for event {event_number}; "
+                              f"it will be retried on resume")
+                        failed_events += 1
+                        if not test_mode:
+                            frontier.failed(event_url, f'{failed_splits} split page(s) failed')
+                    elif not test_mode:
+                        if journal is not None:
+                            journal.finish_event(meet_url, event_url, position, records)
+                        frontier.done(event_url)
+                    yield records
 
-            df_meet = pd.DataFrame(all_results)
-            df_splits = pd.DataFrame(all_split_times)
+                if failed_events:
+                    print(f"  ⚠️  {failed_events} event(s) failed; the meet will be retried on resume")
+                    if not test_mode:
+                        frontier.failed(meet_url, f'{failed_events} event(s) failed')
+                elif not test_mode:
+                    if journal is not None:
+                        journal.finish_meet(meet_url, meet_name)
+                    frontier.done(meet_url)
+                frontier.save()
+                print(f"{'─' * 70}\nCompleted Meet: {meet_name}\n{'─' * 70}")
+                if not meet_result_count:
+                    print(f"\n❌ No results found for meet '{meet_name}'.\n")
+                self.metrics.count('meets')
+                self.metrics.advance()
+        finally:
+            split_executor.shutdown()
 
-            if not df_meet.empty:
-                # Truncate string for sheet name compatibility
-                trunc_meet_name = df_meet['meet_name'].apply(lambda x: x[:31] if len(x) > 31 else x)
-                sheet_name = trunc_meet_name.iloc[0]
+    def scrape_team_results(self, team_id, max_meets=None, output_file=None, test_mode=False, backend='sync',
+                            sink='excel', excel_export=False, resume=False, journal_path=None, seasons=None):
+        """
+        Scrape all results for a team and save to CSV.
 
-                with pd.ExcelWriter(output_file, mode='a', engine='openpyxl') as writer:
-                    df_meet.to_excel(writer, sheet_name=sheet_name, index=False)
+        Args:
+            team_id: The team ID
+            max_meets: Maximum number of meets to scrape (None for all)
+            output_file: Output Excel filename, or directory for sink='parquet' (None to auto-generate from team name)
+            backend: 'sync' fetches pages one at a time, 'async' fetches every meet and
+                event page concurrently (per-host limits, see async_fetch.py) before parsing splits
+            sink: 'excel' (streamed .xlsx, sheet per meet), 'parquet' (row group per meet) or an
+                OutputSink instance (see output_sinks.py)
+            excel_export: With sink='parquet', also write the .xlsx once at the end
+            resume: Continue an interrupted run: meets, events and split pages recorded in the
+                journal are replayed instead of scraped, and the output is rebuilt in full
+            journal_path: Completion journal file (default .swim_journal/team_<team_id>.sqlite)
+            seasons: Backfill every results page of these SwimCloud seasons (see get_team_meets)
 
-                    if not df_splits.empty:
-                        split_sheet_name = f"{sheet_name[:25]}_Splits"
-                        df_splits.to_excel(writer, sheet_name=split_sheet_name, index=False)
+        Returns:
+            DataFrame with all results
+        """
+        journal = CrawlJournal(journal_path or os.path.join('.swim_journal', f'team_{team_id}.sqlite'), resume=resume)
+        try:
+            return self._scrape_team_results(team_id, max_meets, output_file, test_mode, backend, sink,
+                                             excel_export, journal, seasons)
+        finally:
+            journal.close()
 
-                print(f"\n{'=' * 70}")
-                print(f"✅ Saved {len(df_meet)} results for meet '{sheet_name}' to {output_file}")
-                print(f"{'=' * 70}\n")
-                df = pd.concat([df, df_meet], ignore_index=True)
-            else:
-                print(f"\n❌ No results found for meet '{meet_name}'.\n")
+    @staticmethod
+    def _clean_name(team_name):
+        """Clean team name for filename (remove special characters)"""
+        clean_name = re.sub(r'[^\w\s-]', '', team_name)
+        return re.sub(r'[-\s]+', '_', clean_name)
+
+    @staticmethod
+    def _output_sink(sink, output_file, clean_name):
+        """The OutputSink for a sink argument, named after the team if output_file is not given."""
+        if sink == 'excel':
+            return ExcelSink(output_file or f'{clean_name}.xlsx')
+        if sink == 'parquet':
+            return ParquetSink(output_file or f'{clean_name}_parquet')
+        if isinstance(sink, OutputSink):
+            return sink
+        raise ValueError(f"Unknown sink '{sink}' (expected 'excel', 'parquet' or an OutputSink)")
+
+    def _scrape_team_results(self, team_id, max_meets, output_file, test_mode, backend, sink, excel_export, journal,
+                             seasons):
+        frontier = self._crawl_frontier(journal)
+        meet_urls, prefetched_meets = self._start_team(team_id, max_meets, backend, journal, seasons, frontier)
+
+        clean_name = self._clean_name(self.team_name)
+        output_sink = self._output_sink(sink, output_file, clean_name)
+        output_file = output_sink.path
+
+        print(f"Output file: {output_file}\n")
+
+        if not meet_urls:
+            output_sink.close()
+            return pd.DataFrame()
+
+        meet_frames = []
+        meets = self._iter_meets(meet_urls, prefetched_meets, test_mode, journal, frontier)
+        for meet_name, meet_results, meet_splits in group_meets(meets):
+            # Times stay as printed, with integer-centisecond companions (<col>_cs) for math
+            df_meet = add_centisecond_columns(pd.DataFrame(meet_results))
+            df_splits = add_centisecond_columns(pd.DataFrame(meet_splits))
+
+            # Each meet is written once; the sink never reopens earlier meets
+            with self.metrics.stage('write', output_file):
+                output_sink.write_meet(meet_name, df_meet, df_splits)
+
+            print(f"\n{'=' * 70}")
+            print(f"✅ Saved {len(df_meet)} results for meet '{meet_name[:31]}' to {output_file}")
+            print(f"{'=' * 70}\n")
+            meet_frames.append(df_meet)
+
+        with self.metrics.stage('write', output_file):
+            output_sink.close()
+            if excel_export and isinstance(output_sink, ParquetSink):
+                export_excel(output_sink.path, f'{clean_name}.xlsx')
+
+        df = pd.concat(meet_frames, ignore_index=True) if meet_frames else pd.DataFrame()
 
         print(f"\n{'=' * 70}")
         print(f"✅ Scraping complete!")
@@ -483,27 +1018,117 @@ class SwimCloudScraper:
         print(f"   Unique events: {df['event_name'].nunique()}")
         print(f"   Relay results: {df['is_relay'].sum()}")
         print(f"   Individual results: {(~df['is_relay']).sum()}")
+        if journal.replayed_events or journal.replayed_splits:
+            print(f"   Resumed from journal: {journal.replayed_events} events, {journal.replayed_splits} split pages")
+        self.metrics.finish()
         print(f"{'=' * 70}\n")
 
         return df
 
+    def scrape_teams(self, team_ids, max_meets=None, test_mode=False, backend='sync', sink='excel',
+                     excel_export=False, resume=False, journal_path=None, seasons=None):
+        """
+        Scrape several teams at once, fetching each shared meet (and its event and split pages) only once.
+
+        Every team gets the output scrape_team_results would write for it ({Team_Name}.xlsx or
+        {Team_Name}_parquet/), filled from a single crawl of the union of the teams' meets.
+
+        Args:
+            team_ids: Team IDs (e.g. a whole conference)
+            max_meets: Maximum number of meets per team (None for all)
+            test_mode, backend, excel_export, resume, seasons: As for scrape_team_results
+            sink: 'excel' or 'parquet' (one output per team)
+            journal_path: Completion journal file (default .swim_journal/teams_<id>_<id>...sqlite)
+
+        Returns:
+            dict of team_id -> DataFrame with that team's results
+        """
+        if sink not in ('excel', 'parquet'):
+            raise ValueError(f"Unknown sink '{sink}' (expected 'excel' or 'parquet')")
+
+        fetcher = self._team_fetcher(backend)
+        team_names = {}
+        team_meets = {}
+        for team_id in team_ids:
+            team_meets[team_id] = self._team_meet_urls(team_id, max_meets, fetcher, seasons)
+            team_names[team_id] = self.team_name
+
+        # Union of every team's meets in first-seen order, and which teams swam each one
+        meet_urls = list(dict.fromkeys(meet_url for urls in team_meets.values() for meet_url in urls))
+        meet_teams = {meet_url: [] for meet_url in meet_urls}
+        for team_id, urls in team_meets.items():
+            for meet_url in urls:
+                meet_teams[meet_url].append(team_id)
+        team_meet_count = sum(len(urls) for urls in team_meets.values())
+        print(f"\n{len(meet_urls)} unique meets for {len(team_meets)} teams "
+              f"({team_meet_count} team meets, {team_meet_count - len(meet_urls)} shared fetches saved)\n")
+
+        outputs = {team_id: self._output_sink(sink, None, self._clean_name(team_names[team_id]))
+                   for team_id in team_meets}
+        meet_frames = {team_id: [] for team_id in team_meets}
+
+        journal = CrawlJournal(journal_path or os.path.join(
+            '.swim_journal', 'teams_' + '_'.join(str(team_id) for team_id in team_meets) + '.sqlite'), resume=resume)
+        try:
+            frontier = self._crawl_frontier(journal)
+            prefetched_meets = self._prefetch_meets(fetcher, meet_urls, journal, frontier)
+            for meet_name, meet_results, meet_splits in group_meets(
+                    self._iter_meets(meet_urls, prefetched_meets, test_mode, journal, frontier)):
+                # Times stay as printed, with integer-centisecond companions (<col>_cs) for math
+                df_meet = add_centisecond_columns(pd.DataFrame(meet_results))
+                df_splits = add_centisecond_columns(pd.DataFrame(meet_splits))
+
+                teams = meet_teams[meet_results[0]['meet_url']]
+                for team_id in teams:
+                    with self.metrics.stage('write', outputs[team_id].path):
+                        outputs[team_id].write_meet(meet_name, df_meet, df_splits)
+                    meet_frames[team_id].append(df_meet)
+
+                print(f"\n{'=' * 70}")
+                print(f"✅ Saved {len(df_meet)} results for meet '{meet_name[:31]}' for "
+                      f"{', '.join(team_names[team_id] for team_id in teams)}")
+                print(f"{'=' * 70}\n")
+        finally:
+            journal.close()
+
+        frames = {}
+        print(f"\n{'=' * 70}")
+        print(f"✅ Scraping complete!")
+        for team_id, output_sink in outputs.items():
+            with self.metrics.stage('write', output_sink.path):
+                output_sink.close()
+                if excel_export and isinstance(output_sink, ParquetSink):
+                    export_excel(output_sink.path, f'{self._clean_name(team_names[team_id])}.xlsx')
+            frames[team_id] = pd.concat(meet_frames[team_id], ignore_index=True) if meet_frames[team_id] else pd.DataFrame()
+            print(f"   {team_names[team_id]}: {len(frames[team_id])} results "
+                  f"from {len(meet_frames[team_id])} meets to {output_sink.path}")
+        self.metrics.finish()
+        print(f"{'=' * 70}\n")
+
+        return frames
+
 
 # Example usage
 if __name__ == "__main__":
     test_mode = True
 
     # Initialize scraper with 1 second delay between requests
-    scraper = SwimCloudScraper(delay=1.0, rand_delay_min=8, rand_delay_max=14)
+    scraper = SwimCloudScraper(delay=1.0, rand_delay_min=8, rand_delay_max=14,
+                               pool_size=2,  # Number of headless Chrome workers for split pages
+                               cache_dir='.swim_cache')  # Re-runs read unchanged pages from disk
     
     # Scrape results for team 5245, limiting to 2 meets for testing
     # Remove or increase max_meets for production use
     # output_file will be auto-generated from team name
-    results_df = scraper.scrape_team_results(
-        team_id=5245,
-        max_meets=2,  # Set to None to scrape all meets
-        output_file=None,  # Set to None to auto-generate filename from team name
-        test_mode=test_mode
-    )
+    try:
+        results_df = scraper.scrape_team_results(
+            team_id=5245,
+            max_meets=2,  # Set to None to scrape all meets
+            output_file=None,  # Set to None to auto-generate filename from team name
+            test_mode=test_mode
+        )
+    finally:
+        scraper.close()
     
     # Display sample of results
     if not results_df.empty:
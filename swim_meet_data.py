@@ -7,17 +7,65 @@ import requests
 from bs4 import BeautifulSoup
 import time
 import pandas as pd
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 import re
 import random
 from selenium.webdriver.common.by import By
 import time
+import json
+import os
+
+import lxml.html
+
+from hytek_splits import tokenize_split_lines, individual_splits, relay_legs, relay_split_schedule
+from page_cache import PageCache
+from split_table import split_rows as make_split_rows, splits_frame
+from swim_times import add_centisecond_columns
+from response_archive import ResponseArchive
+from scrape_records import EventRecords
+from meet_follow import MeetFollower
+from scrape_metrics import ScrapeMetrics
+from rate_control import RateController, RETRY_STATUSES
+from browser_pool import ChromeProfile, page_bytes
+from page_ready import load_page, wait_ready, css_present, text_present, or_settled
+from crawl_frontier import CrawlFrontier
+from crawl_journal import CrawlJournal, NO_RECORDS
 
 
 class SwimMeetScraper:
-    def __init__(self, delay=1.0, rand_delay_min=8, rand_delay_max=14, headless=False):
+    # Retries of a page that answered 429/5xx (adaptive rate control only)
+    MAX_RETRIES = 3
+
+    def __init__(self, delay=1.0, rand_delay_min=8, rand_delay_max=14, headless=False, cache_dir=None,
+                 archive_path=None, archive_mode='record', static=True,
+                 split_format='wide', metrics=None, rate_control='adaptive', max_rate=None, ready_timeout=10,
+                 chrome_profile='lean', frontier=None):
         """
         Initialize the scraper with a delay between requests.
+
+        Args:
+            cache_dir: Directory of the on-disk page cache shared with SwimCloudScraper (None to disable)
+            archive_path: Record/replay archive file (None to disable)
+            archive_mode: 'record' saves every page seen into archive_path, 'replay' serves the
+                whole run from it with no network and no browser
+            static: Read HY-TEK pages with requests/lxml and only use Chrome when that fails (default True)
+            split_format: 'wide' puts split_<n>_* columns on each result (max 33 splits), 'long' writes a
+                separate typed split table with one row per split (see split_table.py)
+            metrics: ScrapeMetrics to record stage timings in (scrape_metrics.py); may be shared
+                with a SwimCloudScraper. Default: a private one, summarised by scrape_entire_meet
+            rate_control: 'adaptive' paces each host with a RateController (see rate_control.py);
+                'fixed' sleeps delay seconds before every request
+            max_rate: Adaptive ceiling in requests per second per host (default 1 / delay)
+            ready_timeout: Most seconds a Chrome page may take to show its <frame> or <pre> (see
+                page_ready.py); None waits a fixed `delay` after every page load instead
+            chrome_profile: 'lean' (default: blocks images/fonts/CSS/trackers, eager page loads, warm
+                profile under .swim_chrome/hytek, see browser_pool.py; headless follows `headless`),
+                'stock' for the plain Chrome setup, or a ChromeProfile
+            frontier: CrawlFrontier (crawl_frontier.py) shared by every crawl of this scraper, e.g. one
+                with a path to persist it: event pages it has finished are never fetched again, and the
+                pages an interrupted crawl left queued are finished first, so crawls with it need
+                resume=True (a journal kept across runs) to replay finished events. Default: a fresh
+                in-memory frontier per meet
         """
 
         self.delay = delay
@@ -29,10 +77,85 @@ class SwimMeetScraper:
         })
         self.team_name = None
         self.headless = headless
+        self.page_cache = PageCache(cache_dir) if cache_dir else None
+        self.archive = ResponseArchive(archive_path, archive_mode) if archive_path else None
+        self.static = static
+        self.ready_timeout = ready_timeout
+        if chrome_profile == 'lean':
+            chrome_profile = ChromeProfile(headless=headless, user_data_dir=os.path.join('.swim_chrome', 'hytek'))
+        elif chrome_profile == 'stock':
+            chrome_profile = None
+        elif not isinstance(chrome_profile, ChromeProfile):
+            raise ValueError(f"Unknown chrome_profile '{chrome_profile}' (expected 'lean', 'stock' or a ChromeProfile)")
+        self.chrome_profile = chrome_profile
+        self.frontier = frontier
+        if split_format not in ('wide', 'long'):
+            raise ValueError(f"Unknown split_format '{split_format}' (expected 'wide' or 'long')")
+        self.split_format = split_format
+        self.split_table = None
+        self.metrics = metrics or ScrapeMetrics()
+        if rate_control == 'adaptive':
+            self.rate_controller = RateController(max_rate=max_rate or (1.0 / delay if delay else 1.0),
+                                                  session=self.session, metrics=self.metrics)
+            self.session.hooks['response'].append(self.rate_controller.response_hook)
+        elif rate_control == 'fixed':
+            self.rate_controller = None
+        else:
+            raise ValueError(f"Unknown rate_control '{rate_control}' (expected 'adaptive' or 'fixed')")
+
+        # Chrome is only started if a page can't be read statically (and never in replay)
+        self.driver = None
+
+    def _delay_request(self, url=None):
+        """Add delay between requests to be respectful to the server (the host's turn, when adaptive)."""
+        with self.metrics.stage('sleep', url):
+            if self.rate_controller and url:
+                self.rate_controller.wait(url)
+            else:
+                time.sleep(self.delay)
+
+    def _get_html(self, url):
+        """
+        GET a page with requests (no browser), through the page cache and archive if configured.
 
-        self._init_selenium(headless=headless)
+        Returns:
+            Response body as bytes
+        """
+        with self.metrics.stage('fetch', url):
+            for attempt in range(self.MAX_RETRIES + 1):
+                try:
+                    if self.page_cache:
+                        body = self.page_cache.fetch(self.session, url, lambda: self._delay_request(url))
+                    else:
+                        self._delay_request(url)
+                        response = self.session.get(url, timeout=30)
+                        response.raise_for_status()
+                        body = response.content
+                    break
+                except requests.HTTPError as e:
+                    status = e.response.status_code if e.response is not None else None
+                    if not self.rate_controller or status not in RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                        raise
+                    print(f"HTTP {status} for {url}, retrying ({attempt + 1}/{self.MAX_RETRIES})")
+
+            if self.archive:
+                self.archive.write(url, body, 'http')
+            return body
+
+    def _get_driver(self):
+        """Return the Selenium driver, starting Chrome the first time a page needs it."""
+        if self.driver is None:
+            if self.archive and self.archive.replaying:
+                raise RuntimeError("Replay mode never starts a browser; page is missing from the archive")
+            self._init_selenium(headless=self.headless)
+        return self.driver
 
     def _init_selenium(self, headless):
+        if self.chrome_profile is not None:
+            print(f"Initializing lean Chrome ({'headless' if self.chrome_profile.headless else 'with head'})...")
+            self.driver = self.chrome_profile.start()
+            return
+
         chrome_options = Options()
         if headless:
             chrome_options.add_argument('--headless')
@@ -133,60 +256,150 @@ class SwimMeetScraper:
         Returns:
             list: List of dictionaries containing session info
         """
-        self.driver.get(url)
-        time.sleep(self.delay)
+        if self.archive and self.archive.replaying:
+            sessions = json.loads(self.archive.read_text(url, 'sessions'))
+            print(f"Found {len(sessions)} event sessions (archive)")
+            return sessions
+
+        if self.page_cache:
+            cached_sessions = self.page_cache.get_text(url, 'sessions')
+            if cached_sessions is not None:
+                sessions = json.loads(cached_sessions)
+                print(f"Found {len(sessions)} event sessions (cached)")
+                if self.archive:
+                    self.archive.write_text(url, cached_sessions, 'sessions')
+                return sessions
+
+        sessions = self._static_sessions(url) if self.static else None
+        if not sessions:
+            sessions = self._browser_sessions(url)
+
+        print(f"Found {len(sessions)} event sessions")
 
-        # Not finding .htm links properly, testing stuff
-        # Debugging - this works!! Need to switch to frame first
-        # "It's working!" --Anakin, sometime
-        frame = self.driver.find_element(By.TAG_NAME, 'frame')
-        self.driver.switch_to.frame(frame)
-        htm_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, '.htm')]")
+        if self.page_cache and sessions:
+            self.page_cache.put_text(url, json.dumps(sessions), 'sessions')
+        if self.archive:
+            self.archive.write_text(url, json.dumps(sessions), 'sessions')
+        return sessions
+
+    def _static_sessions(self, url):
+        """
+        Read the session links without a browser: follow the index frameset's <frame src> and parse it with lxml.
+
+        Returns:
+            list of session dictionaries, or None if the static page could not be read
+        """
+        try:
+            index_html = self._get_html(url)
+            with self.metrics.stage('parse', url):
+                index_doc = lxml.html.fromstring(index_html)
+                frame_srcs = index_doc.xpath('//frame/@src')
+            if frame_srcs:
+                frame_url = urljoin(url, frame_srcs[0])
+                frame_html = self._get_html(frame_url)
+                with self.metrics.stage('parse', frame_url):
+                    frame_doc = lxml.html.fromstring(frame_html)
+                if self.archive:
+                    self.archive.write(url, frame_html, 'frame')
+            else:
+                # No frameset, the links are on the index page itself
+                frame_url, frame_doc = url, index_doc
+
+            with self.metrics.stage('parse', frame_url):
+                return self._sessions_from_doc(frame_doc, frame_url, url)
+
+        except Exception as e:
+            print(f"Static session index failed for {url}, falling back to Chrome: {e}")
+            return None
+
+    def _sessions_from_doc(self, frame_doc, frame_url, url):
+        """Session dictionaries for the .htm links of a parsed (lxml) meet index frame."""
+        htm_links = frame_doc.xpath("//a[contains(@href, '.htm')]")
+        print(f"DEBUG: Found {len(htm_links)} .htm links inside frame (static)")
+
+        sessions = []
+        for link in htm_links:
+            text = ' '.join(link.text_content().split())
+            session = self._session_from_link(urljoin(frame_url, link.get('href')), text, url)
+            if session:
+                sessions.append(session)
+        return sessions
+
+    def _browser_sessions(self, url):
+        """Read the session links by rendering the index page in Chrome."""
+        driver = self._get_driver()
+        with self.metrics.stage('render', url):
+            ready = css_present('frame') if self.ready_timeout is not None else None
+            load_page(driver, url, ready, self.ready_timeout, self.delay, self.metrics)
+
+            # Not finding .htm links properly, testing stuff
+            # Debugging - this works!! Need to switch to frame first
+            # "It's working!" --Anakin, sometime
+            frame = driver.find_element(By.TAG_NAME, 'frame')
+            driver.switch_to.frame(frame)
+            if self.ready_timeout is not None:
+                wait_ready(driver, or_settled(css_present("a[href*='.htm']"), self.delay),
+                           self.ready_timeout, url, self.metrics)
+        htm_links = driver.find_elements(By.XPATH, "//a[contains(@href, '.htm')]")
         print(f"DEBUG: Found {len(htm_links)} .htm links inside frame")
+        if self.archive:
+            self.archive.write_text(url, driver.page_source, 'frame')
 
         sessions = []
         for link in htm_links:
-            href = link.get_attribute('href')
-            text = link.text.strip()
+            session = self._session_from_link(link.get_attribute('href'), link.text.strip(), url)
+            if session:
+                sessions.append(session)
 
-            # Skip if it's not a valid event link
-            if not text or 'Latest Completed Event' in text:
-                continue
+        driver.switch_to.default_content()
+        return sessions
 
-            # Extract event number from text (e.g., "#1" -> "1")
-            event_number = None
-            if text.startswith('#'):
-                event_number = text.split()[0].replace('#', '')
-
-            # Determine session type
-            session_type = None
-            text_lower = text.lower()
-            if 'prelims' in text_lower:
-                session_type = 'Prelims'
-            elif 'finals' in text_lower:
-                session_type = 'Finals'
-            elif 'swim-off' in text_lower or 'swim off' in text_lower:
-                session_type = 'Swim-off'
-            else:
-                session_type = 'Relay Only'
+    def _session_from_link(self, href, text, url):
+        """
+        Build the session dictionary for one event link in the meet index.
 
-            # Extract just the filename from href
-            filename = href.split('/')[-1] if '/' in href else href
+        Args:
+            href: Link target (absolute or relative)
+            text: Visible link text (e.g. "#1 Women 200 Yard Medley Relay")
+            url: The URL of the meet index page
 
-            # Build full URL if needed
-            full_url = href if href.startswith('http') else f"{url.rsplit('/', 1)[0]}/{filename}"
+        Returns:
+            dict, or None if the link is not an event session
+        """
+        # Skip if it's not a valid event link
+        if not text or 'Latest Completed Event' in text:
+            return None
+
+        # Extract event number from text (e.g., "#1" -> "1")
+        event_number = None
+        if text.startswith('#'):
+            event_number = text.split()[0].replace('#', '')
+
+        # Determine session type
+        session_type = None
+        text_lower = text.lower()
+        if 'prelims' in text_lower:
+            session_type = 'Prelims'
+        elif 'finals' in text_lower:
+            session_type = 'Finals'
+        elif 'swim-off' in text_lower or 'swim off' in text_lower:
+            session_type = 'Swim-off'
+        else:
+            session_type = 'Relay Only'
 
-            sessions.append({
-                'event_number': event_number,
-                'event_name': text,
-                'session_type': session_type,
-                'href': filename,
-                'full_url': full_url
-            })
+        # Extract just the filename from href
+        filename = href.split('/')[-1] if '/' in href else href
 
-        print(f"Found {len(sessions)} event sessions")
-        self.driver.switch_to.default_content()
-        return sessions
+        # Build full URL if needed
+        full_url = href if href.startswith('http') else f"{url.rsplit('/', 1)[0]}/{filename}"
+
+        return {
+            'event_number': event_number,
+            'event_name': text,
+            'session_type': session_type,
+            'href': filename,
+            'full_url': full_url
+        }
 
     def _extract_meet_name(self, page_text):
         """Extract meet name from page text."""
@@ -219,20 +432,19 @@ class SwimMeetScraper:
         Determine the distances for each leg based on relay type.
         Returns list of distances (e.g., [50, 100, 150, 200] for 200 relay)
         """
-        if '200' in event_name and 'Relay' in event_name:
-            return [50, 100, 150, 200]
-        elif '400' in event_name and 'Relay' in event_name:
-            return [100, 200, 300, 400]
-        elif '800' in event_name and 'Relay' in event_name:
-            return [200, 400, 600, 800]
+        leg_distance, _, _ = relay_split_schedule(event_name, split_count=None)
+        if leg_distance:
+            return [leg_distance * leg for leg in range(1, 5)]
         else:
             # Default to 4 legs with unknown distances
             return [1, 2, 3, 4]
 
-    def _parse_relay_results(self, page_text, meet_name, meet_url, event_number, event_name):
+    def _parse_relay_results(self, page_text, meet_name, meet_url, event_number, event_name, split_rows=None):
         """
         Parse relay event results from page text with individual swimmer splits.
         Returns: list of dictionaries with detailed split data
+
+        If a split_rows list is given, every leg's sub-splits are also added to it in long format.
         """
         results = []
 
@@ -264,7 +476,7 @@ class SwimMeetScraper:
             rank_match = re.match(r'^\s*(\d+)\s+', line)
             if rank_match:
                 team_name = None
-                swimmers = []  # List of (order, name) tuples
+                swimmers = []  # List of (order, name, reaction) tuples
                 splits_lines = []
 
                 # Extract team name from the first line
@@ -303,13 +515,14 @@ class SwimMeetScraper:
                             if not part:
                                 continue
 
-                            # Extract order number and name
+                            # Extract order number, exchange/reaction time and name
                             # Pattern: "1) Caribe, Guilherme JR" or "2) r:0.23 Taylor, Lamar 5Y"
-                            match = re.match(r'(\d+)\)\s*(?:r:[\d.+-]+\s*)?(.+)', part)
+                            match = re.match(r'(\d+)\)\s*(?:r:([\d.+-]+|NRT)\s*)?(.+)', part)
                             if match:
                                 order = int(match.group(1))
-                                name = match.group(2).strip()
-                                swimmers.append((order, name))
+                                reaction = match.group(2)
+                                name = match.group(3).strip()
+                                swimmers.append((order, name, reaction))
                         i += 1
                     else:
                         break
@@ -318,6 +531,9 @@ class SwimMeetScraper:
                 # Lines start with "r:" or just have times
                 while i < len(lines):
                     next_line = lines[i].strip()
+                    if re.match(r'^\s*(\d+)\s+', next_line):
+                        # Next team already (no splits for this one, e.g. DQ)
+                        break
                     if next_line.startswith('r:') or re.match(r'^\d+\.\d+', next_line):
                         splits_lines.append(next_line)
                         i += 1
@@ -333,87 +549,44 @@ class SwimMeetScraper:
                         break
                     i += 1
 
-                # Combine all split lines into one string
-                splits_text = ' '.join(splits_lines)
-
-                # Parse splits from the combined splits text
-                if splits_text and swimmers:
-                    # Extract all time values
-                    time_pattern = r'(\d+:\d+\.\d+|\d+\.\d+)'
-                    all_times = re.findall(time_pattern, splits_text)
-
-                    leg_data = []
-                    times_idx = 0
-
-                    # Skip reaction time if present (r:+0.58 becomes 0.58)
-                    if times_idx < len(all_times) and float(all_times[times_idx]) < 1.0:
-                        times_idx += 1
-
-                    # First leg: split, leg, cumulative (cumulative appears twice)
-                    if times_idx + 2 < len(all_times):
-                        split_time = all_times[times_idx]  # 19.28
-                        leg_time = all_times[times_idx + 1]  # 40.57
-                        cumulative = all_times[times_idx + 2]  # 40.57 (duplicate)
-                        leg_data.append((split_time, leg_time, cumulative))
-                        times_idx += 3
-
-                    # Remaining legs follow pattern:
-                    # intermediate_cumulative, split, cumulative, leg
-                    # We want: split, leg, cumulative
-                    while times_idx < len(all_times) and len(leg_data) < len(swimmers):
-                        # Skip intermediate cumulative (e.g., 59.68)
-                        times_idx += 1
-
-                        if times_idx >= len(all_times):
-                            break
-
-                        # Get split time (e.g., 19.11)
-                        split_time = all_times[times_idx]
-                        times_idx += 1
-
-                        if times_idx >= len(all_times):
-                            break
-
-                        # Get cumulative time (e.g., 1:21.59)
-                        cumulative = all_times[times_idx]
-                        times_idx += 1
-
-                        if times_idx >= len(all_times):
-                            break
-
-                        # Get leg time (e.g., 41.02)
-                        leg_time = all_times[times_idx]
-                        times_idx += 1
-
-                        leg_data.append((split_time, leg_time, cumulative))
+                # Parse splits: one pass over the tokens, any number of splits per leg
+                # (200 relays with 50 or 25 splits, 400s with 8, 800s with 16, ...)
+                if splits_lines and swimmers:
+                    legs = relay_legs(tokenize_split_lines(splits_lines), event_name)
 
                     # Create a result entry for each swimmer
-                    for idx, (order, name) in enumerate(swimmers):
-                        if idx < len(leg_data):
-                            split_time, leg_time, cumulative = leg_data[idx]
-
-                            results.append({
-                                'meet_name': meet_name,
-                                'meet_url': meet_url,
-                                'event_number': event_number,
-                                'event_name': event_name,
-                                'is_relay': True,
-                                'Team Name': team_name,
-                                'Name': name,
-                                'Order': order,
-                                'Split': split_time,
-                                'Leg': leg_time,
-                                'Cumulative': cumulative
-                            })
+                    for (order, name, reaction), leg in zip(swimmers, legs):
+                        results.append({
+                            'meet_name': meet_name,
+                            'meet_url': meet_url,
+                            'event_number': event_number,
+                            'event_name': event_name,
+                            'is_relay': True,
+                            'Team Name': team_name,
+                            'Name': name,
+                            'Order': order,
+                            'Split': leg.splits[0][1],
+                            'Leg': leg.leg_time,
+                            'Cumulative': leg.cumulative,
+                            'Reaction': reaction or leg.reaction,
+                            'Leg_Distance': leg.distance,
+                            'Leg_Splits': ' '.join(split_time for _, split_time, _ in leg.splits)
+                        })
+                        if split_rows is not None:
+                            split_rows.extend(make_split_rows(meet_url, event_number, event_name, name,
+                                                              leg.splits, order=order))
             else:
                 i += 1
 
         return results
 
-    def _parse_individual_results(self, page_text, meet_name, meet_url, event_number, event_name):
+    def _parse_individual_results(self, page_text, meet_name, meet_url, event_number, event_name, split_rows=None):
         """
         Parse individual event results from page text with all splits.
         Returns: list of dictionaries with detailed split data (up to 33 splits)
+
+        If a split_rows list is given, splits go into it in long format (see split_table.py,
+        no split limit) and the result rows carry no split_<n>_* columns.
         """
         results = []
 
@@ -506,91 +679,17 @@ class SwimMeetScraper:
                         break
 
                 # Parse all splits from the collected lines
+                # Each line is tokenized once (reaction, time, "(split)", DQ/NS markers) and the
+                # split rows are built from that token stream
                 splits_data = {}
-                if splits_lines:
-                    all_splits_text = ' '.join(splits_lines)
-
-                    # Extract all times for processing
-                    time_pattern = r'(\d+:\d+\.\d+|\d+\.\d+)'
-                    all_times = re.findall(time_pattern, all_splits_text)
-
-                    # Parse splits - the pattern is:
-                    # r:+0.66 split_time cumulative_time (diff)
-                    # OR
-                    # r:+0.66 split_time_only (with no parentheses after, meaning no cumulative)
-                    #         cumulative_time (diff)
-
-                    # Strategy: Check if each time has parentheses immediately after it
-                    # - If YES with format "time (something)" → time is cumulative
-                    # - If NO → time is just a split time, no cumulative yet
-
-                    split_num = 1
-                    times_idx = 0
-
-                    # Skip reaction time if present
-                    if times_idx < len(all_times) and float(all_times[times_idx]) < 1.0:
-                        times_idx += 1
-
-                    # Parse times by checking if they have parentheses after them
-                    while times_idx < len(all_times) and split_num <= 33:
-                        if times_idx >= len(all_times):
+                splits = individual_splits(tokenize_split_lines(splits_lines)) if splits_lines else []
+                if split_rows is None:
+                    for split_num, (distance, split_time, cumulative) in enumerate(splits, 1):
+                        if split_num > 33:
                             break
-
-                        current_time = all_times[times_idx]
-
-                        # Determine distance based on split number
-                        # For 1650, typically 50 yard splits
-                        distance = split_num * 50
-
-                        # Check if current_time has parentheses after it in the original text
-                        # Pattern: current_time (something)
-                        has_parentheses_after = re.search(
-                            re.escape(current_time) + r'\s*\(',
-                            all_splits_text
-                        )
-
-                        if has_parentheses_after:
-                            # This time has parentheses, so it's a cumulative time
-                            # We need to find what the split time was
-                            # The split time is the value in the parentheses
-                            # But we already have it as the "next" time in our list
-
-                            # Actually, let's reconsider:
-                            # Format is: cumulative_time (split_diff)
-                            # So current_time is the cumulative
-                            # We need to calculate or get the split from parentheses
-
-                            # Extract the diff from parentheses
-                            paren_match = re.search(
-                                re.escape(current_time) + r'\s*\(([\d:.]+)\)',
-                                all_splits_text
-                            )
-
-                            if paren_match:
-                                split_diff = paren_match.group(1)
-
-                                splits_data[f'split_{split_num}_distance'] = distance
-                                splits_data[f'split_{split_num}_time'] = split_diff
-                                splits_data[f'split_{split_num}_cumulative'] = current_time
-
-                                # Skip the diff time in our times array since we already used it
-                                times_idx += 1
-                                if times_idx < len(all_times) and all_times[times_idx] == split_diff:
-                                    times_idx += 1
-
-                                split_num += 1
-                            else:
-                                # Couldn't find parentheses pattern, skip this time and move on
-                                times_idx += 1
-                        else:
-                            # This time has NO parentheses after it
-                            # So it's just a split time with no cumulative
-                            splits_data[f'split_{split_num}_distance'] = distance
-                            splits_data[f'split_{split_num}_time'] = current_time
-                            splits_data[f'split_{split_num}_cumulative'] = None
-
-                            times_idx += 1
-                            split_num += 1
+                        splits_data[f'split_{split_num}_distance'] = distance
+                        splits_data[f'split_{split_num}_time'] = split_time
+                        splits_data[f'split_{split_num}_cumulative'] = cumulative
 
                 if swimmer_name:
                     result = {
@@ -606,11 +705,14 @@ class SwimMeetScraper:
                         'Finals_Time': finals_time
                     }
 
-                    # Add all split columns (up to 33)
-                    for split_idx in range(1, 34):
-                        result[f'split_{split_idx}_distance'] = splits_data.get(f'split_{split_idx}_distance', None)
-                        result[f'split_{split_idx}_time'] = splits_data.get(f'split_{split_idx}_time', None)
-                        result[f'split_{split_idx}_cumulative'] = splits_data.get(f'split_{split_idx}_cumulative', None)
+                    if split_rows is None:
+                        # Add all split columns (up to 33)
+                        for split_idx in range(1, 34):
+                            result[f'split_{split_idx}_distance'] = splits_data.get(f'split_{split_idx}_distance', None)
+                            result[f'split_{split_idx}_time'] = splits_data.get(f'split_{split_idx}_time', None)
+                            result[f'split_{split_idx}_cumulative'] = splits_data.get(f'split_{split_idx}_cumulative', None)
+                    else:
+                        split_rows.extend(make_split_rows(meet_url, event_number, event_name, swimmer_name, splits))
 
                     results.append(result)
             else:
@@ -619,78 +721,175 @@ class SwimMeetScraper:
         print(f"DEBUG: Completed parsing. Found {len(results)} total results")
         return results
 
-    def parse_event_page(self, url, meet_name=None, meet_url=None):
+    def _get_event_text(self, url):
         """
-        Parse an event results page and extract all relevant data.
+        Get the results text of an event page, from the archive or page cache when a copy is stored.
 
         Args:
-            url: URL of the event page to parse
-            meet_name: Optional meet name (will be extracted if not provided)
-            meet_url: Optional meet URL (will use the full event URL if not given)
+            url: URL of the event page
 
         Returns:
-            tuple: (pandas.DataFrame, event_type) where event_type is 'relay', 'individual', or 'diving'
+            str: Text of the <pre> element (or of the body if the page has no <pre>)
+        """
+        if self.archive and self.archive.replaying:
+            return self.archive.read_text(url, 'pre')
+
+        page_text = self.page_cache.get_text(url, 'pre') if self.page_cache else None
+        if page_text is None:
+            page_text = self._static_event_text(url) if self.static else None
+            if not page_text:
+                page_text = self._fetch_event_text(url)
+            if self.page_cache and page_text.strip():
+                self.page_cache.put_text(url, page_text, 'pre')
+
+        if self.archive:
+            self.archive.write_text(url, page_text, 'pre')
+        return page_text
+
+    def _static_event_text(self, url):
+        """
+        Read the <pre> text of a HY-TEK event page from the raw HTML (no browser).
+
+        Returns:
+            str, or None if the page has no usable <pre> block
+        """
+        try:
+            html = self._get_html(url)
+            with self.metrics.stage('parse', url):
+                return self._pre_text(html)
+
+        except Exception as e:
+            print(f"Static fetch failed for {url}, falling back to Chrome: {e}")
+            return None
+
+    @staticmethod
+    def _pre_text(html):
+        """Text of the first <pre> of an event page's HTML, or None if it has none."""
+        pre_elements = lxml.html.fromstring(html).xpath('//pre')
+        if not pre_elements:
+            return None
+        # Match what Selenium's .text gives us: no &nbsp;, no \r, no outer whitespace
+        page_text = pre_elements[0].text_content().replace('\xa0', ' ').replace('\r\n', '\n').strip()
+        return page_text or None
+
+    def _fetch_event_text(self, url):
+        """Load an event page in Chrome and read its <pre> text."""
+        driver = self._get_driver()
+        # Be respectful with delays (only when we actually hit the site)
+        self._delay_request(url)
+        with self.metrics.stage('render', url):
+            ready = or_settled(text_present('pre'), self.delay) if self.ready_timeout is not None else None
+            load_page(driver, url, ready, self.ready_timeout, self.delay, self.metrics)
+            self.metrics.count('render_bytes', page_bytes(driver))
+
+            # Get the page text from <pre> tag (results are typically in <pre> tags)
+            try:
+                pre_element = driver.find_element(By.TAG_NAME, 'pre')
+                page_text = pre_element.text
+            except Exception:
+                # Fallback to body text if no <pre> tag
+                page_text = driver.find_element(By.TAG_NAME, 'body').text
+        return page_text
+
+    def _parse_event(self, url, meet_name=None, meet_url=None, split_rows=None, page_text=None):
+        """
+        Parse an event results page into result dictionaries.
+
+        page_text is the page's <pre> text if the caller already has it (otherwise it is fetched).
+
+        Returns:
+            tuple: (results, event_type, event_number, event_name); results is empty and
+            event_type None if the page has no event header
         """
         print(f"Parsing event page: {url}")
 
-        self.driver.get(url)
-        time.sleep(self.delay)
+        if page_text is None:
+            page_text = self._get_event_text(url)
 
-        # Get the page text from <pre> tag (results are typically in <pre> tags)
-        try:
-            pre_element = self.driver.find_element(By.TAG_NAME, 'pre')
-            page_text = pre_element.text
-        except Exception:
-            # Fallback to body text if no <pre> tag
-            page_text = self.driver.find_element(By.TAG_NAME, 'body').text
-
-        # Extract meet name if not provided
-        if not meet_name:
-            meet_name = self._extract_meet_name(page_text)
-
-        # Use the full event URL as meet_url if not provided
-        if not meet_url:
-            meet_url = url
-
-        # Extract event information
-        event_number, event_name, is_relay = self._extract_event_info(page_text)
-
-        if not event_number or not event_name:
-            print(f"Could not extract event information from {url}")
-            return pd.DataFrame(), None
-
-        print(f"Event {event_number}: {event_name} (Relay: {is_relay})")
-
-        # Check if this is a diving event
-        is_diving = 'Diving' in event_name
-
-        # Parse results based on event type
-        if is_relay:
-            results = self._parse_relay_results(page_text, meet_name, meet_url,
-                                                event_number, event_name)
-            event_type = 'relay'
-        elif is_diving:
-            results = self._parse_diving_results(page_text, meet_name, meet_url,
-                                                 event_number, event_name)
-            event_type = 'diving'
-        else:
-            results = self._parse_individual_results(page_text, meet_name, meet_url,
+        with self.metrics.stage('parse', url):
+            # Extract meet name if not provided
+            if not meet_name:
+                meet_name = self._extract_meet_name(page_text)
+
+            # Use the full event URL as meet_url if not provided
+            if not meet_url:
+                meet_url = url
+
+            # Extract event information
+            event_number, event_name, is_relay = self._extract_event_info(page_text)
+
+            if not event_number or not event_name:
+                print(f"Could not extract event information from {url}")
+                return [], None, event_number, event_name
+
+            print(f"Event {event_number}: {event_name} (Relay: {is_relay})")
+
+            # Check if this is a diving event
+            is_diving = 'Diving' in event_name
+
+            # Parse results based on event type
+            if is_relay:
+                results = self._parse_relay_results(page_text, meet_name, meet_url,
+                                                    event_number, event_name, split_rows)
+                event_type = 'relay'
+            elif is_diving:
+                results = self._parse_diving_results(page_text, meet_name, meet_url,
                                                      event_number, event_name)
-            event_type = 'individual'
+                event_type = 'diving'
+            else:
+                results = self._parse_individual_results(page_text, meet_name, meet_url,
+                                                         event_number, event_name, split_rows)
+                event_type = 'individual'
+
+            print(f"Extracted {len(results)} results")
+            return results, event_type, event_number, event_name
 
-        print(f"Extracted {len(results)} results")
+    def parse_event_page(self, url, meet_name=None, meet_url=None, split_rows=None):
+        """
+        Parse an event results page and extract all relevant data.
+
+        Args:
+            url: URL of the event page to parse
+            meet_name: Optional meet name (will be extracted if not provided)
+            meet_url: Optional meet URL (will use the full event URL if not given)
+            split_rows: Optional list; if given, splits are appended to it in long format
+                instead of being spread over split_<n>_* columns
+
+        Returns:
+            tuple: (pandas.DataFrame, event_type) where event_type is 'relay', 'individual', or 'diving'
+        """
+        results, event_type, _, _ = self._parse_event(url, meet_name, meet_url, split_rows)
 
-        # Convert to DataFrame
-        df = pd.DataFrame(results)
+        # Convert to DataFrame, with integer-centisecond companions (<col>_cs) for every time column
+        df = add_centisecond_columns(pd.DataFrame(results))
         return df, event_type
 
-    def scrape_entire_meet(self, index_url, output_file='meet_results.xlsx'):
+    def _crawl_frontier(self, journal=None):
         """
-        Scrape all events from a meet and save to Excel with separate sheets for relays, individuals, and diving.
+        The CrawlFrontier for a new crawl: the shared one if the scraper was given one, else a fresh one.
+
+        A shared frontier skips every event page an earlier crawl finished, so the crawl must replay
+        those from a journal kept across crawls (resume=True).
+        """
+        if self.frontier is None:
+            return CrawlFrontier()
+        if journal is None or not journal.resume:
+            raise ValueError("A shared crawl frontier needs a journal kept across crawls (resume=True) "
+                             "to replay the events it already finished")
+        return self.frontier
+
+    def iter_meet_results(self, index_url, journal=None):
+        """
+        Scrape all events from a meet, yielding each event as soon as it is parsed.
 
         Args:
             index_url: URL of the meet index page
-            output_file: Path to output Excel file
+            journal: Optional CrawlJournal (crawl_journal.py); events it has are replayed from it
+                and every newly parsed event is recorded
+
+        Yields:
+            EventRecords (see scrape_records.py); splits holds long-format split rows
+            when split_format='long', otherwise it is empty
         """
         print(f"Starting scrape of meet: {index_url}")
 
@@ -700,12 +899,9 @@ class SwimMeetScraper:
         # Extract meet name from first page
         if sessions:
             first_event_url = sessions[0]['full_url']
-            self.driver.get(first_event_url)
-            time.sleep(self.delay)
 
             try:
-                pre_element = self.driver.find_element(By.TAG_NAME, 'pre')
-                page_text = pre_element.text
+                page_text = self._get_event_text(first_event_url)
                 meet_name = self._extract_meet_name(page_text)
             except:
                 meet_name = "Unknown Meet"
@@ -714,64 +910,133 @@ class SwimMeetScraper:
 
         print(f"Meet name: {meet_name}")
 
-        # Separate results by type
-        relay_results = []
-        individual_results = []
-        diving_results = []
+        # Every event page goes through the frontier: pages listed twice are fetched once, pages a
+        # shared frontier already finished are skipped (and replayed from the journal), and pages it
+        # still has queued come first
+        frontier = self._crawl_frontier(journal)
+        for position, session in enumerate(sessions):
+            if journal is not None:
+                records = journal.event(index_url, session['full_url'])
+                if records is NO_RECORDS:
+                    continue
+                if records is not None:
+                    yield records
+                    continue
+            frontier.add(session['full_url'], 'event',
+                         {'meet_name': meet_name, 'session': session, 'index_url': index_url, 'position': position})
+        total = frontier.pending('event')
+        self.metrics.start_progress(total, 'events')
 
         # Parse each event
-        for i, session in enumerate(sessions):
-            print(f"\nProcessing event {i + 1}/{len(sessions)}: {session['event_name']}")
+        for i in range(total):
+            entry = frontier.pop('event')
+            if entry is None:
+                break
+            session = entry.data['session']
+            print(f"\nProcessing event {i + 1}/{total}: {session['event_name']}")
 
+            split_rows = [] if self.split_format == 'long' else None
             try:
-                df, event_type = self.parse_event_page(session['full_url'],
-                                                       meet_name=meet_name,
-                                                       meet_url=session['full_url'])
-
-                if not df.empty:
-                    if event_type == 'relay':
-                        relay_results.append(df)
-                    elif event_type == 'individual':
-                        individual_results.append(df)
-                    elif event_type == 'diving':
-                        diving_results.append(df)
-
-                # Be respectful with delays
-                time.sleep(self.delay)
-
+                results, event_type, event_number, event_name = self._parse_event(session['full_url'],
+                                                                                  meet_name=entry.data['meet_name'],
+                                                                                  meet_url=session['full_url'],
+                                                                                  split_rows=split_rows)
             except Exception as e:
                 print(f"Error parsing {session['full_url']}: {e}")
                 import traceback
                 traceback.print_exc()
+                frontier.failed(entry.url, e)
+                frontier.save()
+                self.metrics.advance()
                 continue
 
+            records = None
+            if results:
+                records = EventRecords(entry.data['meet_name'], session['full_url'], event_number, event_name,
+                                       event_type, results, split_rows or [])
+            # Journal before marking done, so the frontier never has a page the journal lacks
+            if journal is not None:
+                journal.finish_event(entry.data.get('index_url', index_url), entry.url,
+                                     entry.data.get('position', 0), records)
+            frontier.done(entry.url)
+            frontier.save()
+            self.metrics.advance()
+            if records is not None:
+                self.metrics.count('events')
+                self.metrics.count('results', len(results))
+                yield records
+
+    def follow_meet(self, index_url, poll_interval=30, max_polls=None):
+        """
+        Follow a live meet: poll it with conditional requests and yield only new or changed events.
+
+        Args:
+            index_url: URL of the meet index page
+            poll_interval: Seconds between polls
+            max_polls: Stop after this many polls (None to follow until interrupted)
+
+        Yields:
+            EventRecords (see scrape_records.py); the first poll yields every posted event
+        """
+        follower = MeetFollower(self, index_url, poll_interval)
+        yield from follower.follow(max_polls)
+
+    def scrape_entire_meet(self, index_url, output_file='meet_results.xlsx', resume=False, journal_path=None):
+        """
+        Scrape all events from a meet and save to Excel with separate sheets for relays, individuals, and diving.
+
+        Args:
+            index_url: URL of the meet index page
+            output_file: Path to output Excel file
+            resume: Continue an interrupted run: events recorded in the journal are replayed instead
+                of scraped, and the workbook is rebuilt in full
+            journal_path: Completion journal file (default .swim_journal/meet_<index path>.sqlite)
+
+        With split_format='long' the typed split table is also kept on self.split_table.
+        """
+        # Separate results by type
+        results_by_type = {'relay': [], 'individual': [], 'diving': []}
+        split_rows = []
+
+        meet_key = re.sub(r'[^\w-]+', '_', urlsplit(index_url).path).strip('_')
+        journal = CrawlJournal(journal_path or os.path.join('.swim_journal', f'meet_{meet_key}.sqlite'), resume=resume)
+        try:
+            for records in self.iter_meet_results(index_url, journal):
+                results_by_type[records.event_type].extend(records.results)
+                split_rows.extend(records.splits)
+        finally:
+            journal.close()
+
+        # Times keep their printed strings, with integer-centisecond companions (<col>_cs)
+        relay_df = add_centisecond_columns(pd.DataFrame(results_by_type['relay']))
+        individual_df = add_centisecond_columns(pd.DataFrame(results_by_type['individual']))
+        diving_df = add_centisecond_columns(pd.DataFrame(results_by_type['diving']))
+
         # Save to Excel with multiple sheets
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            if relay_results:
-                relay_df = pd.concat(relay_results, ignore_index=True)
+        with self.metrics.stage('write', output_file), pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+            if not relay_df.empty:
                 print(f"\nSaving {len(relay_df)} relay results to 'Relay Results' sheet")
                 relay_df.to_excel(writer, sheet_name='Relay Results', index=False)
 
-            if individual_results:
-                individual_df = pd.concat(individual_results, ignore_index=True)
+            if not individual_df.empty:
                 print(f"Saving {len(individual_df)} individual results to 'Individual Results' sheet")
                 individual_df.to_excel(writer, sheet_name='Individual Results', index=False)
 
-            if diving_results:
-                diving_df = pd.concat(diving_results, ignore_index=True)
+            if not diving_df.empty:
                 print(f"Saving {len(diving_df)} diving results to 'Diving Results' sheet")
                 diving_df.to_excel(writer, sheet_name='Diving Results', index=False)
 
+            if split_rows:
+                # Long split table (typed); long_to_wide() in split_table.py rebuilds the wide view
+                self.split_table = splits_frame(split_rows)
+                print(f"Saving {len(self.split_table)} splits to 'Splits' sheet")
+                self.split_table.to_excel(writer, sheet_name='Splits', index=False)
+
             print(f"\nSuccessfully saved to {output_file}")
+        self.metrics.finish()
 
         # Return combined results
-        all_results = []
-        if relay_results:
-            all_results.extend(relay_results)
-        if individual_results:
-            all_results.extend(individual_results)
-        if diving_results:
-            all_results.extend(diving_results)
+        all_results = [df for df in (relay_df, individual_df, diving_df) if not df.empty]
 
         if all_results:
             return pd.concat(all_results, ignore_index=True)
@@ -780,9 +1045,18 @@ class SwimMeetScraper:
             return pd.DataFrame()
 
     def close(self):
-        """Close the Selenium driver."""
-        if hasattr(self, 'driver'):
+        """Close the Selenium driver and finish the archive, if any."""
+        if getattr(self, 'driver', None):
             self.driver.quit()
+        if getattr(self, 'archive', None):
+            self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Always finish an archive recording, even when the scrape fails or is interrupted
+        self.close()
 
 
 if __name__ == "__main__":
@@ -790,7 +1064,8 @@ if __name__ == "__main__":
     scraper = SwimMeetScraper(delay=1.0,  # General delay b/w requests
                               rand_delay_min=8,  # Min random delay b/w split parses
                               rand_delay_max=14,  # Max random delay b/w split parses
-                              headless=False  # Set to False to see browser window
+                              headless=False,  # Set to False to see browser window
+                              cache_dir='.swim_cache'  # Re-runs read finished pages from disk instead of the site
                               )
 
     try:
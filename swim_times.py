@@ -0,0 +1,98 @@
+# Vectorized swim-time parsing to integer centiseconds
+#
+# Both scrapers keep times as the strings the sites print ("1:35.48", "21.34",
+# "2:42.30N", "x55.12", "DQ"). These helpers convert whole pandas Series or
+# NumPy arrays of them to int32 centiseconds in one pass. Anything that is not
+# a time (DQ, NS, NT, SCR, blanks) comes back as a masked value (<NA>).
+# time_to_centiseconds() is the same parse for one string, for per-token callers
+# such as the HY-TEK split tokenizer.
+
+import re
+
+import pandas as pd
+
+# Optional exhibition/flag prefix (x, *), optional sign (reaction times), M:SS.ss or SS.ss,
+# then any suffix letters/flags HY-TEK and SwimCloud tack on (N, q, J, Q, R, *, #)
+_TIME_PATTERN = (r'^[xX*]?(?P<sign>[+-])?(?:(?P<minutes>\d+):)?(?P<seconds>\d+)\.(?P<fraction>\d{1,2})'
+                 r'[A-Za-z*#]*$')
+_TIME_RE = re.compile(_TIME_PATTERN)
+
+# Output columns that hold times, for each scraper
+SWIMCLOUD_TIME_COLUMNS = ['time', 'split', 'leg', 'Cumulative']
+HYTEK_TIME_COLUMNS = ['Finals_Time', 'Split', 'Leg', 'Cumulative', 'Reaction']
+
+
+def time_to_centiseconds(text):
+    """
+    Convert one swim time string to integer centiseconds.
+
+    Args:
+        text: Time such as "1:35.48", "21.34" or "+0.66"
+
+    Returns:
+        int, or None if the text is not a time
+    """
+    match = _TIME_RE.match(text.strip()) if text else None
+    if match is None:
+        return None
+    sign, minutes, seconds, fraction = match.groups()
+    centis = int(minutes or 0) * 6000 + int(seconds) * 100 + int(fraction.ljust(2, '0'))
+    return -centis if sign == '-' else centis
+
+
+def to_centiseconds(values):
+    """
+    Convert swim time strings to int32 centiseconds.
+
+    Args:
+        values: pandas Series, NumPy array or list of time strings
+
+    Returns:
+        pandas Series with dtype Int32; DQ/NS/NT and other non-times are <NA>
+    """
+    index = values.index if isinstance(values, pd.Series) else None
+    text = pd.Series(values, index=index, dtype='string').str.strip()
+
+    parts = text.str.extract(_TIME_PATTERN)
+    minutes = pd.to_numeric(parts['minutes']).fillna(0)
+    seconds = pd.to_numeric(parts['seconds'])
+    # "21.3" means 21.30
+    fraction = pd.to_numeric(parts['fraction'].str.pad(2, side='right', fillchar='0'))
+
+    centis = minutes * 6000 + seconds * 100 + fraction
+    negative = parts['sign'].eq('-').fillna(False).astype(bool)
+    centis = centis.mask(negative, -centis)
+    return centis.astype('Int32')
+
+
+def time_columns(df):
+    """Every time column present in a scraper output DataFrame (including split_<n>_time/cumulative)."""
+    columns = []
+    for column in df.columns:
+        if column in SWIMCLOUD_TIME_COLUMNS or column in HYTEK_TIME_COLUMNS:
+            columns.append(column)
+        elif column.startswith('split_') and (column.endswith('_time') or column.endswith('_cumulative')):
+            columns.append(column)
+    return columns
+
+
+def add_centisecond_columns(df, columns=None):
+    """
+    Add a numeric <column>_cs companion for each time column, keeping the original strings.
+
+    Args:
+        df: Scraper output DataFrame (modified in place and returned)
+        columns: Time columns to convert (default: time_columns(df))
+
+    Returns:
+        The same DataFrame
+    """
+    if df.empty:
+        return df
+    if columns is None:
+        columns = time_columns(df)
+
+    converted = {f'{column}_cs': to_centiseconds(df[column]) for column in columns}
+    for column, values in converted.items():
+        df[column] = values
+    return df
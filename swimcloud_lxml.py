@@ -0,0 +1,130 @@
+# lxml parsing backend for SwimCloud pages
+#
+# SwimCloudScraper's BeautifulSoup parsers build a full html.parser tree of every page,
+# then scan every <a> (or every div[id^=time]) through regex filters and call
+# find_parent('tr') per result. These functions parse the page once with lxml (C) and
+# pull what is needed through precompiled XPath expressions: meet links, event links,
+# and one ResultRow per result with its swimmer/team ids.
+#
+# The output matches the BeautifulSoup parsers exactly (bench_parsers.py checks it on
+# the fixtures): text is read the way get_text(strip=True) reads it, class matching is
+# per class token like BeautifulSoup's class_=, and links are taken in document order.
+
+import re
+from collections import namedtuple
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+# One event result; swimmer/team are None when the row has no such link
+ResultRow = namedtuple('ResultRow', ['swimmer', 'team', 'time', 'time_url', 'swimmer_id', 'team_id'])
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_TOOLBAR_TITLE = etree.XPath(f"//h1[{_has_class('c-toolbar__title')}]")
+_MEET_NAME = etree.XPath("//h1[@id='meet-name']")
+_RESULTS_LINKS = etree.XPath("//a[contains(@href, '/results/')]")
+_EVENT_LINK_BODY = etree.XPath(f".//div[{_has_class('c-events__link-body')}]")
+_TIME_DIVS = etree.XPath("//div[starts-with(@id, 'time')]")
+_TIME_LINKS = etree.XPath(".//a[starts-with(@href, '/times/')]")
+_ROW = etree.XPath("ancestor::tr[1]")
+_ROW_LINKS = etree.XPath(".//a[@href]")
+_TEXT = etree.XPath(".//text()")
+
+_TIME_ID_RE = re.compile(r'^time\d+')
+_TIME_HREF_RE = re.compile(r'^/times/\d+')
+_MEET_HREF_RE = re.compile(r'(/results/\d+)/?')
+_SWIMMER_HREF_RE = re.compile(r'/swimmer/(\d+)')
+_TEAM_HREF_RE = re.compile(r'/team/(\d+)')
+
+
+def parse(html):
+    """Parse a page (bytes or str) into an lxml document."""
+    if isinstance(html, bytes):
+        # SwimCloud serves UTF-8; lxml would fall back to Latin-1 without a <meta charset>
+        try:
+            html = html.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+    return lxml.html.fromstring(html)
+
+
+def text(element):
+    """Element text the way BeautifulSoup's get_text(strip=True) gives it."""
+    return ''.join(piece.strip() for piece in _TEXT(element))
+
+
+def team_name(doc):
+    """Team name from a team results page, or None."""
+    titles = _TOOLBAR_TITLE(doc)
+    return text(titles[0]) if titles else None
+
+
+def meet_name(doc):
+    """Meet name from a meet results page, or None."""
+    titles = _MEET_NAME(doc) or _TOOLBAR_TITLE(doc)
+    return text(titles[0]) if titles else None
+
+
+def meet_links(doc, base_url):
+    """Meet result URLs linked from a team results page, in page order, deduplicated."""
+    meet_urls = {}
+    for link in _RESULTS_LINKS(doc):
+        match = _MEET_HREF_RE.search(link.get('href'))
+        if match:
+            meet_urls.setdefault(urljoin(base_url, match.group(1) + '/'))
+    return list(meet_urls)
+
+
+def event_links(doc, meet_id, base_url):
+    """(event_url, event_number, event_name) for every event link of a meet page, deduplicated."""
+    href_re = re.compile(rf'^/results/{meet_id}/event/(\d+)/?$')
+    links = {}
+    for link in _RESULTS_LINKS(doc):
+        match = href_re.match(link.get('href'))
+        if not match:
+            continue
+        event_number = match.group(1)
+        event_name = "Unknown Event"
+        bodies = _EVENT_LINK_BODY(link)
+        if bodies:
+            event_name = bodies[0].get('title') or text(bodies[0])
+        event_url = urljoin(base_url, f'/results/{meet_id}/event/{event_number}/')
+        links.setdefault((event_url, event_number, event_name))
+    return list(links)
+
+
+def result_rows(doc, base_url):
+    """One ResultRow per result (div#time<id> with a /times/ link) of an event page, in page order."""
+    rows = []
+    for time_div in _TIME_DIVS(doc):
+        if not _TIME_ID_RE.match(time_div.get('id')):
+            continue
+        time_links = [link for link in _TIME_LINKS(time_div) if _TIME_HREF_RE.match(link.get('href'))]
+        if not time_links:
+            continue
+        time_link = time_links[0]
+
+        swimmer = team = swimmer_id = team_id = None
+        row = _ROW(time_div)
+        if row:
+            for link in _ROW_LINKS(row[0]):
+                href = link.get('href')
+                if swimmer is None:
+                    match = _SWIMMER_HREF_RE.search(href)
+                    if match:
+                        swimmer, swimmer_id = re.sub(r'\s+', ' ', text(link)), match.group(1)
+                if team is None:
+                    match = _TEAM_HREF_RE.search(href)
+                    if match:
+                        team, team_id = text(link), match.group(1)
+                if swimmer is not None and team is not None:
+                    break
+
+        rows.append(ResultRow(swimmer, team, text(time_link), urljoin(base_url, time_link.get('href')),
+                              swimmer_id, team_id))
+    return rows
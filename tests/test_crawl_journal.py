@@ -0,0 +1,142 @@
+# Resuming a SwimCloud crawl from its completion journal (no network, no browsers)
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from crawl_frontier import CrawlFrontier
+from crawl_journal import CrawlJournal, NO_RECORDS
+from scrape_records import EventRecords
+from swim_data_v11 import SwimCloudScraper
+
+MEET_URL = 'https://www.swimcloud.com/results/300001/'
+EMPTY_EVENT_URL = MEET_URL + 'event/1/'
+FULL_EVENT_URL = MEET_URL + 'event/2/'
+
+
+def full_event():
+    result = {'meet_name': 'Dual Meet', 'meet_url': MEET_URL, 'event_number': '2',
+              'event_name': 'Men 100 Free', 'is_relay': False, 'name': 'Swimmer, A',
+              'time': '44.10', 'time_url': 'https://www.swimcloud.com/times/148000001/'}
+    return EventRecords('Dual Meet', MEET_URL, '2', 'Men 100 Free', 'individual', [result], [])
+
+
+def scraper(monkeypatch):
+    cloud = SwimCloudScraper(rate_control='fixed', chrome_profile='stock')
+    monkeypatch.setattr(cloud, 'get_meet_events', lambda meet_url: (
+        'Dual Meet', [(EMPTY_EVENT_URL, '1', 'Men 50 Free'), (FULL_EVENT_URL, '2', 'Men 100 Free')]))
+
+    def not_fetched(*args):
+        raise AssertionError(f'journaled page fetched again: {args}')
+    monkeypatch.setattr(cloud, 'get_event_results', not_fetched)
+    monkeypatch.setattr(cloud, '_split_times', not_fetched)
+    return cloud
+
+
+def test_event_without_results_is_journaled_as_finished(tmp_path):
+    journal = CrawlJournal(str(tmp_path / 'journal.sqlite'))
+    journal.finish_event(MEET_URL, EMPTY_EVENT_URL, 0, None)
+
+    assert journal.event(MEET_URL, EMPTY_EVENT_URL) is NO_RECORDS
+    assert journal.event(MEET_URL, FULL_EVENT_URL) is None
+    journal.close()
+
+
+def test_resume_replays_unfinished_meet_with_empty_event(tmp_path, monkeypatch):
+    path = str(tmp_path / 'journal.sqlite')
+    journal = CrawlJournal(path)
+    journal.finish_event(MEET_URL, EMPTY_EVENT_URL, 0, None)
+    journal.finish_event(MEET_URL, FULL_EVENT_URL, 1, full_event())
+    journal.close()
+
+    journal = CrawlJournal(path, resume=True)
+    with scraper(monkeypatch) as cloud:
+        events = list(cloud._iter_meets([MEET_URL], journal=journal))
+
+    assert events == [full_event()]
+    assert journal.meet_finished(MEET_URL)
+    journal.close()
+
+
+def test_resume_replays_finished_meet_with_empty_event(tmp_path, monkeypatch):
+    journal = CrawlJournal(str(tmp_path / 'journal.sqlite'))
+    journal.finish_event(MEET_URL, EMPTY_EVENT_URL, 0, None)
+    journal.finish_event(MEET_URL, FULL_EVENT_URL, 1, full_event())
+    journal.finish_meet(MEET_URL, 'Dual Meet')
+
+    with scraper(monkeypatch) as cloud:
+        events = list(cloud._iter_meets([MEET_URL], journal=journal))
+
+    assert events == [full_event()]
+    journal.close()
+
+
+def test_failed_pages_are_not_journaled(tmp_path, monkeypatch):
+    journal = CrawlJournal(str(tmp_path / 'journal.sqlite'))
+    frontier = CrawlFrontier()
+    cloud = scraper(monkeypatch)
+    time_url = full_event().results[0]['time_url']
+
+    def event_results(event_url, event_name):
+        if event_url == EMPTY_EVENT_URL:
+            return {'event_name': event_name, 'is_relay': False, 'results': [], 'error': 'HTTP 503'}
+        return {'event_name': event_name, 'is_relay': False,
+                'results': [{'name': 'Swimmer, A', 'time': '44.10', 'time_url': time_url}]}
+
+    def split_times(url):
+        raise TimeoutError('split table never rendered')
+    monkeypatch.setattr(cloud, 'get_event_results', event_results)
+    monkeypatch.setattr(cloud, '_split_times', split_times)
+    with cloud:
+        events = list(cloud._iter_meets([MEET_URL], journal=journal, frontier=frontier))
+
+    assert [len(records.results) for records in events] == [1]
+    assert journal.event(MEET_URL, EMPTY_EVENT_URL) is None
+    assert journal.event(MEET_URL, FULL_EVENT_URL) is None
+    assert journal.splits(time_url) is None
+    assert not journal.meet_finished(MEET_URL)
+    assert {frontier.state(url) for url in (MEET_URL, EMPTY_EVENT_URL, FULL_EVENT_URL, time_url)} == {'failed'}
+    journal.close()
+
+
+def test_shared_frontier_needs_a_kept_journal(tmp_path, monkeypatch):
+    cloud = scraper(monkeypatch)
+    cloud.frontier = CrawlFrontier(str(tmp_path / 'frontier.sqlite'))
+    with cloud:
+        with pytest.raises(ValueError):
+            list(cloud._iter_meets([MEET_URL]))
+        journal = CrawlJournal(str(tmp_path / 'journal.sqlite'), resume=False)
+        with pytest.raises(ValueError):
+            list(cloud._iter_meets([MEET_URL], journal=journal))
+    cloud.frontier.close()
+    journal.close()
+
+
+def test_frontier_pages_missing_from_journal_are_left_out(tmp_path, monkeypatch):
+    journal = CrawlJournal(str(tmp_path / 'journal.sqlite'))
+    frontier = CrawlFrontier()
+    cloud = scraper(monkeypatch)
+    time_url = full_event().results[0]['time_url']
+    frontier.claim(time_url, 'time')
+    frontier.done(time_url)
+    monkeypatch.setattr(cloud, 'get_event_results', lambda event_url, event_name: {
+        'event_name': event_name, 'is_relay': False,
+        'results': [{'name': 'Swimmer, A', 'time': '44.10', 'time_url': time_url}]})
+    with cloud:
+        events = list(cloud._iter_meets([MEET_URL], journal=journal, frontier=frontier))
+
+    assert all(not records.results and not records.splits for records in events)
+    journal.close()
+
+
+def test_close_closes_every_thread_connection(tmp_path):
+    path = str(tmp_path / 'journal.sqlite')
+    journal = CrawlJournal(path)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda n: journal.finish_splits(f'https://www.swimcloud.com/times/{n}/', []), range(9)))
+    journal.close()
+
+    # The last connection to close checkpoints and removes the WAL
+    assert not os.path.exists(path + '-wal')
+    assert CrawlJournal(path).splits('https://www.swimcloud.com/times/3/') == []
@@ -0,0 +1,76 @@
+# MeetFollower keeps polling through failing pages (no network: a scripted session)
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from meet_follow import MeetFollower
+
+INDEX_URL = 'https://example.org/meet/index.htm'
+EVENT_URL = 'https://example.org/meet/event1.htm'
+
+
+class Response:
+    def __init__(self, status_code, content=b''):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {'ETag': str(hash(content))}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f'HTTP {self.status_code}')
+
+
+class Session:
+    def __init__(self, pages):
+        self.pages = pages  # url -> list of responses, one per request
+
+    def get(self, url, headers=None, timeout=None):
+        response = self.pages[url].pop(0)
+        if response.status_code == 304 or headers.get('If-None-Match') != response.headers['ETag']:
+            return response
+        return Response(304)
+
+
+def follower(pages, parse_event):
+    scraper = SimpleNamespace(
+        session=Session(pages), split_format='wide', page_cache=None,
+        metrics=SimpleNamespace(stage=lambda *args: nullcontext()),
+        _delay_request=lambda url: None,
+        _sessions_from_doc=lambda doc, frame_url, index_url: [{'full_url': EVENT_URL}],
+        _pre_text=lambda body: body.decode(),
+        _extract_meet_name=lambda page_text: 'Live Meet',
+        _parse_event=parse_event)
+    return MeetFollower(scraper, INDEX_URL)
+
+
+def test_failed_page_is_retried_on_next_poll():
+    index = Response(200, b'<html><body>index</body></html>')
+    pages = {INDEX_URL: [index, index, index],
+             EVENT_URL: [Response(503), Response(200, b'Event 1 v1'), Response(200, b'Event 1 v1')]}
+    meet = follower(pages, lambda url, meet_name, meet_url, split_rows, page_text: (
+        [{'name': 'Swimmer, A'}], 'individual', '1', 'Men 50 Free'))
+
+    assert list(meet.poll()) == []
+    assert meet.errors == 1
+    assert [records.event_number for records in meet.poll()] == ['1']
+    assert list(meet.poll()) == []
+
+
+def test_page_that_fails_to_parse_keeps_previous_state():
+    index = Response(200, b'<html><body>index</body></html>')
+    v2 = Response(200, b'Event 1 v2')
+    pages = {INDEX_URL: [index, index, index],
+             EVENT_URL: [Response(200, b'Event 1 v1'), v2, v2]}
+    parses = []
+
+    def parse_event(url, meet_name, meet_url, split_rows, page_text):
+        parses.append(page_text)
+        if len(parses) == 2:
+            raise ValueError('truncated export')
+        return [{'name': 'Swimmer, A'}], 'individual', '1', 'Men 50 Free'
+
+    meet = follower(pages, parse_event)
+    assert len(list(meet.poll())) == 1
+    assert list(meet.poll()) == []
+    assert len(list(meet.poll())) == 1
+    assert parses == ['Event 1 v1', 'Event 1 v2', 'Event 1 v2']
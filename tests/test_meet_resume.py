@@ -0,0 +1,58 @@
+# Re-running a HY-TEK meet crawl with a persisted frontier (no network, no browsers)
+
+import pytest
+
+from crawl_frontier import CrawlFrontier
+from crawl_journal import CrawlJournal
+from swim_meet_data import SwimMeetScraper
+
+INDEX_URL = 'https://example.org/meet/index.htm'
+EVENT_URLS = [f'https://example.org/meet/250301F00{n}.htm' for n in (1, 2, 3)]
+
+
+def scraper(monkeypatch, frontier, parsed):
+    meet = SwimMeetScraper(rate_control='fixed', chrome_profile='stock', frontier=frontier)
+    monkeypatch.setattr(meet, 'find_all_available_sessions', lambda index_url: [
+        {'full_url': url, 'event_name': f'Event {n}'} for n, url in enumerate(EVENT_URLS, 1)])
+    monkeypatch.setattr(meet, '_get_event_text', lambda url: 'Meet')
+    monkeypatch.setattr(meet, '_extract_meet_name', lambda page_text: 'Spring Invite')
+
+    def parse_event(url, meet_name=None, meet_url=None, split_rows=None):
+        parsed.append(url)
+        if url == EVENT_URLS[1]:
+            return [], None, None, None
+        return [{'Name': 'Swimmer, A', 'Finals_Time': '44.10'}], 'individual', url[-5], f'Event {url[-5]}'
+    monkeypatch.setattr(meet, '_parse_event', parse_event)
+    return meet
+
+
+def test_persisted_frontier_needs_a_kept_journal(tmp_path, monkeypatch):
+    frontier = CrawlFrontier(str(tmp_path / 'frontier.sqlite'))
+    meet = scraper(monkeypatch, frontier, [])
+    with pytest.raises(ValueError):
+        list(meet.iter_meet_results(INDEX_URL))
+    with pytest.raises(ValueError):
+        meet.scrape_entire_meet(INDEX_URL, str(tmp_path / 'meet.xlsx'), journal_path=str(tmp_path / 'j.sqlite'))
+    frontier.close()
+
+
+def test_rerun_replays_finished_events(tmp_path, monkeypatch):
+    frontier_path = str(tmp_path / 'frontier.sqlite')
+    journal_path = str(tmp_path / 'journal.sqlite')
+
+    parsed = []
+    frontier = CrawlFrontier(frontier_path)
+    journal = CrawlJournal(journal_path, resume=True)
+    first = list(scraper(monkeypatch, frontier, parsed).iter_meet_results(INDEX_URL, journal))
+    frontier.close()
+    journal.close()
+    assert parsed == EVENT_URLS
+
+    parsed = []
+    frontier = CrawlFrontier(frontier_path)
+    journal = CrawlJournal(journal_path, resume=True)
+    again = list(scraper(monkeypatch, frontier, parsed).iter_meet_results(INDEX_URL, journal))
+    frontier.close()
+    journal.close()
+    assert parsed == []
+    assert again == first and [records.event_number for records in again] == ['1', '3']
@@ -0,0 +1,26 @@
+# ParquetSink keeps every SwimCloud result column, ids included
+
+import pandas as pd
+import pytest
+
+from output_sinks import ParquetSink, load_parquet
+from swim_times import add_centisecond_columns
+
+pytest.importorskip('pyarrow')
+
+
+def test_swimcloud_ids_survive_parquet(tmp_path):
+    df_meet = add_centisecond_columns(pd.DataFrame([{
+        'meet_name': 'Dual Meet', 'meet_url': 'https://www.swimcloud.com/results/300001/',
+        'event_number': '2', 'event_name': 'Men 100 Free', 'is_relay': False, 'name': 'Swimmer, A',
+        'time': '44.10', 'time_url': 'https://www.swimcloud.com/times/148000001/',
+        'team': 'Texas', 'swimmer_id': '1234567', 'team_id': '185',
+    }]))
+    sink = ParquetSink(str(tmp_path / 'out'))
+    sink.write_meet('Dual Meet', df_meet, pd.DataFrame())
+    sink.close()
+
+    results, splits = load_parquet(str(tmp_path / 'out'))
+    assert results[['team', 'swimmer_id', 'team_id']].values.tolist() == [['Texas', '1234567', '185']]
+    assert results['time_cs'].tolist() == [4410]
+    assert splits.empty
@@ -0,0 +1,72 @@
+# robots.txt handling in RateController's asyncio path (no network: a scripted session)
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from rate_control import RateController, RobotsDisallowed
+
+
+class SlowRobotsSession:
+    headers = {'User-Agent': 'test-agent'}
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.requests = 0
+        self.threads = set()
+
+    def get(self, url, timeout=None):
+        self.requests += 1
+        self.threads.add(threading.get_ident())
+        time.sleep(self.seconds)
+        return SimpleNamespace(status_code=200, text='User-agent: *\nDisallow: /private/\n')
+
+
+def test_robots_loads_off_the_event_loop_once():
+    session = SlowRobotsSession(0.3)
+    controller = RateController(max_rate=1000, jitter=0, session=session)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.05)
+
+    async def request(url):
+        try:
+            await controller.wait_async(url)
+            return 'allowed'
+        except RobotsDisallowed:
+            return 'disallowed'
+
+    async def main():
+        return await asyncio.gather(ticker(), *[request(f'https://example.org/private/{n}') for n in range(3)],
+                                    request('https://example.org/public/'))
+
+    _, *outcomes = asyncio.run(main())
+
+    assert session.requests == 1
+    assert threading.get_ident() not in session.threads
+    # The ticker kept running while robots.txt was loading
+    assert ticks[-1] - ticks[0] < 0.3
+    assert outcomes == ['disallowed', 'disallowed', 'disallowed', 'allowed']
+
+
+def test_threads_wait_for_robots_being_loaded():
+    controller = RateController(max_rate=1000, jitter=0, session=SlowRobotsSession(0.2))
+    outcomes = []
+
+    def request():
+        try:
+            controller.wait('https://example.org/private/page')
+            outcomes.append('allowed')
+        except RobotsDisallowed:
+            outcomes.append('disallowed')
+
+    threads = [threading.Thread(target=request) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert outcomes == ['disallowed'] * 3